@@ -0,0 +1,9 @@
+# benchmarks/__main__.py
+
+"""Ponto de entrada `python -m benchmarks`: mede as operações do gerenciador (ver `bench_operacoes`)."""
+
+import sys
+
+from .bench_operacoes import main
+
+sys.exit(main())
@@ -0,0 +1,99 @@
+# benchmarks/bench_formatos.py
+
+"""
+Compara os formatos de persistência (JSON, binário, SQLite, mapeado, fragmentado e
+segmentado).
+
+Uso (a partir da raiz do repositório):
+    python -m benchmarks.bench_formatos [--tarefas N]
+
+Para cada formato, grava N tarefas de uma vez e as carrega de volta, medindo os
+dois tempos, o tempo de persistir a conclusão de uma única tarefa e o tamanho do
+arquivo resultante. O formato fragmentado usa o número padrão de fragmentos e, a
+partir de TAMANHO_MINIMO_CARGA_PARALELA, carrega-os em paralelo.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from gerenciador_tarefas import eventos
+from gerenciador_tarefas.armazenamento import criar_armazenamento
+from gerenciador_tarefas.tarefa import Tarefa
+
+FORMATOS = (
+    ("json", ".json"), ("binario", ".bin"), ("sqlite", ".db"), ("mapeado", ".mmap"), ("fragmentado", ".d"),
+    ("segmentado", ".json"),
+)
+
+
+def gerar_tarefas(quantidade):
+    """Gera tarefas com descrições, datas e status variados, indexadas pela chave."""
+    tarefas = {}
+    for i in range(quantidade):
+        vencimento = "2025-%02d-%02d" % (i % 12 + 1, i % 28 + 1) if i % 3 else None
+        tarefa = Tarefa(f"Tarefa de exemplo número {i}", vencimento, concluida=i % 4 == 0)
+        tarefas[tarefa.chave] = tarefa
+    return tarefas
+
+
+def tamanho_em_disco(caminho):
+    """Tamanho de um arquivo ou, para um diretório, a soma dos arquivos dentro dele."""
+    if not os.path.isdir(caminho):
+        return os.path.getsize(caminho)
+    return sum(os.path.getsize(os.path.join(caminho, nome)) for nome in os.listdir(caminho))
+
+
+def medir_formato(tipo, extensao, tarefas, diretorio):
+    """
+    Mede a gravação e a carga das tarefas em um formato.
+
+    Returns:
+        tuple: (segundos em salvar, segundos em carregar, segundos para persistir
+               uma conclusão, tamanho dos arquivos em bytes).
+    """
+    caminho = os.path.join(diretorio, f"bench_{tipo}{extensao}")
+    with eventos.usando(eventos.NotificadorSilencioso()):
+        armazenamento = criar_armazenamento(caminho, tipo, politica_fsync="nunca")
+        inicio = time.perf_counter()
+        armazenamento.salvar(tarefas)
+        tempo_salvar = time.perf_counter() - inicio
+        armazenamento.fechar()
+
+        armazenamento = criar_armazenamento(caminho, tipo, politica_fsync="nunca")
+        inicio = time.perf_counter()
+        carregadas = armazenamento.carregar()
+        tempo_carregar = time.perf_counter() - inicio
+
+        tarefa = next(iter(carregadas.values()))
+        tarefa.marcar_como_concluida()
+        inicio = time.perf_counter()
+        armazenamento.registrar([("concluir", tarefa)], carregadas)
+        tempo_concluir = time.perf_counter() - inicio
+        armazenamento.fechar()
+    assert len(carregadas) == len(tarefas)
+    # Soma os arquivos auxiliares do formato, como o heap do armazenamento mapeado.
+    tamanho = sum(
+        tamanho_em_disco(os.path.join(diretorio, nome))
+        for nome in os.listdir(diretorio) if nome.startswith(f"bench_{tipo}")
+    )
+    return tempo_salvar, tempo_carregar, tempo_concluir, tamanho
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tarefas", type=int, default=100000, help="tarefas gravadas e carregadas")
+    args = parser.parse_args()
+
+    tarefas = gerar_tarefas(args.tarefas)
+    with tempfile.TemporaryDirectory() as diretorio:
+        print(f"{'formato':<12} {'salvar (s)':>11} {'carregar (s)':>13} {'concluir (ms)':>14} {'tamanho (KiB)':>14}")
+        for tipo, extensao in FORMATOS:
+            tempo_salvar, tempo_carregar, tempo_concluir, tamanho = medir_formato(tipo, extensao, tarefas, diretorio)
+            print(f"{tipo:<12} {tempo_salvar:>11.3f} {tempo_carregar:>13.3f} "
+                  f"{tempo_concluir * 1000:>14.3f} {tamanho / 1024:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
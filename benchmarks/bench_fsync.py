@@ -0,0 +1,64 @@
+# benchmarks/bench_fsync.py
+
+"""
+Compara o custo das políticas de fsync do GerenciadorDeTarefas.
+
+Uso (a partir da raiz do repositório):
+    python -m benchmarks.bench_fsync [--tarefas N] [--operacoes M]
+
+Para cada política, cria um arquivo com N tarefas e mede M adições sucessivas,
+cada uma seguida da gravação correspondente, e o tempo de `fechar()`.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from gerenciador_tarefas import eventos
+from gerenciador_tarefas.armazenamento import POLITICAS_FSYNC
+from gerenciador_tarefas.logica import GerenciadorDeTarefas
+
+
+def medir_politica(politica, tarefas_iniciais, operacoes, diretorio):
+    """
+    Mede as gravações de um gerenciador com a política de fsync informada.
+
+    Returns:
+        tuple: (segundos nas operações, segundos em fechar()).
+    """
+    arquivo = os.path.join(diretorio, f"bench_{politica}.json")
+    with eventos.usando(eventos.NotificadorSilencioso()):
+        gerenciador = GerenciadorDeTarefas(arquivo_json=arquivo, politica_fsync="nunca")
+        with gerenciador.lote():
+            for i in range(tarefas_iniciais):
+                gerenciador.adicionar_tarefa(f"Tarefa inicial {i}")
+
+        gerenciador = GerenciadorDeTarefas(arquivo_json=arquivo, politica_fsync=politica)
+        inicio = time.perf_counter()
+        for i in range(operacoes):
+            gerenciador.adicionar_tarefa(f"Tarefa medida {i}")
+        tempo_operacoes = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        gerenciador.fechar()
+        tempo_fechar = time.perf_counter() - inicio
+    return tempo_operacoes, tempo_fechar
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tarefas", type=int, default=1000, help="tarefas no arquivo antes da medição")
+    parser.add_argument("--operacoes", type=int, default=200, help="adições medidas por política")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        print(f"{'política':<10} {'total (s)':>10} {'por op (ms)':>12} {'fechar (ms)':>12}")
+        for politica in POLITICAS_FSYNC:
+            tempo_operacoes, tempo_fechar = medir_politica(politica, args.tarefas, args.operacoes, diretorio)
+            print(f"{politica:<10} {tempo_operacoes:>10.3f} "
+                  f"{tempo_operacoes / args.operacoes * 1000:>12.3f} {tempo_fechar * 1000:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
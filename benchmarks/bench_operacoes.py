@@ -0,0 +1,235 @@
+# benchmarks/bench_operacoes.py
+
+"""
+Mede cada operação do GerenciadorDeTarefas em vários tamanhos de lista.
+
+Uso (a partir da raiz do repositório):
+    python -m benchmarks [--tamanhos N ...] [--armazenamento TIPO] [--saida ARQUIVO.json]
+                         [--comparar BASE.json [--limite RAZAO]]
+
+Para cada tamanho (padrão: 10^3, 10^4, 10^5 e 10^6 tarefas), cria um gerenciador
+com as tarefas e mede:
+
+    adicionar, encontrar, concluir, remover   tempo de uma chamada, sem a gravação
+                                              (as chamadas são feitas em um lote)
+    visualizar                                formatar a lista inteira
+    carregar                                  criar o gerenciador a partir do arquivo
+    salvar                                    gravar todas as tarefas
+
+Cada operação é repetida e o resultado é a mediana. Com --saida, os resultados
+são gravados em JSON; com --comparar, são comparados aos de uma execução anterior
+e o código de saída é 1 se alguma operação ficar mais lenta que RAZAO vezes a
+mediana de referência.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+from gerenciador_tarefas import eventos
+from gerenciador_tarefas.armazenamento import criar_armazenamento
+from gerenciador_tarefas.logica import GerenciadorDeTarefas
+
+TAMANHOS_PADRAO = (1000, 10000, 100000, 1000000)
+
+# Operações medidas uma chamada por vez e operações sobre a lista inteira.
+OPERACOES_UNITARIAS = ("adicionar", "encontrar", "concluir", "remover")
+OPERACOES_COMPLETAS = ("visualizar", "carregar", "salvar")
+
+# Extensão do arquivo de cada armazenamento (ver `criar_armazenamento`).
+EXTENSOES = {
+    "json": ".json", "binario": ".bin", "sqlite": ".db", "mapeado": ".mmap", "fragmentado": ".d" + os.sep,
+    "segmentado": ".json",
+}
+
+VERSAO_RESULTADOS = 1
+
+
+def _cronometrar(funcao, repeticoes):
+    """Executa a função várias vezes e retorna a duração de cada execução, em segundos."""
+    duracoes = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        duracoes.append(time.perf_counter() - inicio)
+    return duracoes
+
+
+def _resumo(duracoes):
+    return {"mediana_s": statistics.median(duracoes), "minimo_s": min(duracoes), "repeticoes": len(duracoes)}
+
+
+def medir_tamanho(tamanho, diretorio, tipo="json", repeticoes=200, repeticoes_completas=3, semente=0):
+    """
+    Mede todas as operações em um gerenciador com o número de tarefas informado.
+
+    Args:
+        tamanho (int): Número de tarefas.
+        diretorio (str): Onde criar o arquivo de persistência.
+        tipo (str, optional): O armazenamento (ver EXTENSOES). Defaults to "json".
+        repeticoes (int, optional): Chamadas medidas de cada operação unitária.
+                                    Defaults to 200.
+        repeticoes_completas (int, optional): Execuções medidas de cada operação sobre
+                                              a lista inteira. Defaults to 3.
+        semente (int, optional): Semente da escolha das tarefas. Defaults to 0.
+
+    Returns:
+        dict: Operação -> {"mediana_s", "minimo_s", "repeticoes"}.
+    """
+    aleatorio = random.Random(semente)
+    caminho = os.path.join(diretorio, f"bench_{tamanho}{EXTENSOES[tipo]}")
+    repeticoes = min(repeticoes, tamanho // 2)
+
+    def abrir():
+        return GerenciadorDeTarefas(armazenamento=criar_armazenamento(caminho, tipo, politica_fsync="nunca"))
+
+    resultados = {}
+    # As mensagens da biblioteca são descartadas para não entrarem nas medições.
+    with eventos.usando(eventos.NotificadorSilencioso()):
+        gerenciador = abrir()
+        with gerenciador.lote():
+            for i in range(tamanho):
+                vencimento = "2025-%02d-%02d" % (i % 12 + 1, i % 28 + 1) if i % 3 else None
+                gerenciador.adicionar_tarefa(f"Tarefa de exemplo número {i}", vencimento)
+        ids = [tarefa.id for tarefa in gerenciador.tarefas]
+        amostra = aleatorio.sample(ids, 2 * repeticoes)
+        a_concluir, a_remover = iter(amostra[:repeticoes]), iter(amostra[repeticoes:])
+        numeros = iter(range(repeticoes))
+
+        with gerenciador.lote():
+            # O lote adia a gravação: as operações unitárias medem só o trabalho em memória.
+            operacoes = {
+                "adicionar": lambda: gerenciador.adicionar_tarefa(f"Tarefa adicionada {next(numeros)}"),
+                "encontrar": lambda: gerenciador.encontrar_tarefa_por_id(aleatorio.choice(ids)),
+                "concluir": lambda: gerenciador.marcar_tarefa_como_concluida(next(a_concluir)),
+                "remover": lambda: gerenciador.remover_tarefa(next(a_remover)),
+            }
+            for operacao in OPERACOES_UNITARIAS:
+                resultados[operacao] = _resumo(_cronometrar(operacoes[operacao], repeticoes))
+
+        resultados["visualizar"] = _resumo(_cronometrar(gerenciador.visualizar_tarefas, repeticoes_completas))
+        gerenciador.fechar()
+        carregados = []
+        resultados["carregar"] = _resumo(_cronometrar(lambda: carregados.append(abrir()), repeticoes_completas))
+        for carregado in carregados[1:]:
+            carregado.fechar()
+        gerenciador = carregados[0]
+        resultados["salvar"] = _resumo(_cronometrar(gerenciador._salvar_tarefas, repeticoes_completas))
+        gerenciador.fechar()
+    return resultados
+
+
+def executar(tamanhos, tipo="json", repeticoes=200, repeticoes_completas=3, exibir=print):
+    """
+    Executa as medições de todos os tamanhos, em um diretório temporário.
+
+    Args:
+        tamanhos (iterable): Números de tarefas.
+        tipo (str, optional): O armazenamento. Defaults to "json".
+        repeticoes (int, optional): Ver `medir_tamanho`. Defaults to 200.
+        repeticoes_completas (int, optional): Ver `medir_tamanho`. Defaults to 3.
+        exibir (callable, optional): Recebe as linhas da tabela de resultados, à medida
+                                     que cada tamanho termina. Defaults to print.
+
+    Returns:
+        dict: O documento de resultados, serializável em JSON.
+    """
+    documento = {
+        "versao": VERSAO_RESULTADOS,
+        "armazenamento": tipo,
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "resultados": {},
+    }
+    exibir(f"{'tarefas':>9}  " + " ".join(f"{operacao:>12}" for operacao in OPERACOES_UNITARIAS + OPERACOES_COMPLETAS))
+    exibir(f"{'':>9}  " + " ".join(f"{'(µs)':>12}" for _ in OPERACOES_UNITARIAS)
+           + " " + " ".join(f"{'(ms)':>12}" for _ in OPERACOES_COMPLETAS))
+    with tempfile.TemporaryDirectory() as diretorio:
+        for tamanho in tamanhos:
+            resultados = medir_tamanho(tamanho, diretorio, tipo, repeticoes, repeticoes_completas)
+            documento["resultados"][str(tamanho)] = resultados
+            exibir(f"{tamanho:>9}  "
+                   + " ".join(f"{resultados[op]['mediana_s'] * 1e6:>12.1f}" for op in OPERACOES_UNITARIAS) + " "
+                   + " ".join(f"{resultados[op]['mediana_s'] * 1e3:>12.1f}" for op in OPERACOES_COMPLETAS))
+    return documento
+
+
+def comparar(atual, referencia, limite):
+    """
+    Compara dois documentos de resultados, operação por operação.
+
+    Args:
+        atual (dict): Os resultados desta execução.
+        referencia (dict): Os resultados de uma execução anterior.
+        limite (float): Razão máxima aceita entre a mediana atual e a de referência.
+
+    Returns:
+        list: Tuplas (tamanho, operação, razão) das operações que passaram do limite,
+              na ordem dos resultados atuais. Tamanhos e operações ausentes na
+              referência são ignorados.
+    """
+    regressoes = []
+    for tamanho, operacoes in atual["resultados"].items():
+        anteriores = referencia.get("resultados", {}).get(tamanho, {})
+        for operacao, medida in operacoes.items():
+            anterior = anteriores.get(operacao)
+            if not anterior or anterior["mediana_s"] <= 0:
+                continue
+            razao = medida["mediana_s"] / anterior["mediana_s"]
+            if razao > limite:
+                regressoes.append((tamanho, operacao, razao))
+    return regressoes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=list(TAMANHOS_PADRAO), metavar="N",
+                        help="números de tarefas medidos (padrão: 1000 10000 100000 1000000)")
+    parser.add_argument("--armazenamento", choices=sorted(EXTENSOES), default="json",
+                        help="formato de persistência (padrão: json)")
+    parser.add_argument("--repeticoes", type=int, default=200,
+                        help="chamadas medidas de cada operação unitária (padrão: 200)")
+    parser.add_argument("--repeticoes-completas", type=int, default=3,
+                        help="execuções medidas de visualizar, carregar e salvar (padrão: 3)")
+    parser.add_argument("--saida", metavar="ARQUIVO", help="grava os resultados em JSON")
+    parser.add_argument("--comparar", metavar="BASE", help="compara com os resultados JSON de uma execução anterior")
+    parser.add_argument("--limite", type=float, default=1.5,
+                        help="com --comparar, razão máxima aceita em relação à referência (padrão: 1.5)")
+    args = parser.parse_args(argv)
+    if min(args.tamanhos) < 2 or args.repeticoes < 1 or args.repeticoes_completas < 1:
+        parser.error("os tamanhos devem ser pelo menos 2 e as repetições, pelo menos 1")
+
+    referencia = None
+    if args.comparar:
+        try:
+            with open(args.comparar, "r", encoding="utf-8") as f:
+                referencia = json.load(f)
+        except (OSError, ValueError) as e:
+            parser.error(f"não foi possível ler {args.comparar}: {e}")
+
+    documento = executar(args.tamanhos, args.armazenamento, args.repeticoes, args.repeticoes_completas)
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as f:
+            json.dump(documento, f, indent=4, ensure_ascii=False)
+        print(f"Resultados gravados em {args.saida}.")
+
+    if referencia is None:
+        return 0
+    regressoes = comparar(documento, referencia, args.limite)
+    for tamanho, operacao, razao in regressoes:
+        print(f"Regressão: {operacao} com {tamanho} tarefas levou {razao:.2f}x o tempo de referência "
+              f"(limite: {args.limite:.2f}x).")
+    if not regressoes:
+        print(f"Nenhuma operação passou de {args.limite:.2f}x o tempo de referência.")
+    return 1 if regressoes else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
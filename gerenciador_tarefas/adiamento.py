@@ -0,0 +1,119 @@
+# gerenciador_tarefas/adiamento.py
+
+"""
+Gravação adiada (write-behind) do gerenciador de tarefas.
+
+Com a gravação adiada, uma alteração só marca o gerenciador como sujo: quem a fez
+não espera pelo disco, e uma thread própria grava tudo o que se acumulou depois
+de um período sem alterações (o silêncio) ou, se elas não pararem, depois de um
+atraso máximo contado a partir da primeira alteração pendente. Uma rajada de mil
+alterações vira uma ou poucas gravações.
+
+As alterações pendentes são gravadas também em `descarregar`, em `fechar` e ao
+fim do processo (`atexit`), para os gerenciadores que não foram fechados.
+"""
+
+import atexit
+import threading
+import time
+
+# Atraso máximo usado quando não é informado (nunca menor que o silêncio).
+ATRASO_MAXIMO_PADRAO = 5.0
+
+# Gravadores ainda não fechados, descarregados ao fim do processo. A própria
+# thread mantém cada gravador (e o gerenciador) vivo até `fechar`.
+_ativos = set()
+
+
+class GravadorAdiado:
+    """
+    Agenda as gravações de um gerenciador: `marcar` a cada alteração, `descarregar`
+    para gravar na hora e `fechar` ao terminar.
+    """
+    def __init__(self, gravar, silencio, atraso_maximo=None):
+        """
+        Args:
+            gravar (callable): Grava as alterações pendentes; chamada sem argumentos,
+                               nunca por duas threads ao mesmo tempo.
+            silencio (float): Segundos sem alterações depois dos quais a gravação é feita.
+            atraso_maximo (float, optional): Máximo de segundos entre a primeira
+                                             alteração pendente e a gravação. Se None,
+                                             usa ATRASO_MAXIMO_PADRAO. Defaults to None.
+
+        Raises:
+            ValueError: Se o silêncio for negativo ou o atraso máximo, menor que ele.
+        """
+        if atraso_maximo is None:
+            atraso_maximo = max(ATRASO_MAXIMO_PADRAO, silencio)
+        if silencio < 0 or atraso_maximo < silencio:
+            raise ValueError("O silêncio deve ser positivo e o atraso máximo, pelo menos igual a ele.")
+        self.silencio = silencio
+        self.atraso_maximo = atraso_maximo
+        self._gravar = gravar
+        # Instantes (time.monotonic) da primeira e da última alteração pendentes;
+        # None se não houver nenhuma.
+        self._primeira = None
+        self._ultima = None
+        self._encerrado = False
+        self._condicao = threading.Condition()
+        self._gravando = threading.Lock()
+        self._thread = threading.Thread(target=self._executar, name="gravacao-adiada", daemon=True)
+        self._thread.start()
+        _ativos.add(self)
+
+    @property
+    def pendente(self):
+        """bool: Se há alterações marcadas e ainda não gravadas."""
+        return self._primeira is not None
+
+    def marcar(self):
+        """Registra uma alteração, adiando a gravação até o próximo silêncio."""
+        with self._condicao:
+            self._ultima = time.monotonic()
+            if self._primeira is None:
+                self._primeira = self._ultima
+                # Com alterações pendentes, a thread já espera com prazo e recalcula
+                # o prazo ao acordar; só precisa ser avisada da primeira.
+                self._condicao.notify()
+
+    def descarregar(self):
+        """Grava as alterações pendentes na thread de quem chama e espera a gravação."""
+        with self._gravando:
+            with self._condicao:
+                self._primeira = self._ultima = None
+            self._gravar()
+
+    def fechar(self):
+        """Encerra a thread e grava o que estiver pendente. Pode ser chamado mais de uma vez."""
+        with self._condicao:
+            self._encerrado = True
+            self._condicao.notify()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+        self.descarregar()
+        _ativos.discard(self)
+
+    def _executar(self):
+        """Laço da thread de gravação. Método privado."""
+        while True:
+            with self._condicao:
+                while not self._encerrado:
+                    if self._primeira is None:
+                        self._condicao.wait()
+                        continue
+                    prazo = min(self._ultima + self.silencio, self._primeira + self.atraso_maximo)
+                    restante = prazo - time.monotonic()
+                    if restante <= 0:
+                        break
+                    self._condicao.wait(restante)
+                else:
+                    # As pendências restantes ficam para quem chamou `fechar`.
+                    return
+            self.descarregar()
+
+
+@atexit.register
+def _descarregar_ativos():
+    """Grava as alterações pendentes dos gravadores não fechados ao fim do processo."""
+    for gravador in list(_ativos):
+        gravador.fechar()
@@ -0,0 +1,1764 @@
+# gerenciador_tarefas/armazenamento.py
+
+import heapq
+import json
+import mmap
+import os
+import sqlite3
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from operator import itemgetter
+from .binario import (
+    ErroFormatoBinario, codificar_cabecalho, codificar_registro, decodificar_chave, decodificar_registro, iterar_registros,
+)
+from .eventos import AVISO, ERRO, INFORMACAO, notificar
+from .json_incremental import ErroConteudoNaoLista, iterar_array_json
+from . import fragmentos, mapeado, segmentos
+from .tarefa import Tarefa, chave_do_id, id_da_chave
+from .trava import TravaDeArquivo
+
+# Políticas de fsync aceitas pelos armazenamentos:
+#   "sempre"    - cada gravação é sincronizada com o disco antes de retornar;
+#   "ao_fechar" - as gravações são sincronizadas uma única vez, em `fechar()`;
+#   "nunca"     - a sincronização fica a cargo do sistema operacional.
+POLITICAS_FSYNC = ("sempre", "ao_fechar", "nunca")
+
+# Número mínimo de registros no diário antes de uma compactação automática.
+# Acima disso, o diário é compactado quando tem mais registros do que o último
+# instantâneo tinha tarefas, o que mantém o custo amortizado constante.
+LIMITE_MINIMO_DIARIO = 1000
+
+# Extensões de arquivo reconhecidas como banco de dados SQLite.
+EXTENSOES_SQLITE = (".db", ".sqlite", ".sqlite3")
+
+# Extensões de arquivo reconhecidas como o formato binário (ver `binario`).
+EXTENSOES_BINARIO = (".bin", ".tarefas")
+
+# Extensões de arquivo reconhecidas como o armazenamento mapeado (ver `mapeado`).
+EXTENSOES_MAPEADO = (".mmap",)
+
+# Número mínimo de lápides no armazenamento mapeado antes de uma compactação
+# automática. Acima disso, compacta quando há mais lápides do que tarefas vivas.
+LIMITE_MINIMO_LAPIDES = 1000
+
+# Registros fixos reservados no arquivo mapeado quando ele precisa crescer pela
+# primeira vez; depois disso, a capacidade dobra a cada crescimento.
+CAPACIDADE_MINIMA_MAPEADO = 64
+
+# Número de fragmentos de um diretório fragmentado novo, se não for informado.
+FRAGMENTOS_PADRAO = 8
+
+# Tamanho total dos fragmentos, em bytes, a partir do qual eles são carregados em
+# paralelo; abaixo disso, iniciar os processos custa mais do que o ganho.
+TAMANHO_MINIMO_CARGA_PARALELA = 4 * 1024 * 1024
+
+# Máximo de tarefas por segmento no armazenamento segmentado, se não for informado.
+TAREFAS_POR_SEGMENTO_PADRAO = 10000
+
+# Tamanho máximo, em bytes, de uma lista JSON decodificada de uma só vez com
+# `json.load` no carregamento preguiçoso. Acima disso, ela é lida elemento a
+# elemento (`iterar_array_json`), sem o texto inteiro em memória.
+LIMITE_LEITURA_INTEIRA = 256 * 1024 * 1024
+
+
+def _sincronizar_diretorio(diretorio):
+    """
+    Sincroniza a entrada de diretório para que uma renomeação sobreviva a uma queda.
+    Em sistemas que não permitem abrir diretórios (Windows), não faz nada.
+    """
+    try:
+        fd = os.open(diretorio, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _ler_umask():
+    """Retorna a umask do processo (só é possível lê-la trocando-a e restaurando-a)."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# Lida uma vez, na importação: trocar a umask depois afetaria arquivos criados
+# por outras threads nesse meio tempo.
+_UMASK = _ler_umask()
+
+
+def _modo_do_arquivo(caminho):
+    """
+    Permissões que um arquivo regravado deve manter: as do arquivo existente ou,
+    para um arquivo novo, as que `open` daria (0o666 sem os bits da umask).
+    """
+    try:
+        return os.stat(caminho).st_mode & 0o7777
+    except OSError:
+        return 0o666 & ~_UMASK
+
+
+def _gravar_atomicamente(caminho, escrever, sincronizar=True, binario=False, metricas=None):
+    """
+    Grava um arquivo de forma atômica: o conteúdo vai para um arquivo temporário
+    no mesmo diretório, que então substitui o destino com `os.replace`. Uma queda
+    no meio da gravação deixa o arquivo anterior intacto. O arquivo temporário
+    recebe as permissões do arquivo substituído (ou as de um arquivo novo), já que
+    `tempfile.mkstemp` o cria acessível só ao dono.
+
+    Args:
+        caminho (str): Caminho do arquivo de destino.
+        escrever (callable): Função que recebe o arquivo temporário aberto em modo texto.
+        sincronizar (bool, optional): Se True, chama fsync no arquivo antes da troca
+                                      e no diretório depois dela. Defaults to True.
+        binario (bool, optional): Se True, o arquivo temporário é aberto em modo
+                                  binário. Defaults to False.
+        metricas (Metricas, optional): Se informado, recebe o tempo de geração do
+                                       conteúdo, o de sincronização e troca, e os
+                                       bytes gravados. Defaults to None.
+
+    Raises:
+        OSError: Se a gravação ou a troca falharem. O arquivo temporário é removido.
+    """
+    diretorio = os.path.dirname(os.path.abspath(caminho))
+    fd, caminho_temporario = tempfile.mkstemp(
+        dir=diretorio, prefix=f".{os.path.basename(caminho)}.", suffix=".tmp"
+    )
+    try:
+        inicio = time.perf_counter()
+        with (os.fdopen(fd, "wb") if binario else os.fdopen(fd, "w", encoding="utf-8")) as f:
+            escrever(f)
+            f.flush()
+            if metricas is not None:
+                gerado = time.perf_counter()
+                metricas.observar("gravacao.serializacao_s", gerado - inicio)
+                metricas.incrementar("gravacao.bytes", os.fstat(f.fileno()).st_size)
+            if sincronizar:
+                os.fsync(f.fileno())
+        os.chmod(caminho_temporario, _modo_do_arquivo(caminho))
+        os.replace(caminho_temporario, caminho)
+    except BaseException:
+        try:
+            os.remove(caminho_temporario)
+        except OSError:
+            pass
+        raise
+    if sincronizar:
+        _sincronizar_diretorio(diretorio)
+    if metricas is not None:
+        metricas.observar("gravacao.sincronizacao_s", time.perf_counter() - gerado)
+
+
+def _sincronizar_arquivo(caminho):
+    """Chama fsync em um arquivo existente. Arquivos inexistentes são ignorados."""
+    try:
+        with open(caminho, "rb") as f:
+            os.fsync(f.fileno())
+    except FileNotFoundError:
+        pass
+
+
+def _como_dict(valor):
+    """Retorna o dicionário de uma Tarefa, ou o próprio registro se ainda não materializado."""
+    return valor if type(valor) is dict else valor.to_dict()
+
+
+def _elementos_da_lista(f, preguicoso):
+    """
+    Retorna um iterável com os elementos da lista JSON de um arquivo.
+
+    No carregamento preguiçoso, os registros decodificados ficam guardados de
+    qualquer forma, então um arquivo de até LIMITE_LEITURA_INTEIRA bytes é
+    decodificado de uma vez com `json.load`, várias vezes mais rápido que a leitura
+    incremental. Nos demais casos, os elementos são lidos um a um, e cada um vira
+    Tarefa antes do próximo ser decodificado.
+    """
+    if preguicoso and os.fstat(f.fileno()).st_size <= LIMITE_LEITURA_INTEIRA:
+        dados = json.load(f)
+        if type(dados) is not list:
+            raise ErroConteudoNaoLista("O valor de nível superior não é uma lista.")
+        return dados
+    return iterar_array_json(f)
+
+
+def _registro_adiavel(dados):
+    """
+    Indica se um registro pode ficar sem conversão no carregamento preguiçoso: um
+    dicionário com ID e com uma descrição válida, o único campo que `Tarefa.from_dict`
+    recusa. Os demais registros são convertidos na hora, e os inválidos, descartados
+    já na carga, de modo que o número de tarefas não muda quando elas são acessadas.
+    """
+    if type(dados) is not dict or not dados.get("id"):
+        return False
+    descricao = dados.get("descricao")
+    return isinstance(descricao, str) and bool(descricao.strip())
+
+
+def _ler_lista_de_tarefas(armazenamento, f, origem, tarefas, preguicoso, membros=None):
+    """
+    Lê uma lista JSON de tarefas (ver `_elementos_da_lista`). Fora do carregamento
+    preguiçoso, a leitura é incremental: cada elemento é decodificado e convertido
+    em Tarefa antes do próximo ser lido. Registros inválidos ou com ID repetido são
+    informados e ignorados.
+
+    Args:
+        armazenamento (Armazenamento): Quem lê, para as métricas.
+        f: O arquivo, aberto em modo texto.
+        origem (str): O caminho do arquivo, usado nas mensagens.
+        tarefas (dict): Recebe as tarefas lidas (ou os registros, se `preguicoso`).
+        preguicoso (bool): Se True, registros válidos com ID são guardados sem conversão
+                           (ver `_registro_adiavel`).
+        membros (dict, optional): Se informado, recebe a chave de cada tarefa lida
+                                  (com valor None), na ordem. Defaults to None.
+
+    Returns:
+        int: O número de registros lidos, válidos ou não.
+
+    Raises:
+        ErroConteudoNaoLista: Se o conteúdo não for uma lista JSON.
+        json.JSONDecodeError, UnicodeDecodeError: Se o conteúdo for inválido.
+        IOError: Em erros de leitura.
+    """
+    total_registros = 0
+    for data in _elementos_da_lista(f, preguicoso):
+        total_registros += 1
+        try:
+            if preguicoso and _registro_adiavel(data):
+                # Guarda o registro; a Tarefa é criada no primeiro acesso.
+                chave, valor = chave_do_id(data["id"]), data
+            else:
+                valor = Tarefa.from_dict(data)
+                chave = valor.chave
+            if chave in tarefas:
+                raise ValueError(f"ID duplicado '{data['id']}'")
+            tarefas[chave] = valor
+            if membros is not None:
+                membros[chave] = None
+        except (ValueError, TypeError) as ve:
+            notificar(
+                ERRO, "carga.registro_invalido",
+                f"Erro nos dados ao carregar uma tarefa do arquivo {origem}: {ve}. Tarefa ignorada.",
+                caminho=origem,
+            )
+            armazenamento._contar("carga.registros_ignorados")
+    return total_registros
+
+
+def _validar_politica_fsync(politica_fsync):
+    if politica_fsync not in POLITICAS_FSYNC:
+        raise ValueError(f"Política de fsync inválida: '{politica_fsync}'. Use uma de {POLITICAS_FSYNC}.")
+
+
+class Armazenamento:
+    """
+    Interface dos meios de persistência usados pelo GerenciadorDeTarefas.
+
+    As tarefas são trocadas com o gerenciador como um dicionário ordenado
+    chave do id -> Tarefa (ver `chave_do_id`). No carregamento preguiçoso, os
+    valores podem ser os registros lidos, ainda não convertidos: dicionários ou,
+    no ArmazenamentoMapeado, objetos `mapeado.RegistroMapeado`.
+
+    O gerenciador preenche `metricas` quando a coleta de métricas está ativa (ver
+    o módulo `metricas`).
+
+    `registra_alteradas` indica se `registrar` grava também as tarefas de
+    `alteradas`; se False, o gerenciador as guarda para `salvar_alteradas`.
+    """
+    caminho = None
+    metricas = None
+    registra_alteradas = False
+
+    def carregar(self, preguicoso=False):
+        """
+        Lê todas as tarefas persistidas.
+
+        Args:
+            preguicoso (bool, optional): Se True, registros com ID podem ser devolvidos
+                                         sem conversão para Tarefa. Defaults to False.
+
+        Returns:
+            dict: Chave do id -> Tarefa (ou registro), na ordem persistida.
+        """
+        raise NotImplementedError
+
+    def salvar(self, tarefas):
+        """
+        Grava o conjunto completo de tarefas, substituindo o anterior.
+
+        Args:
+            tarefas (dict): Chave do id -> Tarefa (ou registro).
+        """
+        raise NotImplementedError
+
+    def salvar_alteradas(self, tarefas, alteradas):
+        """
+        Grava o conjunto completo de tarefas sabendo quais mudaram desde a última
+        gravação. Por padrão, equivale a `salvar`; armazenamentos segmentados
+        regravam só os trechos com tarefas alteradas.
+
+        Args:
+            tarefas (dict): Chave do id -> Tarefa (ou registro).
+            alteradas (set): Chaves das tarefas adicionadas, alteradas ou removidas.
+        """
+        self.salvar(tarefas)
+
+    def registrar(self, alteracoes, tarefas, alteradas=None):
+        """
+        Persiste um conjunto de alterações. Por padrão, grava tudo com `salvar`;
+        armazenamentos incrementais gravam apenas o que mudou.
+
+        Args:
+            alteracoes (list): Pares (operacao, tarefa) na ordem em que ocorreram, com
+                               operacao em "adicionar", "concluir", "remover" ou "limpar".
+            tarefas (dict): O estado completo após as alterações.
+            alteradas (set, optional): Chaves das tarefas alteradas por atribuição
+                                       direta, que não aparecem em `alteracoes`. Só
+                                       são gravadas se `registra_alteradas`.
+                                       Defaults to None.
+        """
+        self.salvar(tarefas)
+
+    @contextmanager
+    def bloquear(self):
+        """
+        Garante acesso exclusivo ao meio de persistência durante o bloco `with`, entre
+        processos. Por padrão, não faz nada.
+        """
+        yield self
+
+    def desatualizado(self):
+        """
+        Indica se outro processo gravou desde o último carregamento ou gravação desta
+        instância. Deve ser consultado dentro de `bloquear`. Por padrão, False.
+
+        Returns:
+            bool: True se as tarefas em memória precisarem ser recarregadas.
+        """
+        return False
+
+    def fechar(self):
+        """Libera os recursos e conclui as gravações pendentes."""
+
+    def _contar(self, nome, quantidade=1):
+        """Soma ao contador `nome`, se a coleta de métricas estiver ativa. Método privado."""
+        if self.metricas is not None:
+            self.metricas.incrementar(nome, quantidade)
+
+
+class ArmazenamentoEmArquivo(Armazenamento):
+    """
+    Base dos armazenamentos que regravam ou alteram arquivos próprios. Processos que
+    usam o mesmo arquivo são coordenados por uma trava consultiva e um contador de
+    geração (ver `TravaDeArquivo`): carregar, salvar e registrar são feitos com a
+    trava, e cada gravação avança a geração.
+
+    As subclasses implementam `_carregar`, `_salvar` e, se gravarem alterações de
+    forma incremental, `_registrar`.
+    """
+    def __init__(self, caminho):
+        self.caminho = caminho
+        self._trava = TravaDeArquivo(f"{caminho}.trava")
+
+    def carregar(self, preguicoso=False):
+        with self._trava.exclusiva():
+            self._trava.sincronizar()
+            return self._carregar(preguicoso)
+
+    def salvar(self, tarefas):
+        with self._trava.exclusiva():
+            self._salvar(tarefas)
+            self._trava.avancar()
+
+    def registrar(self, alteracoes, tarefas, alteradas=None):
+        with self._trava.exclusiva():
+            self._registrar(alteracoes, tarefas)
+            self._trava.avancar()
+
+    def bloquear(self):
+        return self._trava.exclusiva()
+
+    def desatualizado(self):
+        return self._trava.desatualizada()
+
+    def _carregar(self, preguicoso):
+        raise NotImplementedError
+
+    def _salvar(self, tarefas):
+        raise NotImplementedError
+
+    def _registrar(self, alteracoes, tarefas):
+        self.salvar(tarefas)
+
+
+class ArmazenamentoJSON(ArmazenamentoEmArquivo):
+    """
+    Persiste as tarefas em um arquivo JSON (uma lista de objetos), opcionalmente
+    acompanhado de um diário de alterações anexadas.
+    """
+    def __init__(self, caminho="tarefas.json", usar_diario=False, politica_fsync="sempre"):
+        """
+        Args:
+            caminho (str, optional): Nome do arquivo JSON. Defaults to "tarefas.json".
+            usar_diario (bool, optional): Se True, cada alteração é anexada como um
+                                          registro compacto ao arquivo de diário
+                                          (`<caminho>.diario`) em vez de reescrever
+                                          o arquivo JSON inteiro. Defaults to False.
+            politica_fsync (str, optional): Quando sincronizar as gravações com o disco:
+                                            "sempre", "ao_fechar" ou "nunca".
+                                            Defaults to "sempre".
+
+        Raises:
+            ValueError: Se a política de fsync não for reconhecida.
+        """
+        _validar_politica_fsync(politica_fsync)
+        super().__init__(caminho)
+        self.usar_diario = usar_diario
+        self.arquivo_diario = f"{caminho}.diario"
+        self.politica_fsync = politica_fsync
+        # Indica que houve gravações ainda não sincronizadas (política "ao_fechar").
+        self._sincronizacao_pendente = False
+        self._registros_no_diario = 0
+        self._tamanho_instantaneo = 0
+
+    def _carregar(self, preguicoso):
+        """
+        Carrega as tarefas do arquivo JSON e, no modo diário, reaplica as alterações
+        registradas no diário.
+        """
+        tarefas = self._carregar_instantaneo(preguicoso)
+        self._tamanho_instantaneo = len(tarefas)
+        if self.usar_diario:
+            self._reproduzir_diario(tarefas)
+        return tarefas
+
+    def _salvar(self, tarefas):
+        """
+        Salva a lista de tarefas no arquivo JSON.
+        A gravação é atômica (arquivo temporário + `os.replace`), então uma queda no
+        meio dela nunca deixa o arquivo vazio ou pela metade.
+        No modo diário, o arquivo salvo é o novo instantâneo e o diário é esvaziado.
+        """
+        def escrever(f):
+            # Registros ainda não materializados são gravados como foram lidos.
+            json.dump([_como_dict(valor) for valor in tarefas.values()], f, indent=4, ensure_ascii=False)
+
+        try:
+            _gravar_atomicamente(
+                self.caminho, escrever, sincronizar=self.politica_fsync == "sempre", metricas=self.metricas
+            )
+            self._sincronizacao_pendente = self.politica_fsync == "ao_fechar"
+            if self.usar_diario:
+                open(self.arquivo_diario, "w", encoding="utf-8").close()
+                self._registros_no_diario = 0
+                self._tamanho_instantaneo = len(tarefas)
+        except IOError as e:
+            notificar(ERRO, "gravacao.erro", f"Erro de E/S ao salvar tarefas em {self.caminho}: {e}", caminho=self.caminho)
+
+    def _registrar(self, alteracoes, tarefas):
+        """
+        Sem diário, reescreve o arquivo JSON inteiro uma única vez; com diário, anexa
+        um registro por alteração.
+        """
+        if not self.usar_diario or any(operacao == "limpar" for operacao, _ in alteracoes):
+            self.salvar(tarefas)
+            return
+
+        registros = []
+        for operacao, tarefa in alteracoes:
+            if operacao == "adicionar":
+                registros.append({"op": operacao, "tarefa": tarefa.to_dict()})
+            else:
+                registros.append({"op": operacao, "id": tarefa.id})
+        self._anexar_ao_diario(registros, tarefas)
+
+    def fechar(self):
+        """
+        Com a política de fsync "ao_fechar", sincroniza com o disco as gravações
+        feitas desde a última sincronização.
+        """
+        if not self._sincronizacao_pendente:
+            return
+        try:
+            _sincronizar_arquivo(self.caminho)
+            if self.usar_diario:
+                _sincronizar_arquivo(self.arquivo_diario)
+            _sincronizar_diretorio(os.path.dirname(os.path.abspath(self.caminho)))
+            self._sincronizacao_pendente = False
+        except IOError as e:
+            notificar(ERRO, "gravacao.erro", f"Erro de E/S ao sincronizar {self.caminho}: {e}", caminho=self.caminho)
+
+    def _anexar_ao_diario(self, registros, tarefas):
+        """
+        Anexa registros ao arquivo de diário, um objeto JSON compacto por linha.
+        Compacta o diário quando ele fica maior que o último instantâneo.
+        Método privado.
+
+        Args:
+            registros (list): Registros de alteração a serem anexados.
+            tarefas (dict): O estado completo, gravado se o diário for compactado.
+        """
+        try:
+            linhas = "".join(
+                json.dumps(registro, ensure_ascii=False, separators=(",", ":")) + "\n" for registro in registros
+            )
+            with open(self.arquivo_diario, "a", encoding="utf-8") as f:
+                f.write(linhas)
+                if self.politica_fsync == "sempre":
+                    f.flush()
+                    os.fsync(f.fileno())
+            self._sincronizacao_pendente = self.politica_fsync == "ao_fechar"
+        except IOError as e:
+            notificar(ERRO, "gravacao.erro", f"Erro de E/S ao salvar tarefas em {self.arquivo_diario}: {e}",
+                      caminho=self.arquivo_diario)
+            return
+        if self.metricas is not None:
+            self.metricas.incrementar("gravacao.bytes", len(linhas.encode("utf-8")))
+
+        self._registros_no_diario += len(registros)
+        if self._registros_no_diario > max(LIMITE_MINIMO_DIARIO, self._tamanho_instantaneo):
+            self.salvar(tarefas)
+
+    def _reproduzir_diario(self, tarefas):
+        """
+        Reaplica sobre as tarefas carregadas os registros do arquivo de diário.
+
+        A reprodução é idempotente: uma tarefa já presente não é adicionada de novo e
+        remoções de IDs inexistentes são ignoradas, de modo que um diário não esvaziado
+        após uma compactação interrompida pode ser reproduzido com segurança. Uma linha
+        inválida (por exemplo, a última linha truncada por uma queda) encerra a reprodução.
+        Método privado.
+        """
+        self._registros_no_diario = 0
+        try:
+            with open(self.arquivo_diario, "r", encoding="utf-8") as f:
+                for numero_linha, linha in enumerate(f, start=1):
+                    if not linha.strip():
+                        continue
+                    try:
+                        registro = json.loads(linha)
+                        operacao = registro["op"]
+                        if operacao == "adicionar":
+                            tarefa = Tarefa.from_dict(registro["tarefa"])
+                            tarefas.setdefault(tarefa.chave, tarefa)
+                        elif operacao == "concluir":
+                            tarefa = tarefas.get(chave_do_id(registro["id"]))
+                            if type(tarefa) is dict:
+                                tarefa["concluida"] = True
+                            elif tarefa:
+                                tarefa.marcar_como_concluida()
+                        elif operacao == "remover":
+                            tarefas.pop(chave_do_id(registro["id"]), None)
+                        else:
+                            raise ValueError(f"operação desconhecida '{operacao}'")
+                    except (ValueError, KeyError, TypeError) as e:
+                        notificar(
+                            ERRO, "carga.registro_invalido",
+                            f"Erro no diário {self.arquivo_diario}, linha {numero_linha}: {e}. Registros seguintes ignorados.",
+                            caminho=self.arquivo_diario,
+                        )
+                        break
+                    self._registros_no_diario += 1
+        except FileNotFoundError:
+            pass
+        except (IOError, UnicodeDecodeError) as e:
+            notificar(ERRO, "carga.erro", f"Erro de E/S ao tentar ler o arquivo {self.arquivo_diario}: {e}.",
+                      caminho=self.arquivo_diario)
+
+    def _carregar_instantaneo(self, preguicoso):
+        """
+        Carrega a lista de tarefas do arquivo JSON.
+        O arquivo é lido de forma incremental: cada elemento da lista é decodificado
+        e convertido em Tarefa antes do próximo ser lido, então o pico de memória fica
+        próximo do tamanho final das tarefas carregadas.
+        Método privado.
+        """
+        try:
+            with open(self.caminho, "r", encoding="utf-8") as f:
+                tarefas = {}
+                total_registros = _ler_lista_de_tarefas(self, f, self.caminho, tarefas, preguicoso)
+
+            if tarefas or total_registros == 0: # Se carregou tarefas ou o arquivo era uma lista vazia
+                 notificar(INFORMACAO, "carga.concluida", f"Tarefas carregadas de {self.caminho}", caminho=self.caminho)
+            return tarefas
+
+        except FileNotFoundError:
+            notificar(
+                AVISO, "carga.arquivo_ausente",
+                f"Arquivo {self.caminho} não encontrado. Iniciando com lista de tarefas vazia.",
+                caminho=self.caminho,
+            )
+        except ErroConteudoNaoLista:
+            notificar(
+                ERRO, "carga.erro",
+                f"Erro: O conteúdo do arquivo {self.caminho} não é uma lista JSON válida. Iniciando com lista vazia.",
+                caminho=self.caminho,
+            )
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            notificar(
+                ERRO, "carga.erro",
+                f"Erro ao decodificar JSON do arquivo {self.caminho}: {e}. Iniciando com lista vazia.",
+                caminho=self.caminho,
+            )
+        except IOError as e:
+            notificar(
+                ERRO, "carga.erro",
+                f"Erro de E/S ao tentar ler o arquivo {self.caminho}: {e}. Iniciando com lista vazia.",
+                caminho=self.caminho,
+            )
+        return {}
+
+
+class ArmazenamentoSQLite(Armazenamento):
+    """
+    Persiste as tarefas em um banco de dados SQLite, com índices por ID, status e
+    data de vencimento. Cada alteração vira um comando de uma única linha, e um lote
+    de alterações é gravado em uma única transação.
+
+    As consultas filtradas do gerenciador não vêm do banco: são respondidas pelos
+    índices em memória, que já incluem as alterações ainda não gravadas.
+    """
+    # Nível de PRAGMA synchronous usado para cada política de fsync.
+    _SINCRONIZACAO = {"sempre": "FULL", "ao_fechar": "NORMAL", "nunca": "OFF"}
+
+    def __init__(self, caminho="tarefas.db", politica_fsync="sempre"):
+        """
+        Args:
+            caminho (str, optional): Nome do arquivo do banco. Defaults to "tarefas.db".
+            politica_fsync (str, optional): "sempre" (synchronous=FULL), "ao_fechar"
+                                            (NORMAL) ou "nunca" (OFF). Defaults to "sempre".
+
+        Raises:
+            ValueError: Se a política de fsync não for reconhecida.
+        """
+        _validar_politica_fsync(politica_fsync)
+        self.caminho = caminho
+        self.politica_fsync = politica_fsync
+        self._conexao = None
+
+    def _conectar(self):
+        """Abre a conexão e cria o esquema, se necessário. Método privado."""
+        if self._conexao is None:
+            # A conexão pode ser usada pela thread de gravação em segundo plano do
+            # gerenciador; o módulo sqlite3 serializa o acesso a ela.
+            conexao = sqlite3.connect(self.caminho, check_same_thread=False)
+            conexao.execute(f"PRAGMA synchronous = {self._SINCRONIZACAO[self.politica_fsync]}")
+            with conexao:
+                conexao.executescript("""
+                    CREATE TABLE IF NOT EXISTS tarefas (
+                        posicao INTEGER PRIMARY KEY AUTOINCREMENT,
+                        id TEXT NOT NULL UNIQUE,
+                        descricao TEXT NOT NULL,
+                        data_vencimento TEXT,
+                        concluida INTEGER NOT NULL DEFAULT 0
+                    );
+                    CREATE INDEX IF NOT EXISTS idx_tarefas_concluida ON tarefas (concluida);
+                    CREATE INDEX IF NOT EXISTS idx_tarefas_vencimento ON tarefas (data_vencimento);
+                """)
+            self._conexao = conexao
+        return self._conexao
+
+    @staticmethod
+    def _linha(valor):
+        """Converte uma Tarefa (ou registro) nos parâmetros de INSERT. Método privado."""
+        dados = _como_dict(valor)
+        return (dados.get("id"), dados.get("descricao"), dados.get("data_vencimento"), bool(dados.get("concluida", False)))
+
+    def carregar(self, preguicoso=False):
+        """Carrega as tarefas do banco, na ordem em que foram inseridas."""
+        tarefas = {}
+        try:
+            cursor = self._conectar().execute(
+                "SELECT id, descricao, data_vencimento, concluida FROM tarefas ORDER BY posicao"
+            )
+            for id_tarefa, descricao, data_vencimento, concluida in cursor:
+                registro = {"id": id_tarefa, "descricao": descricao,
+                            "data_vencimento": data_vencimento, "concluida": bool(concluida)}
+                if preguicoso and _registro_adiavel(registro):
+                    tarefas[chave_do_id(id_tarefa)] = registro
+                    continue
+                try:
+                    tarefa = Tarefa.from_dict(registro)
+                except ValueError as ve:
+                    notificar(
+                        ERRO, "carga.registro_invalido",
+                        f"Erro nos dados ao carregar uma tarefa do arquivo {self.caminho}: {ve}. Tarefa ignorada.",
+                        caminho=self.caminho,
+                    )
+                    self._contar("carga.registros_ignorados")
+                    continue
+                tarefas[tarefa.chave] = tarefa
+        except sqlite3.Error as e:
+            notificar(ERRO, "carga.erro", f"Erro ao ler o banco de dados {self.caminho}: {e}. Iniciando com lista vazia.",
+                      caminho=self.caminho)
+            return {}
+        notificar(INFORMACAO, "carga.concluida", f"Tarefas carregadas de {self.caminho}", caminho=self.caminho)
+        return tarefas
+
+    def salvar(self, tarefas):
+        """Substitui todo o conteúdo da tabela em uma única transação."""
+        try:
+            conexao = self._conectar()
+            with conexao:
+                conexao.execute("DELETE FROM tarefas")
+                conexao.executemany(
+                    "INSERT INTO tarefas (id, descricao, data_vencimento, concluida) VALUES (?, ?, ?, ?)",
+                    (self._linha(valor) for valor in tarefas.values()),
+                )
+        except sqlite3.Error as e:
+            notificar(ERRO, "gravacao.erro", f"Erro ao salvar tarefas no banco de dados {self.caminho}: {e}",
+                      caminho=self.caminho)
+
+    def registrar(self, alteracoes, tarefas, alteradas=None):
+        """Aplica cada alteração como um comando de uma linha, todas em uma transação."""
+        try:
+            conexao = self._conectar()
+            with conexao:
+                for operacao, tarefa in alteracoes:
+                    if operacao == "adicionar":
+                        conexao.execute(
+                            "INSERT INTO tarefas (id, descricao, data_vencimento, concluida) VALUES (?, ?, ?, ?)",
+                            self._linha(tarefa),
+                        )
+                    elif operacao == "concluir":
+                        conexao.execute("UPDATE tarefas SET concluida = ? WHERE id = ?", (tarefa.concluida, tarefa.id))
+                    elif operacao == "remover":
+                        conexao.execute("DELETE FROM tarefas WHERE id = ?", (tarefa.id,))
+                    elif operacao == "limpar":
+                        conexao.execute("DELETE FROM tarefas")
+        except sqlite3.Error as e:
+            notificar(ERRO, "gravacao.erro", f"Erro ao salvar tarefas no banco de dados {self.caminho}: {e}",
+                      caminho=self.caminho)
+
+    def fechar(self):
+        """Fecha a conexão com o banco."""
+        if self._conexao is not None:
+            self._conexao.close()
+            self._conexao = None
+
+
+class ArmazenamentoBinario(ArmazenamentoEmArquivo):
+    """
+    Persiste as tarefas no formato binário compacto do módulo `binario`: registros
+    com prefixo de tamanho, IDs em 16 bytes, status em um campo de bits e datas como
+    ordinais de dia. O arquivo é regravado inteiro, de forma atômica, a cada salvamento.
+    """
+    def __init__(self, caminho="tarefas.bin", politica_fsync="sempre"):
+        """
+        Args:
+            caminho (str, optional): Nome do arquivo. Defaults to "tarefas.bin".
+            politica_fsync (str, optional): "sempre", "ao_fechar" ou "nunca".
+                                            Defaults to "sempre".
+
+        Raises:
+            ValueError: Se a política de fsync não for reconhecida.
+        """
+        _validar_politica_fsync(politica_fsync)
+        super().__init__(caminho)
+        self.politica_fsync = politica_fsync
+        self._sincronizacao_pendente = False
+
+    def _carregar(self, preguicoso):
+        """
+        Carrega as tarefas do arquivo binário. Como decodificar um registro já não
+        envolve texto a analisar, as tarefas são sempre criadas na hora, mesmo no
+        carregamento preguiçoso.
+        """
+        try:
+            with open(self.caminho, "rb") as f:
+                dados = f.read()
+            tarefas = {}
+            for chave, descricao, ordinal, data_vencimento, concluida in iterar_registros(dados):
+                try:
+                    if chave in tarefas:
+                        raise ValueError(f"ID duplicado '{id_da_chave(chave)}'")
+                    tarefas[chave] = Tarefa._de_forma_compacta(chave, descricao, ordinal, data_vencimento, concluida)
+                except ValueError as ve:
+                    notificar(
+                        ERRO, "carga.registro_invalido",
+                        f"Erro nos dados ao carregar uma tarefa do arquivo {self.caminho}: {ve}. Tarefa ignorada.",
+                        caminho=self.caminho,
+                    )
+                    self._contar("carga.registros_ignorados")
+        except FileNotFoundError:
+            notificar(
+                AVISO, "carga.arquivo_ausente",
+                f"Arquivo {self.caminho} não encontrado. Iniciando com lista de tarefas vazia.",
+                caminho=self.caminho,
+            )
+            return {}
+        except ErroFormatoBinario as e:
+            notificar(
+                ERRO, "carga.erro",
+                f"Erro ao decodificar o arquivo binário {self.caminho}: {e}. Iniciando com lista vazia.",
+                caminho=self.caminho,
+            )
+            return {}
+        except IOError as e:
+            notificar(
+                ERRO, "carga.erro",
+                f"Erro de E/S ao tentar ler o arquivo {self.caminho}: {e}. Iniciando com lista vazia.",
+                caminho=self.caminho,
+            )
+            return {}
+        notificar(INFORMACAO, "carga.concluida", f"Tarefas carregadas de {self.caminho}", caminho=self.caminho)
+        return tarefas
+
+    def _salvar(self, tarefas):
+        """Grava todas as tarefas no arquivo binário, de forma atômica."""
+        registros = []
+        for valor in tarefas.values():
+            try:
+                if type(valor) is dict:
+                    valor = Tarefa.from_dict(valor)
+                registros.append(codificar_registro(
+                    valor.chave, valor.descricao, valor.vencimento_ordinal, valor.data_vencimento, valor.concluida
+                ))
+            except ValueError as ve:
+                notificar(
+                    ERRO, "gravacao.registro_invalido",
+                    f"Erro nos dados ao salvar uma tarefa em {self.caminho}: {ve}. Tarefa ignorada.",
+                    caminho=self.caminho,
+                )
+                self._contar("gravacao.registros_ignorados")
+
+        def escrever(f):
+            f.write(codificar_cabecalho(len(registros)))
+            f.write(b"".join(registros))
+
+        try:
+            _gravar_atomicamente(
+                self.caminho, escrever, sincronizar=self.politica_fsync == "sempre", binario=True,
+                metricas=self.metricas,
+            )
+            self._sincronizacao_pendente = self.politica_fsync == "ao_fechar"
+        except IOError as e:
+            notificar(ERRO, "gravacao.erro", f"Erro de E/S ao salvar tarefas em {self.caminho}: {e}", caminho=self.caminho)
+
+    def fechar(self):
+        """Com a política de fsync "ao_fechar", sincroniza o arquivo com o disco."""
+        if not self._sincronizacao_pendente:
+            return
+        try:
+            _sincronizar_arquivo(self.caminho)
+            _sincronizar_diretorio(os.path.dirname(os.path.abspath(self.caminho)))
+            self._sincronizacao_pendente = False
+        except IOError as e:
+            notificar(ERRO, "gravacao.erro", f"Erro de E/S ao sincronizar {self.caminho}: {e}", caminho=self.caminho)
+
+
+class ArmazenamentoMapeado(ArmazenamentoEmArquivo):
+    """
+    Persiste as tarefas em um arquivo de registros de tamanho fixo mapeado em memória
+    (`mmap`), com as descrições em um heap separado que só recebe acréscimos (ver o
+    módulo `mapeado`). Concluir uma tarefa altera um byte no lugar, remover deixa uma
+    lápide e adicionar acrescenta um registro a cada arquivo; só `salvar` (que também
+    é a compactação das lápides) regrava os arquivos inteiros.
+    """
+    def __init__(self, caminho="tarefas.mmap", politica_fsync="sempre"):
+        """
+        Args:
+            caminho (str, optional): Nome do arquivo de registros. O heap fica ao lado,
+                                     em `<caminho>.heap.<geração>`. Defaults to "tarefas.mmap".
+            politica_fsync (str, optional): "sempre", "ao_fechar" ou "nunca".
+                                            Defaults to "sempre".
+
+        Raises:
+            ValueError: Se a política de fsync não for reconhecida.
+        """
+        _validar_politica_fsync(politica_fsync)
+        super().__init__(caminho)
+        self.politica_fsync = politica_fsync
+        self._arquivo = None
+        self._mapa = None
+        self._heap = None
+        self._geracao = 0
+        self._usados = 0
+        # Chave do id -> número do registro fixo de cada tarefa viva.
+        self._posicoes = {}
+        self._lapides = 0
+        self._sincronizacao_pendente = False
+
+    def _abrir(self):
+        """Abre e mapeia o arquivo de registros e abre o heap da geração atual. Método privado."""
+        try:
+            self._arquivo = open(self.caminho, "r+b")
+            self._mapa = mmap.mmap(self._arquivo.fileno(), 0, access=mmap.ACCESS_WRITE)
+            self._usados, self._geracao = mapeado.ler_cabecalho(self._mapa)
+            caminho_heap = mapeado.caminho_do_heap(self.caminho, self._geracao)
+            try:
+                self._heap = open(caminho_heap, "r+b")
+            except FileNotFoundError:
+                raise ErroFormatoBinario(f"Arquivo de descrições {caminho_heap} ausente") from None
+        except BaseException:
+            self._fechar_arquivos()
+            raise
+
+    def _fechar_arquivos(self):
+        """Desfaz o mapeamento e fecha os arquivos abertos. Método privado."""
+        for atributo in ("_mapa", "_arquivo", "_heap"):
+            arquivo = getattr(self, atributo)
+            if arquivo is not None:
+                setattr(self, atributo, None)
+                arquivo.close()
+
+    def _carregar(self, preguicoso):
+        """
+        Mapeia o arquivo de registros e lê as tarefas vivas, na ordem de inserção.
+
+        No carregamento preguiçoso, cada tarefa vira um `mapeado.RegistroMapeado`:
+        do heap são decodificados só o ID e o vencimento, usados pelos índices do
+        gerenciador, e a descrição e a Tarefa ficam para o primeiro acesso. O heap é
+        lido de uma vez para um buffer imutável compartilhado pelos registros, que
+        continua válido depois que uma compactação troca o arquivo do heap.
+        """
+        self._fechar_arquivos()
+        self._posicoes = {}
+        self._lapides = 0
+        tarefas = {}
+        try:
+            self._abrir()
+            tamanho_heap = os.fstat(self._heap.fileno()).st_size
+            if preguicoso:
+                heap = self._heap.read()
+            else:
+                heap = mmap.mmap(self._heap.fileno(), 0, access=mmap.ACCESS_READ) if tamanho_heap else b""
+            try:
+                fixos = self._mapa[mapeado.posicao_do_registro(0):mapeado.posicao_do_registro(self._usados)]
+                for numero, (estado, deslocamento) in enumerate(mapeado.REGISTRO.iter_unpack(fixos)):
+                    if estado & mapeado.ESTADO_REMOVIDA:
+                        self._lapides += 1
+                        continue
+                    try:
+                        concluida = bool(estado & mapeado.ESTADO_CONCLUIDA)
+                        if preguicoso:
+                            chave, ordinal, data_vencimento = decodificar_chave(heap, deslocamento)
+                            valor = mapeado.RegistroMapeado(heap, deslocamento, chave, ordinal, data_vencimento, concluida)
+                        else:
+                            (chave, descricao, ordinal, data_vencimento, _), _ = decodificar_registro(heap, deslocamento)
+                            valor = Tarefa._de_forma_compacta(chave, descricao, ordinal, data_vencimento, concluida)
+                        if chave in tarefas:
+                            raise ValueError(f"ID duplicado '{id_da_chave(chave)}'")
+                        tarefas[chave] = valor
+                        self._posicoes[chave] = numero
+                    except ValueError as ve:
+                        # O registro continua no arquivo, mas é tratado como lápide.
+                        self._lapides += 1
+                        notificar(
+                            ERRO, "carga.registro_invalido",
+                            f"Erro nos dados ao carregar uma tarefa do arquivo {self.caminho}: {ve}. Tarefa ignorada.",
+                            caminho=self.caminho,
+                        )
+                        self._contar("carga.registros_ignorados")
+            finally:
+                if type(heap) is mmap.mmap:
+                    heap.close()
+        except FileNotFoundError:
+            notificar(
+                AVISO, "carga.arquivo_ausente",
+                f"Arquivo {self.caminho} não encontrado. Iniciando com lista de tarefas vazia.",
+                caminho=self.caminho,
+            )
+            return {}
+        except ErroFormatoBinario as e:
+            self._fechar_arquivos()
+            notificar(
+                ERRO, "carga.erro",
+                f"Erro ao decodificar o arquivo mapeado {self.caminho}: {e}. Iniciando com lista vazia.",
+                caminho=self.caminho,
+            )
+            return {}
+        except (IOError, ValueError) as e:
+            # ValueError: o mmap não aceita arquivos vazios.
+            self._fechar_arquivos()
+            notificar(
+                ERRO, "carga.erro",
+                f"Erro de E/S ao tentar ler o arquivo {self.caminho}: {e}. Iniciando com lista vazia.",
+                caminho=self.caminho,
+            )
+            return {}
+        notificar(INFORMACAO, "carga.concluida", f"Tarefas carregadas de {self.caminho}", caminho=self.caminho)
+        return tarefas
+
+    def _geracao_em_disco(self):
+        """Geração do heap gravada no arquivo de registros, ou 0 se não houver um válido. Método privado."""
+        if self._mapa is not None:
+            return self._geracao
+        try:
+            with open(self.caminho, "rb") as f:
+                return mapeado.decodificar_cabecalho(f.read(mapeado.CABECALHO.size))[1]
+        except (IOError, ErroFormatoBinario):
+            return 0
+
+    def _salvar(self, tarefas):
+        """
+        Regrava os dois arquivos apenas com as tarefas informadas, o que também
+        descarta as lápides. O heap da nova geração é gravado antes do arquivo de
+        registros que aponta para ele, e o heap antigo só é removido no fim, de modo
+        que uma queda no meio deixa o par anterior intacto.
+        """
+        registros = []
+        for valor in tarefas.values():
+            try:
+                if type(valor) is dict:
+                    valor = Tarefa.from_dict(valor)
+                entrada = codificar_registro(
+                    valor.chave, valor.descricao, valor.vencimento_ordinal, valor.data_vencimento, valor.concluida
+                )
+            except ValueError as ve:
+                notificar(
+                    ERRO, "gravacao.registro_invalido",
+                    f"Erro nos dados ao salvar uma tarefa em {self.caminho}: {ve}. Tarefa ignorada.",
+                    caminho=self.caminho,
+                )
+                self._contar("gravacao.registros_ignorados")
+                continue
+            registros.append((valor.chave, mapeado.ESTADO_CONCLUIDA if valor.concluida else 0, entrada))
+
+        def escrever_heap(f):
+            f.write(b"".join(entrada for _, _, entrada in registros))
+
+        def escrever_registros(f):
+            f.write(mapeado.codificar_cabecalho(len(registros), geracao))
+            deslocamento = 0
+            for _, estado, entrada in registros:
+                f.write(mapeado.REGISTRO.pack(estado, deslocamento))
+                deslocamento += len(entrada)
+
+        sincronizar = self.politica_fsync == "sempre"
+        try:
+            geracao_anterior = self._geracao_em_disco()
+            geracao = geracao_anterior + 1
+            self._fechar_arquivos()
+            _gravar_atomicamente(
+                mapeado.caminho_do_heap(self.caminho, geracao), escrever_heap, sincronizar, True, self.metricas
+            )
+            _gravar_atomicamente(self.caminho, escrever_registros, sincronizar, True, self.metricas)
+            try:
+                os.remove(mapeado.caminho_do_heap(self.caminho, geracao_anterior))
+            except FileNotFoundError:
+                pass
+            self._posicoes = {chave: numero for numero, (chave, _, _) in enumerate(registros)}
+            self._lapides = 0
+            self._abrir()
+            self._sincronizacao_pendente = self.politica_fsync == "ao_fechar"
+        except (IOError, ErroFormatoBinario) as e:
+            notificar(ERRO, "gravacao.erro", f"Erro de E/S ao salvar tarefas em {self.caminho}: {e}", caminho=self.caminho)
+
+    def _registrar(self, alteracoes, tarefas):
+        """
+        Aplica as alterações no lugar: concluir e remover alteram o byte de estado
+        do registro fixo; adicionar acrescenta ao heap e ao arquivo de registros.
+        Quando as lápides passam do limite, compacta com `salvar`.
+        """
+        if self._mapa is None:
+            # Arquivo ainda não carregado, inexistente ou inválido: grava tudo de uma vez.
+            self.salvar(tarefas)
+            return
+        try:
+            for operacao, tarefa in alteracoes:
+                if operacao == "adicionar":
+                    self._acrescentar(tarefa)
+                elif operacao == "concluir":
+                    numero = self._posicoes.get(tarefa.chave)
+                    if numero is not None:
+                        self._alterar_estado(numero, mapeado.ESTADO_CONCLUIDA, tarefa.concluida)
+                elif operacao == "remover":
+                    numero = self._posicoes.pop(tarefa.chave, None)
+                    if numero is not None:
+                        self._alterar_estado(numero, mapeado.ESTADO_REMOVIDA, True)
+                        self._lapides += 1
+                elif operacao == "limpar":
+                    for numero in self._posicoes.values():
+                        self._alterar_estado(numero, mapeado.ESTADO_REMOVIDA, True)
+                    self._lapides += len(self._posicoes)
+                    self._posicoes = {}
+            self._confirmar()
+        except IOError as e:
+            notificar(ERRO, "gravacao.erro", f"Erro de E/S ao salvar tarefas em {self.caminho}: {e}", caminho=self.caminho)
+            return
+        if self._lapides > max(LIMITE_MINIMO_LAPIDES, len(self._posicoes)):
+            self.salvar(tarefas)
+
+    def _alterar_estado(self, numero, bit, ligado):
+        """Liga ou desliga um bit do byte de estado de um registro fixo. Método privado."""
+        posicao = mapeado.posicao_do_registro(numero)
+        estado = self._mapa[posicao]
+        self._mapa[posicao] = estado | bit if ligado else estado & ~bit
+
+    def _acrescentar(self, tarefa):
+        """Acrescenta uma tarefa ao heap e um registro fixo apontando para ela. Método privado."""
+        try:
+            entrada = codificar_registro(
+                tarefa.chave, tarefa.descricao, tarefa.vencimento_ordinal, tarefa.data_vencimento, tarefa.concluida
+            )
+        except ValueError as ve:
+            notificar(
+                ERRO, "gravacao.registro_invalido",
+                f"Erro nos dados ao salvar uma tarefa em {self.caminho}: {ve}. Tarefa ignorada.",
+                caminho=self.caminho,
+            )
+            self._contar("gravacao.registros_ignorados")
+            return
+        self._heap.seek(0, os.SEEK_END)
+        deslocamento = self._heap.tell()
+        self._heap.write(entrada)
+        numero = self._usados
+        fim = mapeado.posicao_do_registro(numero + 1)
+        if fim > len(self._mapa):
+            # O mapeamento é refeito em vez de usar mmap.resize, que não existe em
+            # todas as plataformas; a capacidade dobra para amortizar o custo.
+            capacidade = max(2 * len(self._mapa), fim, mapeado.posicao_do_registro(CAPACIDADE_MINIMA_MAPEADO))
+            self._mapa.close()
+            self._mapa = None
+            self._arquivo.truncate(capacidade)
+            self._mapa = mmap.mmap(self._arquivo.fileno(), 0, access=mmap.ACCESS_WRITE)
+        estado = mapeado.ESTADO_CONCLUIDA if tarefa.concluida else 0
+        mapeado.REGISTRO.pack_into(self._mapa, mapeado.posicao_do_registro(numero), estado, deslocamento)
+        self._usados += 1
+        self._posicoes[tarefa.chave] = numero
+
+    def _confirmar(self):
+        """
+        Conclui um conjunto de alterações: o heap vai para o disco antes de o
+        cabeçalho passar a contar os novos registros fixos. Método privado.
+        """
+        self._heap.flush()
+        sincronizar = self.politica_fsync == "sempre"
+        if sincronizar:
+            os.fsync(self._heap.fileno())
+            self._mapa.flush()
+        cabecalho = mapeado.codificar_cabecalho(self._usados, self._geracao)
+        if self._mapa[:len(cabecalho)] != cabecalho:
+            self._mapa[:len(cabecalho)] = cabecalho
+        if sincronizar:
+            self._mapa.flush()
+        else:
+            self._sincronizacao_pendente = self.politica_fsync == "ao_fechar"
+
+    def fechar(self):
+        """Sincroniza os arquivos se a política for "ao_fechar" e desfaz o mapeamento."""
+        if self._mapa is None:
+            return
+        try:
+            if self._sincronizacao_pendente:
+                self._mapa.flush()
+                os.fsync(self._arquivo.fileno())
+                os.fsync(self._heap.fileno())
+                _sincronizar_diretorio(os.path.dirname(os.path.abspath(self.caminho)))
+                self._sincronizacao_pendente = False
+        except IOError as e:
+            notificar(ERRO, "gravacao.erro", f"Erro de E/S ao sincronizar {self.caminho}: {e}", caminho=self.caminho)
+        finally:
+            self._fechar_arquivos()
+
+
+class ArmazenamentoFragmentado(ArmazenamentoEmArquivo):
+    """
+    Persiste as tarefas em um diretório com vários arquivos JSON, os fragmentos,
+    particionados por um hash do ID (ver o módulo `fragmentos`). Os fragmentos são
+    lidos em paralelo por um pool de processos e reunidos na ordem de inserção, e
+    cada conjunto de alterações regrava apenas os fragmentos das tarefas alteradas.
+
+    Cada fragmento é regravado de forma atômica, mas um conjunto de alterações que
+    toca vários fragmentos não é atômico entre eles. `salvar` e `refragmentar`
+    regravam todos os fragmentos em uma nova geração e são atômicos.
+    """
+    def __init__(self, caminho="tarefas", fragmentos=None, politica_fsync="sempre", processos=None):
+        """
+        Args:
+            caminho (str, optional): O diretório dos fragmentos. Defaults to "tarefas".
+            fragmentos (int, optional): Número de fragmentos de um diretório novo. Um
+                                        diretório existente mantém o número do seu
+                                        manifesto (ver `refragmentar`). Se None, usa
+                                        FRAGMENTOS_PADRAO. Defaults to None.
+            politica_fsync (str, optional): "sempre", "ao_fechar" ou "nunca".
+                                            Defaults to "sempre".
+            processos (int, optional): Número de processos usados no carregamento; 1
+                                       carrega no próprio processo. Se None, usa o
+                                       número de CPUs. Defaults to None.
+
+        Raises:
+            ValueError: Se a política de fsync não for reconhecida ou o número de
+                        fragmentos for menor que 1.
+        """
+        _validar_politica_fsync(politica_fsync)
+        if fragmentos is not None and fragmentos < 1:
+            raise ValueError("O número de fragmentos deve ser pelo menos 1.")
+        # Sem a barra final, a trava fica ao lado do diretório, e não dentro dele.
+        super().__init__(caminho.rstrip("/" + os.sep) or caminho)
+        self.fragmentos = fragmentos or FRAGMENTOS_PADRAO
+        self._fragmentos_pedidos = fragmentos
+        self.politica_fsync = politica_fsync
+        self.processos = processos
+        self._geracao = 0
+        # Por fragmento, chave do id -> posição de cada tarefa, na ordem de inserção.
+        # None enquanto o diretório não foi carregado ou gravado por esta instância.
+        self._membros = None
+        self._proxima_posicao = 0
+        self._sincronizacao_pendente = set()
+
+    def _carregar(self, preguicoso):
+        """
+        Lê o manifesto e os fragmentos, em paralelo se forem grandes o bastante, e
+        reúne as tarefas na ordem de inserção. Como no formato binário, as tarefas
+        são sempre criadas na hora, mesmo no carregamento preguiçoso.
+        """
+        self._membros = None
+        try:
+            self.fragmentos, self._geracao = fragmentos.ler_manifesto(self.caminho)
+        except FileNotFoundError:
+            notificar(
+                AVISO, "carga.arquivo_ausente",
+                f"Diretório {self.caminho} não encontrado. Iniciando com lista de tarefas vazia.",
+                caminho=self.caminho,
+            )
+            return {}
+        except (json.JSONDecodeError, UnicodeDecodeError, ValueError) as e:
+            notificar(ERRO, "carga.erro", f"Erro ao ler o manifesto de {self.caminho}: {e}. Iniciando com lista vazia.",
+                      caminho=self.caminho)
+            return {}
+        except IOError as e:
+            notificar(
+                ERRO, "carga.erro",
+                f"Erro de E/S ao tentar ler o diretório {self.caminho}: {e}. Iniciando com lista vazia.",
+                caminho=self.caminho,
+            )
+            return {}
+        if self._fragmentos_pedidos not in (None, self.fragmentos):
+            notificar(
+                AVISO, "carga.fragmentos",
+                f"Aviso: {self.caminho} tem {self.fragmentos} fragmento(s); use refragmentar para mudar o número.",
+                caminho=self.caminho,
+            )
+
+        caminhos = [fragmentos.caminho_do_fragmento(self.caminho, self._geracao, i) for i in range(self.fragmentos)]
+        processos = self.processos or os.cpu_count() or 1
+        if processos > 1 and len(caminhos) > 1 and self._tamanho_total(caminhos) >= TAMANHO_MINIMO_CARGA_PARALELA:
+            with ProcessPoolExecutor(max_workers=min(processos, len(caminhos))) as pool:
+                lidos = list(pool.map(fragmentos.ler_fragmento, caminhos))
+        else:
+            # Poucos dados não compensam o custo de iniciar os processos.
+            lidos = [fragmentos.ler_fragmento(caminho) for caminho in caminhos]
+
+        tarefas = {}
+        membros = [{} for _ in caminhos]
+        ultima = -1
+        for _, erros, ignorados in lidos:
+            for erro in erros:
+                notificar(ERRO, "carga.erro", f"{erro}.")
+            self._contar("carga.registros_ignorados", ignorados)
+        for posicao, chave, descricao, ordinal, data_vencimento, concluida in heapq.merge(
+                *(registros for registros, _, _ in lidos), key=itemgetter(0)):
+            try:
+                if chave in tarefas:
+                    raise ValueError(f"ID duplicado '{id_da_chave(chave)}'")
+                tarefas[chave] = Tarefa._de_forma_compacta(chave, descricao, ordinal, data_vencimento, concluida)
+            except ValueError as ve:
+                notificar(
+                    ERRO, "carga.registro_invalido",
+                    f"Erro nos dados ao carregar uma tarefa de {self.caminho}: {ve}. Tarefa ignorada.",
+                    caminho=self.caminho,
+                )
+                self._contar("carga.registros_ignorados")
+                continue
+            membros[fragmentos.fragmento_da_chave(chave, self.fragmentos)][chave] = posicao
+            ultima = max(ultima, posicao)
+        self._membros = membros
+        self._proxima_posicao = ultima + 1
+        notificar(INFORMACAO, "carga.concluida", f"Tarefas carregadas de {self.caminho}", caminho=self.caminho)
+        return tarefas
+
+    @staticmethod
+    def _tamanho_total(caminhos):
+        """Soma o tamanho dos arquivos existentes. Método privado."""
+        total = 0
+        for caminho in caminhos:
+            try:
+                total += os.path.getsize(caminho)
+            except OSError:
+                pass
+        return total
+
+    def _salvar(self, tarefas):
+        """
+        Grava todos os fragmentos em uma nova geração e troca o manifesto; os
+        arquivos da geração anterior só são removidos depois da troca. As posições
+        são renumeradas a partir de zero.
+        """
+        membros = [{} for _ in range(self.fragmentos)]
+        for posicao, chave in enumerate(tarefas):
+            membros[fragmentos.fragmento_da_chave(chave, self.fragmentos)][chave] = posicao
+        try:
+            os.makedirs(self.caminho, exist_ok=True)
+            try:
+                geracao = fragmentos.ler_manifesto(self.caminho)[1] + 1
+            except (IOError, ValueError):
+                geracao = self._geracao + 1
+            for indice, membros_do_fragmento in enumerate(membros):
+                self._gravar_fragmento(geracao, indice, membros_do_fragmento, tarefas)
+            manifesto = os.path.join(self.caminho, fragmentos.MANIFESTO)
+            _gravar_atomicamente(
+                manifesto, lambda f: f.write(fragmentos.codificar_manifesto(self.fragmentos, geracao)),
+                sincronizar=self.politica_fsync == "sempre", metricas=self.metricas,
+            )
+            if self.politica_fsync == "ao_fechar":
+                self._sincronizacao_pendente.add(manifesto)
+        except IOError as e:
+            notificar(ERRO, "gravacao.erro", f"Erro de E/S ao salvar tarefas em {self.caminho}: {e}", caminho=self.caminho)
+            return
+        self._remover_outras_geracoes(geracao)
+        self._geracao = geracao
+        self._membros = membros
+        self._proxima_posicao = len(tarefas)
+
+    def _registrar(self, alteracoes, tarefas):
+        """Regrava só os fragmentos que contêm as tarefas alteradas."""
+        if self._membros is None:
+            # Diretório ainda não carregado, inexistente ou inválido: grava tudo de uma vez.
+            self.salvar(tarefas)
+            return
+        tocados = set()
+        for operacao, tarefa in alteracoes:
+            if operacao == "limpar":
+                for membros_do_fragmento in self._membros:
+                    membros_do_fragmento.clear()
+                tocados.update(range(self.fragmentos))
+                continue
+            indice = fragmentos.fragmento_da_chave(tarefa.chave, self.fragmentos)
+            if operacao == "adicionar":
+                self._membros[indice][tarefa.chave] = self._proxima_posicao
+                self._proxima_posicao += 1
+            elif operacao == "remover":
+                self._membros[indice].pop(tarefa.chave, None)
+            tocados.add(indice)
+        try:
+            for indice in sorted(tocados):
+                self._gravar_fragmento(self._geracao, indice, self._membros[indice], tarefas)
+        except IOError as e:
+            notificar(ERRO, "gravacao.erro", f"Erro de E/S ao salvar tarefas em {self.caminho}: {e}", caminho=self.caminho)
+
+    def _gravar_fragmento(self, geracao, indice, membros_do_fragmento, tarefas):
+        """Grava um fragmento, de forma atômica, com as tarefas dos membros. Método privado."""
+        registros = []
+        for chave, posicao in membros_do_fragmento.items():
+            valor = tarefas.get(chave)
+            if valor is not None:
+                registros.append((posicao, _como_dict(valor)))
+        caminho = fragmentos.caminho_do_fragmento(self.caminho, geracao, indice)
+        _gravar_atomicamente(
+            caminho, lambda f: fragmentos.escrever_fragmento(f, registros),
+            sincronizar=self.politica_fsync == "sempre", metricas=self.metricas,
+        )
+        if self.politica_fsync == "ao_fechar":
+            self._sincronizacao_pendente.add(caminho)
+
+    def _remover_outras_geracoes(self, geracao):
+        """Remove os fragmentos que não são da geração informada. Método privado."""
+        atuais = {os.path.basename(fragmentos.caminho_do_fragmento(self.caminho, geracao, i))
+                  for i in range(self.fragmentos)}
+        for nome in os.listdir(self.caminho):
+            if nome.startswith("fragmento-") and nome.endswith(".json") and nome not in atuais:
+                try:
+                    os.remove(os.path.join(self.caminho, nome))
+                except OSError:
+                    pass
+                self._sincronizacao_pendente.discard(os.path.join(self.caminho, nome))
+
+    def refragmentar(self, fragmentos):
+        """
+        Redistribui as tarefas em outro número de fragmentos, com a trava mantida
+        entre a leitura e a gravação.
+
+        Args:
+            fragmentos (int): O novo número de fragmentos.
+
+        Returns:
+            int: O número de tarefas redistribuídas.
+
+        Raises:
+            ValueError: Se o número de fragmentos for menor que 1.
+        """
+        if fragmentos < 1:
+            raise ValueError("O número de fragmentos deve ser pelo menos 1.")
+        with self.bloquear():
+            tarefas = self.carregar()
+            self.fragmentos = self._fragmentos_pedidos = fragmentos
+            self.salvar(tarefas)
+        return len(tarefas)
+
+    def fechar(self):
+        """Com a política de fsync "ao_fechar", sincroniza os fragmentos gravados."""
+        if not self._sincronizacao_pendente:
+            return
+        try:
+            for caminho in sorted(self._sincronizacao_pendente):
+                _sincronizar_arquivo(caminho)
+            _sincronizar_diretorio(self.caminho)
+            self._sincronizacao_pendente.clear()
+        except IOError as e:
+            notificar(ERRO, "gravacao.erro", f"Erro de E/S ao sincronizar {self.caminho}: {e}", caminho=self.caminho)
+
+
+class _Segmento:
+    """Um segmento do armazenamento segmentado: o arquivo e as chaves das tarefas, na ordem."""
+    __slots__ = ("nome", "membros")
+
+    def __init__(self, nome=None, membros=None):
+        self.nome = nome
+        self.membros = {} if membros is None else membros
+
+
+class ArmazenamentoSegmentado(ArmazenamentoEmArquivo):
+    """
+    Persiste as tarefas em segmentos de até `tarefas_por_segmento` tarefas, na ordem
+    de inserção, descritos por um manifesto no próprio arquivo de tarefas (ver o
+    módulo `segmentos`). Cada gravação regrava só os segmentos com tarefas
+    alteradas e troca o manifesto, de forma atômica: alterar uma tarefa entre um
+    milhão regrava um segmento, e não o arquivo inteiro.
+
+    Tarefas novas vão para o último segmento, ou para um novo quando ele está cheio;
+    segmentos que ficam vazios saem do manifesto. `salvar` redistribui tudo em
+    segmentos cheios. Um arquivo no formato do ArmazenamentoJSON (uma lista) é
+    carregado como um único segmento e convertido na primeira gravação.
+    """
+    registra_alteradas = True
+
+    def __init__(self, caminho="tarefas.json", tarefas_por_segmento=None, politica_fsync="sempre"):
+        """
+        Args:
+            caminho (str, optional): O arquivo do manifesto. Defaults to "tarefas.json".
+            tarefas_por_segmento (int, optional): Máximo de tarefas em um segmento. Se
+                                                  None, usa TAREFAS_POR_SEGMENTO_PADRAO.
+                                                  Defaults to None.
+            politica_fsync (str, optional): "sempre", "ao_fechar" ou "nunca".
+                                            Defaults to "sempre".
+
+        Raises:
+            ValueError: Se a política de fsync não for reconhecida ou o número de
+                        tarefas por segmento for menor que 1.
+        """
+        _validar_politica_fsync(politica_fsync)
+        if tarefas_por_segmento is not None and tarefas_por_segmento < 1:
+            raise ValueError("O número de tarefas por segmento deve ser pelo menos 1.")
+        super().__init__(caminho)
+        self.tarefas_por_segmento = tarefas_por_segmento or TAREFAS_POR_SEGMENTO_PADRAO
+        self.politica_fsync = politica_fsync
+        self.diretorio = segmentos.diretorio_dos_segmentos(caminho)
+        # Os segmentos em disco, na ordem, e o segmento de cada chave. None enquanto
+        # o layout em disco não é conhecido (arquivo não carregado, no formato antigo
+        # ou com segmentos ilegíveis): a próxima gravação regrava tudo.
+        self._segmentos = None
+        self._segmento_da_chave = {}
+        self._proximo = 0
+        self._sincronizacao_pendente = set()
+
+    def _carregar(self, preguicoso):
+        """
+        Lê o manifesto e, em ordem, os segmentos. Um arquivo com uma lista JSON é lido
+        como no ArmazenamentoJSON.
+        """
+        self._segmentos = None
+        self._segmento_da_chave = {}
+        tarefas = {}
+        try:
+            with open(self.caminho, "r", encoding="utf-8") as f:
+                if f.read(64).lstrip()[:1] != "{":
+                    f.seek(0)
+                    _ler_lista_de_tarefas(self, f, self.caminho, tarefas, preguicoso)
+                    notificar(INFORMACAO, "carga.concluida", f"Tarefas carregadas de {self.caminho}",
+                              caminho=self.caminho)
+                    return tarefas
+                f.seek(0)
+                nomes, self._proximo = segmentos.ler_manifesto(f)
+        except FileNotFoundError:
+            notificar(
+                AVISO, "carga.arquivo_ausente",
+                f"Arquivo {self.caminho} não encontrado. Iniciando com lista de tarefas vazia.",
+                caminho=self.caminho,
+            )
+            return {}
+        except ErroConteudoNaoLista:
+            notificar(
+                ERRO, "carga.erro",
+                f"Erro: O conteúdo do arquivo {self.caminho} não é uma lista JSON válida. Iniciando com lista vazia.",
+                caminho=self.caminho,
+            )
+            return {}
+        except (json.JSONDecodeError, UnicodeDecodeError, ValueError) as e:
+            notificar(ERRO, "carga.erro", f"Erro ao ler o manifesto de {self.caminho}: {e}. Iniciando com lista vazia.",
+                      caminho=self.caminho)
+            return {}
+        except IOError as e:
+            notificar(
+                ERRO, "carga.erro",
+                f"Erro de E/S ao tentar ler o arquivo {self.caminho}: {e}. Iniciando com lista vazia.",
+                caminho=self.caminho,
+            )
+            return {}
+
+        lidos = []
+        for nome in nomes:
+            segmento = _Segmento(nome)
+            caminho = os.path.join(self.diretorio, nome)
+            try:
+                with open(caminho, "r", encoding="utf-8") as f:
+                    _ler_lista_de_tarefas(self, f, caminho, tarefas, preguicoso, segmento.membros)
+            except (ErroConteudoNaoLista, json.JSONDecodeError, UnicodeDecodeError, IOError) as e:
+                notificar(ERRO, "carga.erro", f"Erro ao ler o segmento {caminho}: {e}. Segmento ignorado.",
+                          caminho=caminho)
+                lidos = None
+                continue
+            if lidos is not None:
+                lidos.append(segmento)
+        if lidos is not None:
+            self._segmentos = lidos
+            self._segmento_da_chave = {chave: segmento for segmento in lidos for chave in segmento.membros}
+        notificar(INFORMACAO, "carga.concluida", f"Tarefas carregadas de {self.caminho}", caminho=self.caminho)
+        return tarefas
+
+    def salvar_alteradas(self, tarefas, alteradas):
+        with self._trava.exclusiva():
+            if self._segmentos is None or self._trava.desatualizada():
+                self._salvar(tarefas)
+            else:
+                self._gravar_alteradas(alteradas, tarefas)
+            self._trava.avancar()
+
+    def _salvar(self, tarefas):
+        """Redistribui todas as tarefas em segmentos cheios, gravados em arquivos novos."""
+        novos = []
+        for posicao, chave in enumerate(tarefas):
+            if posicao % self.tarefas_por_segmento == 0:
+                novos.append(_Segmento())
+            novos[-1].membros[chave] = None
+        try:
+            with open(self.caminho, "r", encoding="utf-8") as f:
+                # Continua a numeração do manifesto em disco, mesmo que outro processo o tenha gravado.
+                self._proximo = max(self._proximo, segmentos.ler_manifesto(f)[1])
+        except (IOError, ValueError):
+            pass
+        self._segmentos = novos
+        self._segmento_da_chave = {chave: segmento for segmento in novos for chave in segmento.membros}
+        if self._gravar_segmentos(novos, tarefas, []):
+            # Restos de outras gravações, inclusive interrompidas, não são mais usados.
+            atuais = {segmento.nome for segmento in novos}
+            self._remover_arquivos([nome for nome in os.listdir(self.diretorio)
+                                    if segmentos.eh_segmento(nome) and nome not in atuais])
+
+    def registrar(self, alteracoes, tarefas, alteradas=None):
+        with self._trava.exclusiva():
+            self._registrar(alteracoes, tarefas, alteradas)
+            self._trava.avancar()
+
+    def _registrar(self, alteracoes, tarefas, alteradas=None):
+        """
+        Regrava só os segmentos que contêm as tarefas alteradas, inclusive as de
+        `alteradas`, mudadas por atribuição direta.
+        """
+        if self._segmentos is None or self._trava.desatualizada() \
+                or any(operacao == "limpar" for operacao, _ in alteracoes):
+            self._salvar(tarefas)
+            return
+        chaves = {tarefa.chave for _, tarefa in alteracoes}
+        if alteradas:
+            chaves |= alteradas
+        self._gravar_alteradas(chaves, tarefas)
+
+    def _gravar_alteradas(self, chaves, tarefas):
+        """
+        Atualiza os segmentos das chaves alteradas (acrescentando as novas ao fim e
+        retirando as removidas) e grava só esses segmentos. Método privado.
+
+        Args:
+            chaves (iterable): Chaves adicionadas, alteradas ou removidas.
+            tarefas (dict): O estado completo após as alterações.
+        """
+        sujos = {}
+        novas = set()
+        for chave in chaves:
+            segmento = self._segmento_da_chave.get(chave)
+            if segmento is None:
+                if chave in tarefas:
+                    novas.add(chave)
+            elif chave in tarefas:
+                sujos[id(segmento)] = segmento
+            else:
+                del segmento.membros[chave]
+                del self._segmento_da_chave[chave]
+                sujos[id(segmento)] = segmento
+        if novas:
+            # Tarefas novas ficam no fim de `tarefas`; as que estiverem no meio
+            # mudariam a ordem dos segmentos, e tudo é regravado.
+            ordem = []
+            for chave in reversed(tarefas):
+                if chave in novas:
+                    ordem.append(chave)
+                    if len(ordem) == len(novas):
+                        break
+                elif chave in self._segmento_da_chave:
+                    self._salvar(tarefas)
+                    return
+            for chave in reversed(ordem):
+                ultimo = self._segmentos[-1] if self._segmentos else None
+                if ultimo is None or len(ultimo.membros) >= self.tarefas_por_segmento:
+                    ultimo = _Segmento()
+                    self._segmentos.append(ultimo)
+                ultimo.membros[chave] = None
+                self._segmento_da_chave[chave] = ultimo
+                sujos[id(ultimo)] = ultimo
+        if not sujos:
+            return
+        vazios = [segmento for segmento in sujos.values() if not segmento.membros]
+        if vazios:
+            self._segmentos = [segmento for segmento in self._segmentos if segmento.membros]
+        substituidos = [segmento.nome for segmento in sujos.values() if segmento.nome is not None]
+        if self._gravar_segmentos([segmento for segmento in sujos.values() if segmento.membros], tarefas, substituidos):
+            self._remover_arquivos(substituidos)
+
+    def _gravar_segmentos(self, sujos, tarefas, substituidos):
+        """
+        Grava os segmentos sujos em arquivos novos e troca o manifesto. Em caso de
+        erro, o layout passa a ser desconhecido e a próxima gravação regrava tudo.
+        Método privado.
+
+        Returns:
+            bool: True se o manifesto foi trocado.
+        """
+        try:
+            os.makedirs(self.diretorio, exist_ok=True)
+            for segmento in sujos:
+                segmento.nome = segmentos.nome_do_segmento(self._proximo)
+                self._proximo += 1
+                registros = [_como_dict(valor) for valor in map(tarefas.get, segmento.membros) if valor is not None]
+                caminho = os.path.join(self.diretorio, segmento.nome)
+                _gravar_atomicamente(
+                    caminho, lambda f: segmentos.escrever_segmento(f, registros),
+                    sincronizar=self.politica_fsync == "sempre", metricas=self.metricas,
+                )
+                if self.politica_fsync == "ao_fechar":
+                    self._sincronizacao_pendente.add(caminho)
+            self._contar("gravacao.segmentos", len(sujos))
+            conteudo = segmentos.codificar_manifesto([segmento.nome for segmento in self._segmentos], self._proximo)
+            _gravar_atomicamente(
+                self.caminho, lambda f: f.write(conteudo),
+                sincronizar=self.politica_fsync == "sempre", metricas=self.metricas,
+            )
+            if self.politica_fsync == "ao_fechar":
+                self._sincronizacao_pendente.add(self.caminho)
+        except IOError as e:
+            notificar(ERRO, "gravacao.erro", f"Erro de E/S ao salvar tarefas em {self.caminho}: {e}", caminho=self.caminho)
+            self._segmentos = None
+            self._segmento_da_chave = {}
+            return False
+        return True
+
+    def _remover_arquivos(self, nomes):
+        """Remove arquivos de segmento que o manifesto não usa mais. Método privado."""
+        for nome in nomes:
+            caminho = os.path.join(self.diretorio, nome)
+            try:
+                os.remove(caminho)
+            except OSError:
+                pass
+            self._sincronizacao_pendente.discard(caminho)
+
+    def fechar(self):
+        """Com a política de fsync "ao_fechar", sincroniza o manifesto e os segmentos gravados."""
+        if not self._sincronizacao_pendente:
+            return
+        try:
+            for caminho in sorted(self._sincronizacao_pendente):
+                _sincronizar_arquivo(caminho)
+            _sincronizar_diretorio(self.diretorio)
+            _sincronizar_diretorio(os.path.dirname(os.path.abspath(self.caminho)))
+            self._sincronizacao_pendente.clear()
+        except IOError as e:
+            notificar(ERRO, "gravacao.erro", f"Erro de E/S ao sincronizar {self.caminho}: {e}", caminho=self.caminho)
+
+
+def tipo_do_caminho(caminho):
+    """
+    Deduz o tipo de armazenamento de um caminho: um diretório existente, ou um
+    caminho terminado em barra, usa o armazenamento fragmentado; .db, .sqlite e
+    .sqlite3 usam SQLite; .bin e .tarefas, o formato binário; .mmap, o armazenamento
+    mapeado; um arquivo existente com um manifesto de segmentos, o segmentado;
+    qualquer outro, JSON.
+
+    Args:
+        caminho (str): Arquivo ou diretório de persistência.
+
+    Returns:
+        str: "json", "sqlite", "binario", "mapeado", "fragmentado" ou "segmentado".
+    """
+    if os.path.isdir(caminho) or caminho.endswith(("/", os.sep)):
+        return "fragmentado"
+    extensao = os.path.splitext(caminho)[1].lower()
+    if extensao in EXTENSOES_SQLITE:
+        return "sqlite"
+    if extensao in EXTENSOES_BINARIO:
+        return "binario"
+    if extensao in EXTENSOES_MAPEADO:
+        return "mapeado"
+    if segmentos.eh_manifesto(caminho):
+        return "segmentado"
+    return "json"
+
+
+def criar_armazenamento(caminho, tipo=None, **opcoes):
+    """
+    Cria o armazenamento adequado para um caminho.
+
+    Args:
+        caminho (str): Arquivo (ou diretório) de persistência.
+        tipo (str, optional): "json", "sqlite", "binario", "mapeado", "fragmentado" ou
+                              "segmentado". Se None, é deduzido do caminho (ver
+                              `tipo_do_caminho`).
+        **opcoes: Opções repassadas ao construtor do armazenamento.
+
+    Returns:
+        Armazenamento: O armazenamento criado.
+
+    Raises:
+        ValueError: Se o tipo não for reconhecido.
+    """
+    if tipo is None:
+        tipo = tipo_do_caminho(caminho)
+    if tipo == "json":
+        return ArmazenamentoJSON(caminho, **opcoes)
+    if tipo == "sqlite":
+        return ArmazenamentoSQLite(caminho, **opcoes)
+    if tipo == "binario":
+        return ArmazenamentoBinario(caminho, **opcoes)
+    if tipo == "mapeado":
+        return ArmazenamentoMapeado(caminho, **opcoes)
+    if tipo == "fragmentado":
+        return ArmazenamentoFragmentado(caminho, **opcoes)
+    if tipo == "segmentado":
+        return ArmazenamentoSegmentado(caminho, **opcoes)
+    raise ValueError(f"Tipo de armazenamento desconhecido: '{tipo}'.")
+
+
+def migrar(origem, destino):
+    """
+    Copia todas as tarefas de um armazenamento para outro, substituindo o conteúdo
+    do destino. Ambos são fechados ao final.
+
+    Args:
+        origem (Armazenamento): De onde as tarefas são lidas.
+        destino (Armazenamento): Para onde as tarefas são gravadas.
+
+    Returns:
+        int: O número de tarefas migradas.
+    """
+    try:
+        tarefas = origem.carregar()
+        destino.salvar(tarefas)
+    finally:
+        origem.fechar()
+        destino.fechar()
+    return len(tarefas)
@@ -0,0 +1,160 @@
+# gerenciador_tarefas/assincrono.py
+
+import asyncio
+import functools
+from .logica import GerenciadorDeTarefas
+
+
+class GerenciadorAssincrono:
+    """
+    Fachada assíncrona do GerenciadorDeTarefas, para uso em um laço de eventos do asyncio.
+
+    As alterações são aplicadas em memória na própria thread do laço, o que é rápido,
+    e todas as feitas em uma mesma volta do laço entram em um único lote (ver
+    `GerenciadorDeTarefas.lote`). No fim da volta, o lote é entregue à thread de
+    gravação em segundo plano do gerenciador, e quem fez as alterações aguarda a
+    gravação sem bloquear o laço. Carregar e fechar também rodam fora do laço, no
+    executor padrão.
+
+    Uso:
+        async with await GerenciadorAssincrono.abrir("tarefas.json") as gerenciador:
+            tarefa = await gerenciador.adicionar_tarefa("Comprar pão")
+    """
+    def __init__(self, gerenciador):
+        """
+        Args:
+            gerenciador (GerenciadorDeTarefas): O gerenciador a envolver, criado com
+                                                `gravar_em_segundo_plano=True` (ver `abrir`).
+
+        Raises:
+            ValueError: Se o gerenciador não gravar em segundo plano.
+        """
+        if gerenciador._gravacoes is None:
+            raise ValueError("O gerenciador precisa ser criado com gravar_em_segundo_plano=True.")
+        self.gerenciador = gerenciador
+        # Lote aberto na volta atual do laço e a gravação que o encerrará.
+        self._lote = None
+        self._gravacao = None
+
+    @classmethod
+    async def abrir(cls, arquivo_json="tarefas.json", **opcoes):
+        """
+        Cria o gerenciador, carregando as tarefas no executor padrão.
+
+        Args:
+            arquivo_json (str, optional): Arquivo de persistência. Defaults to "tarefas.json".
+            **opcoes: Demais argumentos de `GerenciadorDeTarefas`; a gravação em segundo
+                      plano é sempre ativada.
+
+        Returns:
+            GerenciadorAssincrono: A fachada pronta para uso.
+        """
+        opcoes["gravar_em_segundo_plano"] = True
+        loop = asyncio.get_running_loop()
+        gerenciador = await loop.run_in_executor(None, functools.partial(GerenciadorDeTarefas, arquivo_json, **opcoes))
+        return cls(gerenciador)
+
+    def _alterar(self, metodo, *args):
+        """
+        Executa uma alteração dentro do lote da volta atual do laço, abrindo-o se for
+        a primeira. Método privado.
+
+        Returns:
+            tuple: (resultado do método, futuro da gravação do lote).
+        """
+        if self._lote is None:
+            loop = asyncio.get_running_loop()
+            self._lote = self.gerenciador.lote()
+            self._lote.__enter__()
+            self._gravacao = loop.create_future()
+            loop.call_soon(self._encerrar_lote)
+        return metodo(*args), self._gravacao
+
+    def _encerrar_lote(self):
+        """
+        Fecha o lote da volta que terminou, o que só enfileira a gravação, e liga o
+        futuro dos que a aguardam ao fim dela. Método privado.
+        """
+        lote, gravacao = self._lote, self._gravacao
+        if lote is None:
+            # Já encerrado por `fechar`.
+            return
+        self._lote = self._gravacao = None
+        try:
+            lote.__exit__(None, None, None)
+        except BaseException as e:
+            gravacao.set_exception(e)
+            return
+        aguardar = asyncio.get_running_loop().run_in_executor(None, self.gerenciador.aguardar_gravacoes)
+        aguardar.add_done_callback(functools.partial(self._repassar, gravacao))
+
+    @staticmethod
+    def _repassar(gravacao, concluido):
+        if gravacao.cancelled():
+            return
+        if concluido.exception() is not None:
+            gravacao.set_exception(concluido.exception())
+        else:
+            gravacao.set_result(None)
+
+    async def adicionar_tarefa(self, descricao, data_vencimento=None):
+        """
+        Adiciona uma tarefa e aguarda a gravação (ver `GerenciadorDeTarefas.adicionar_tarefa`).
+
+        Returns:
+            Tarefa: A tarefa criada, ou None se a descrição for inválida.
+        """
+        tarefa, gravacao = self._alterar(self.gerenciador.adicionar_tarefa, descricao, data_vencimento)
+        await asyncio.shield(gravacao)
+        return tarefa
+
+    async def marcar_tarefa_como_concluida(self, id_tarefa):
+        """
+        Marca uma tarefa como concluída e aguarda a gravação.
+
+        Returns:
+            bool: True se a tarefa foi marcada, False caso contrário.
+        """
+        marcada, gravacao = self._alterar(self.gerenciador.marcar_tarefa_como_concluida, id_tarefa)
+        await asyncio.shield(gravacao)
+        return marcada
+
+    async def remover_tarefa(self, id_tarefa):
+        """
+        Remove uma tarefa e aguarda a gravação.
+
+        Returns:
+            bool: True se a tarefa foi removida, False caso contrário.
+        """
+        removida, gravacao = self._alterar(self.gerenciador.remover_tarefa, id_tarefa)
+        await asyncio.shield(gravacao)
+        return removida
+
+    async def visualizar_tarefas(self, mostrar_concluidas=True, mostrar_pendentes=True):
+        """
+        Retorna as strings das tarefas (ver `GerenciadorDeTarefas.visualizar_tarefas`).
+        A consulta é feita em memória, sem acesso ao disco.
+        """
+        return self.gerenciador.visualizar_tarefas(mostrar_concluidas, mostrar_pendentes)
+
+    async def listar_tarefas(self):
+        """Retorna a lista das tarefas, na ordem em que foram adicionadas."""
+        return self.gerenciador.tarefas
+
+    async def encontrar_tarefa_por_id(self, id_tarefa):
+        """Encontra uma tarefa pelo ID (ver `GerenciadorDeTarefas.encontrar_tarefa_por_id`)."""
+        return self.gerenciador.encontrar_tarefa_por_id(id_tarefa)
+
+    async def fechar(self):
+        """Grava o lote em aberto, aguarda as gravações e fecha o gerenciador, fora do laço."""
+        if self._lote is not None:
+            gravacao = self._gravacao
+            self._encerrar_lote()
+            await gravacao
+        await asyncio.get_running_loop().run_in_executor(None, self.gerenciador.fechar)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, tipo_excecao, excecao, rastreamento):
+        await self.fechar()
@@ -0,0 +1,215 @@
+# gerenciador_tarefas/binario.py
+
+"""
+Formato binário compacto de persistência das tarefas.
+
+Layout (inteiros little-endian):
+
+    cabeçalho:  4s  mágico b"TARF"
+                H   versão do formato
+                H   reservado (zero)
+                Q   número de registros
+    registro:   I   tamanho do corpo, em bytes
+                corpo:
+                    B   campos de bits (ver as constantes BIT_*)
+                    16s ID, se for um UUID canônico (BIT_ID_UUID)
+                        ou H + bytes UTF-8 do ID em texto
+                    I   ordinal do dia de vencimento (BIT_VENCIMENTO_ORDINAL)
+                        ou H + JSON UTF-8 de outro valor de vencimento (BIT_VENCIMENTO_TEXTO)
+                    ... descrição em UTF-8, até o fim do corpo
+
+O prefixo de tamanho permite pular um registro sem decodificá-lo e acrescentar
+campos em versões futuras sem quebrar a leitura dos registros antigos.
+"""
+
+import json
+import struct
+from .tarefa import id_da_chave
+
+MAGICO = b"TARF"
+VERSAO_FORMATO = 1
+
+BIT_CONCLUIDA = 0x01
+BIT_ID_UUID = 0x02
+BIT_VENCIMENTO_ORDINAL = 0x04
+BIT_VENCIMENTO_TEXTO = 0x08
+
+_CABECALHO = struct.Struct("<4sHHQ")
+_TAMANHO = struct.Struct("<I")
+_TEXTO_CURTO = struct.Struct("<H")
+_ORDINAL = struct.Struct("<I")
+
+
+class ErroFormatoBinario(ValueError):
+    """O conteúdo não é um arquivo de tarefas binário válido (ou está truncado)."""
+
+
+def codificar_cabecalho(total_registros):
+    """Retorna os bytes do cabeçalho para um arquivo com o número de registros informado."""
+    return _CABECALHO.pack(MAGICO, VERSAO_FORMATO, 0, total_registros)
+
+
+def _texto_curto(texto):
+    # Texto UTF-8 precedido do tamanho em 2 bytes.
+    dados = texto.encode("utf-8")
+    if len(dados) > 0xFFFF:
+        raise ValueError("Texto longo demais para o formato binário (máximo de 65535 bytes).")
+    return _TEXTO_CURTO.pack(len(dados)) + dados
+
+
+def codificar_registro(chave, descricao, ordinal, data_vencimento, concluida):
+    """
+    Codifica uma tarefa como um registro com prefixo de tamanho.
+
+    Args:
+        chave: A chave compacta do ID (ver `chave_do_id`).
+        descricao (str): A descrição.
+        ordinal (int or None): O ordinal do dia de vencimento, se houver.
+        data_vencimento: A data de vencimento original, usada quando não há ordinal.
+        concluida (bool): O status de conclusão.
+
+    Returns:
+        bytes: O registro, incluindo o prefixo de tamanho.
+
+    Raises:
+        ValueError: Se o ID ou a data em texto excederem 65535 bytes.
+    """
+    bits = BIT_CONCLUIDA if concluida else 0
+    if type(chave) is int:
+        bits |= BIT_ID_UUID
+        partes = [chave.to_bytes(16, "big")]
+    else:
+        # IDs que não são texto são gravados como texto, o único tipo do formato.
+        partes = [_texto_curto(str(id_da_chave(chave)))]
+    if ordinal is not None:
+        bits |= BIT_VENCIMENTO_ORDINAL
+        partes.append(_ORDINAL.pack(ordinal))
+    elif data_vencimento is not None:
+        bits |= BIT_VENCIMENTO_TEXTO
+        partes.append(_texto_curto(json.dumps(data_vencimento, ensure_ascii=False)))
+    partes.append(descricao.encode("utf-8"))
+    corpo = bytes((bits,)) + b"".join(partes)
+    return _TAMANHO.pack(len(corpo)) + corpo
+
+
+def iterar_registros(dados):
+    """
+    Decodifica os registros de um arquivo binário completo.
+
+    Args:
+        dados (bytes): O conteúdo do arquivo.
+
+    Yields:
+        tuple: (chave, descricao, ordinal ou None, data_vencimento ou None, concluida).
+
+    Raises:
+        ErroFormatoBinario: Se o cabeçalho for inválido, a versão não for suportada ou
+                            o conteúdo estiver truncado.
+    """
+    if len(dados) < _CABECALHO.size:
+        raise ErroFormatoBinario("Cabeçalho ausente ou incompleto")
+    magico, versao, _, total = _CABECALHO.unpack_from(dados)
+    if magico != MAGICO:
+        raise ErroFormatoBinario("O arquivo não é um arquivo de tarefas binário")
+    if versao > VERSAO_FORMATO:
+        raise ErroFormatoBinario(f"Versão {versao} do formato não suportada (máxima: {VERSAO_FORMATO})")
+
+    visao = memoryview(dados)
+    pos = _CABECALHO.size
+    for numero in range(1, total + 1):
+        try:
+            campos, pos = _decodificar(dados, visao, pos)
+        except ErroFormatoBinario as e:
+            raise ErroFormatoBinario(f"{e} (registro {numero} de {total})") from None
+        yield campos
+
+
+def decodificar_registro(dados, inicio):
+    """
+    Decodifica um único registro, como os gerados por `codificar_registro`.
+
+    Args:
+        dados: Bytes (ou um mmap) que contêm o registro.
+        inicio (int): Posição do prefixo de tamanho do registro.
+
+    Returns:
+        tuple: ((chave, descricao, ordinal, data_vencimento, concluida), posição
+               logo após o registro).
+
+    Raises:
+        ErroFormatoBinario: Se o registro estiver truncado ou for inválido.
+    """
+    # Fatiar bytes ou um mmap já produz bytes; a memoryview só compensa na leitura
+    # sequencial de um arquivo inteiro.
+    return _decodificar(dados, dados, inicio)
+
+
+def decodificar_chave(dados, inicio):
+    """
+    Decodifica só a chave e o vencimento de um registro, sem a descrição e sem
+    conferir o registro inteiro, que é validado quando decodificado por completo
+    (ver `decodificar_registro`). Usado no carregamento preguiçoso.
+
+    Args:
+        dados (bytes): Bytes que contêm o registro.
+        inicio (int): Posição do prefixo de tamanho do registro.
+
+    Returns:
+        tuple: (chave, ordinal ou None, data_vencimento ou None).
+
+    Raises:
+        ErroFormatoBinario: Se o registro estiver truncado.
+    """
+    try:
+        pos = inicio + _TAMANHO.size
+        bits = dados[pos]
+        if bits & BIT_ID_UUID:
+            chave = int.from_bytes(dados[pos + 1:pos + 17], "big")
+            pos += 17
+        else:
+            (tamanho_id,) = _TEXTO_CURTO.unpack_from(dados, pos + 1)
+            chave = str(dados[pos + 3:pos + 3 + tamanho_id], "utf-8")
+            pos += 3 + tamanho_id
+        if bits & BIT_VENCIMENTO_ORDINAL:
+            return chave, _ORDINAL.unpack_from(dados, pos)[0], None
+        if bits & BIT_VENCIMENTO_TEXTO:
+            (tamanho_data,) = _TEXTO_CURTO.unpack_from(dados, pos)
+            return chave, None, json.loads(str(dados[pos + 2:pos + 2 + tamanho_data], "utf-8"))
+        return chave, None, None
+    except (IndexError, struct.error, ValueError) as e:
+        raise ErroFormatoBinario(f"Registro inválido: {e}") from None
+
+
+def _decodificar(dados, visao, pos):
+    """Decodifica o registro em `pos`, fatiando os textos de `visao`. Função privada."""
+    if pos < 0 or pos + _TAMANHO.size > len(dados):
+        raise ErroFormatoBinario("Arquivo truncado")
+    (tamanho,) = _TAMANHO.unpack_from(dados, pos)
+    pos += _TAMANHO.size
+    fim = pos + tamanho
+    if fim > len(dados) or tamanho == 0:
+        raise ErroFormatoBinario("Arquivo truncado")
+    try:
+        bits = dados[pos]
+        pos += 1
+        if bits & BIT_ID_UUID:
+            chave = int.from_bytes(visao[pos:pos + 16], "big")
+            pos += 16
+        else:
+            (tamanho_id,) = _TEXTO_CURTO.unpack_from(dados, pos)
+            chave = str(visao[pos + 2:pos + 2 + tamanho_id], "utf-8")
+            pos += 2 + tamanho_id
+        ordinal = data_vencimento = None
+        if bits & BIT_VENCIMENTO_ORDINAL:
+            (ordinal,) = _ORDINAL.unpack_from(dados, pos)
+            pos += _ORDINAL.size
+        elif bits & BIT_VENCIMENTO_TEXTO:
+            (tamanho_data,) = _TEXTO_CURTO.unpack_from(dados, pos)
+            data_vencimento = json.loads(str(visao[pos + 2:pos + 2 + tamanho_data], "utf-8"))
+            pos += 2 + tamanho_data
+        if pos > fim:
+            raise ValueError("campos além do tamanho do registro")
+        descricao = str(visao[pos:fim], "utf-8")
+    except (struct.error, ValueError) as e:
+        raise ErroFormatoBinario(f"Registro inválido: {e}") from None
+    return (chave, descricao, ordinal, data_vencimento, bool(bits & BIT_CONCLUIDA)), fim
@@ -0,0 +1,179 @@
+# gerenciador_tarefas/eventos.py
+
+"""
+Notificações da biblioteca: tarefas adicionadas, concluídas e removidas,
+carregamentos, erros de leitura e gravação etc.
+
+Em vez de escrever na saída padrão, o gerenciador e os armazenamentos emitem
+eventos para o notificador instalado no processo (ver `instalar`), de forma
+parecida com o módulo `logging`. O padrão é `NotificadorSilencioso`, que descarta
+tudo sem escrever nada; a linha de comando (`main.py`) instala um
+`NotificadorConsole`, que imprime as mensagens como antes.
+
+Cada evento tem um nível (DEPURACAO, INFORMACAO, AVISO ou ERRO), um tipo (por
+exemplo, "tarefa.adicionada" ou "carga.erro"), a mensagem em texto e dados
+estruturados, como o ID da tarefa ou o caminho do arquivo.
+"""
+
+import sys
+from collections import deque, namedtuple
+from contextlib import contextmanager
+
+DEPURACAO = 10
+INFORMACAO = 20
+AVISO = 30
+ERRO = 40
+
+NOMES_NIVEIS = {DEPURACAO: "DEPURACAO", INFORMACAO: "INFORMACAO", AVISO: "AVISO", ERRO: "ERRO"}
+
+
+class Evento(namedtuple("Evento", "nivel tipo mensagem dados")):
+    """Uma notificação: nível, tipo, mensagem em texto e dicionário de dados estruturados."""
+
+    @property
+    def nome_nivel(self):
+        """str: O nome do nível (por exemplo, "AVISO")."""
+        return NOMES_NIVEIS.get(self.nivel, str(self.nivel))
+
+
+class Notificador:
+    """
+    Interface dos destinos de eventos. Eventos abaixo de `nivel_minimo` não chegam a
+    `emitir`.
+    """
+    nivel_minimo = DEPURACAO
+
+    def emitir(self, evento):
+        """
+        Recebe um evento.
+
+        Args:
+            evento (Evento): O evento emitido.
+        """
+        raise NotImplementedError
+
+
+class NotificadorSilencioso(Notificador):
+    """Descarta todos os eventos. É o notificador padrão para o uso como biblioteca."""
+    nivel_minimo = float("inf")
+
+    def emitir(self, evento):
+        pass
+
+
+class NotificadorConsole(Notificador):
+    """Imprime a mensagem de cada evento, como a linha de comando sempre fez."""
+
+    def __init__(self, nivel_minimo=INFORMACAO, fluxo=None):
+        """
+        Args:
+            nivel_minimo (int, optional): Nível mínimo impresso. Defaults to INFORMACAO.
+            fluxo (optional): Arquivo de texto de destino. Se None, usa o `sys.stdout`
+                              vigente no momento de cada evento. Defaults to None.
+        """
+        self.nivel_minimo = nivel_minimo
+        self.fluxo = fluxo
+
+    def emitir(self, evento):
+        print(evento.mensagem, file=self.fluxo if self.fluxo is not None else sys.stdout)
+
+
+class NotificadorEmBuffer(Notificador):
+    """
+    Guarda os eventos em memória, para inspeção posterior ou para repassá-los de uma
+    vez a outro notificador (por exemplo, ao fim de um processamento em massa).
+    """
+
+    def __init__(self, capacidade=None, nivel_minimo=DEPURACAO):
+        """
+        Args:
+            capacidade (int, optional): Máximo de eventos guardados; acima dele, os mais
+                                        antigos são descartados. Se None, não há
+                                        limite. Defaults to None.
+            nivel_minimo (int, optional): Nível mínimo guardado. Defaults to DEPURACAO.
+        """
+        self.nivel_minimo = nivel_minimo
+        self._eventos = deque(maxlen=capacidade)
+
+    def emitir(self, evento):
+        self._eventos.append(evento)
+
+    @property
+    def eventos(self):
+        """list: Cópia dos eventos guardados, do mais antigo ao mais recente."""
+        return list(self._eventos)
+
+    def mensagens(self, nivel_minimo=DEPURACAO):
+        """Retorna as mensagens dos eventos guardados a partir de um nível."""
+        return [evento.mensagem for evento in list(self._eventos) if evento.nivel >= nivel_minimo]
+
+    def descarregar(self, destino):
+        """
+        Repassa os eventos guardados a outro notificador e esvazia o buffer.
+
+        Args:
+            destino (Notificador): Quem recebe os eventos (respeitando o nível mínimo dele).
+
+        Returns:
+            int: Quantos eventos foram retirados do buffer.
+        """
+        total = 0
+        while self._eventos:
+            evento = self._eventos.popleft()
+            total += 1
+            if evento.nivel >= destino.nivel_minimo:
+                destino.emitir(evento)
+        return total
+
+    def limpar(self):
+        """Descarta os eventos guardados."""
+        self._eventos.clear()
+
+
+_notificador = NotificadorSilencioso()
+
+
+def instalar(notificador):
+    """
+    Define o notificador que recebe os eventos de todo o processo.
+
+    Args:
+        notificador (Notificador): O novo notificador; None volta ao silencioso.
+
+    Returns:
+        Notificador: O notificador que estava instalado.
+    """
+    global _notificador
+    anterior = _notificador
+    _notificador = notificador if notificador is not None else NotificadorSilencioso()
+    return anterior
+
+
+def notificador_atual():
+    """Retorna o notificador instalado."""
+    return _notificador
+
+
+@contextmanager
+def usando(notificador):
+    """Instala um notificador durante o bloco `with` e restaura o anterior ao sair."""
+    anterior = instalar(notificador)
+    try:
+        yield notificador
+    finally:
+        instalar(anterior)
+
+
+def notificar(nivel, tipo, mensagem, **dados):
+    """
+    Emite um evento para o notificador instalado, se o nível for suficiente.
+
+    Args:
+        nivel (int): DEPURACAO, INFORMACAO, AVISO ou ERRO.
+        tipo (str): Identificador do evento, como "tarefa.adicionada".
+        mensagem (str): O texto do evento.
+        **dados: Dados estruturados do evento.
+    """
+    notificador = _notificador
+    if nivel >= notificador.nivel_minimo:
+        notificador.emitir(Evento(nivel, tipo, mensagem, dados))
@@ -0,0 +1,143 @@
+# gerenciador_tarefas/fragmentos.py
+
+"""
+Layout do armazenamento fragmentado (ver `ArmazenamentoFragmentado`).
+
+As tarefas ficam em um diretório com N arquivos JSON (os fragmentos) e um
+manifesto. Cada tarefa pertence ao fragmento indicado por um hash estável do seu
+ID (`fragmento_da_chave`), então uma alteração só precisa regravar o fragmento
+da tarefa alterada.
+
+    <diretório>/manifesto.json                 {"versao": 1, "fragmentos": N, "geracao": G}
+    <diretório>/fragmento-<G>-<0000..N-1>.json  lista JSON, um objeto por linha
+
+Cada objeto é o de `Tarefa.to_dict` com o campo adicional "posicao", um número
+crescente que preserva a ordem de inserção entre fragmentos diferentes. A geração
+muda quando todos os fragmentos são regravados de uma vez (salvar, refragmentar):
+os arquivos da nova geração são gravados ao lado dos antigos e só passam a valer
+quando o manifesto é trocado, o que torna a troca atômica.
+"""
+
+import json
+import os
+import zlib
+from .tarefa import Tarefa, id_da_chave
+
+MANIFESTO = "manifesto.json"
+VERSAO_FRAGMENTADO = 1
+
+
+def fragmento_da_chave(chave, total):
+    """
+    Retorna o fragmento de uma tarefa. O hash não depende do processo (ao contrário
+    de `hash()` para textos), de modo que todos os processos concordam.
+
+    Args:
+        chave: A chave compacta do ID (ver `chave_do_id`).
+        total (int): O número de fragmentos.
+
+    Returns:
+        int: O índice do fragmento, entre 0 e total - 1.
+    """
+    if type(chave) is int:
+        # UUIDs já são uniformemente distribuídos.
+        return chave % total
+    return zlib.crc32(str(id_da_chave(chave)).encode("utf-8")) % total
+
+
+def caminho_do_fragmento(diretorio, geracao, indice):
+    """Retorna o caminho do arquivo de um fragmento de uma geração."""
+    return os.path.join(diretorio, f"fragmento-{geracao}-{indice:04d}.json")
+
+
+def codificar_manifesto(fragmentos, geracao):
+    """Retorna o conteúdo do manifesto."""
+    return json.dumps({"versao": VERSAO_FRAGMENTADO, "fragmentos": fragmentos, "geracao": geracao})
+
+
+def ler_manifesto(diretorio):
+    """
+    Lê e valida o manifesto de um diretório de fragmentos.
+
+    Args:
+        diretorio (str): O diretório.
+
+    Returns:
+        tuple: (número de fragmentos, geração).
+
+    Raises:
+        FileNotFoundError: Se o manifesto não existir.
+        ValueError: Se o manifesto for inválido ou a versão não for suportada.
+    """
+    with open(os.path.join(diretorio, MANIFESTO), "r", encoding="utf-8") as f:
+        dados = json.load(f)
+    if not isinstance(dados, dict):
+        raise ValueError("O manifesto não é um objeto JSON")
+    if dados.get("versao", 0) > VERSAO_FRAGMENTADO:
+        raise ValueError(f"Versão {dados['versao']} do formato não suportada (máxima: {VERSAO_FRAGMENTADO})")
+    fragmentos, geracao = dados.get("fragmentos"), dados.get("geracao", 0)
+    if type(fragmentos) is not int or fragmentos < 1 or type(geracao) is not int:
+        raise ValueError("Número de fragmentos ou geração inválidos")
+    return fragmentos, geracao
+
+
+def escrever_fragmento(f, registros):
+    """
+    Escreve um fragmento: uma lista JSON com um objeto por linha.
+
+    Args:
+        f: Arquivo aberto em modo texto.
+        registros (iterable): Pares (posição, dicionário da tarefa).
+    """
+    f.write("[")
+    separador = "\n"
+    for posicao, dados in registros:
+        f.write(separador)
+        f.write(json.dumps(dict(dados, posicao=posicao), ensure_ascii=False))
+        separador = ",\n"
+    f.write("\n]\n")
+
+
+def ler_fragmento(caminho):
+    """
+    Lê e valida um fragmento. Executada nos processos do pool, por isso retorna as
+    tarefas na forma compacta (ver `Tarefa._de_forma_compacta`), que é bem mais
+    barata de serializar com pickle do que objetos Tarefa.
+
+    Args:
+        caminho (str): O arquivo do fragmento.
+
+    Returns:
+        tuple: (registros, erros, ignorados). Os registros são tuplas (posição, chave,
+               descrição, ordinal, data_vencimento, concluída), ordenadas pela posição;
+               os erros são mensagens sobre o arquivo ou sobre registros ignorados, e
+               ignorados é o número desses registros.
+    """
+    try:
+        with open(caminho, "r", encoding="utf-8") as f:
+            dados = json.load(f)
+    except FileNotFoundError:
+        return [], [f"Fragmento {caminho} não encontrado"], 0
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        return [], [f"Erro ao decodificar JSON do fragmento {caminho}: {e}"], 0
+    except IOError as e:
+        return [], [f"Erro de E/S ao tentar ler o fragmento {caminho}: {e}"], 0
+    if not isinstance(dados, list):
+        return [], [f"O conteúdo do fragmento {caminho} não é uma lista JSON válida"], 0
+
+    registros, erros = [], []
+    for data in dados:
+        try:
+            posicao = data.get("posicao") if isinstance(data, dict) else None
+            if type(posicao) is not int:
+                raise ValueError("posição ausente ou inválida")
+            tarefa = Tarefa.from_dict(data)
+            ordinal = tarefa.vencimento_ordinal
+            registros.append((
+                posicao, tarefa.chave, tarefa.descricao, ordinal,
+                None if ordinal is not None else tarefa.data_vencimento, tarefa.concluida,
+            ))
+        except (ValueError, TypeError) as ve:
+            erros.append(f"Erro nos dados ao carregar uma tarefa do fragmento {caminho}: {ve}. Tarefa ignorada.")
+    registros.sort(key=lambda registro: registro[0])
+    return registros, erros, len(erros)
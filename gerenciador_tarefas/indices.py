@@ -0,0 +1,446 @@
+# gerenciador_tarefas/indices.py
+
+import bisect
+import re
+import unicodedata
+from datetime import date
+from .tarefa import id_da_chave
+
+# Um termo é uma sequência de letras e dígitos.
+_TERMO = re.compile(r"\w+")
+
+# Marcas diacríticas combinantes, separadas das letras pela normalização NFKD.
+_DIACRITICOS = re.compile(r"[\u0300-\u036f]")
+
+# Início de um UUID canônico: dígitos hexadecimais minúsculos e hífens.
+_PREFIXO_UUID = re.compile(r"[0-9a-f-]{1,36}")
+
+# Quantos IDs candidatos são mostrados quando um prefixo é ambíguo.
+MAX_CANDIDATOS_EXIBIDOS = 5
+
+
+def ordinal_da_data(data):
+    """
+    Converte uma data para o ordinal do dia, a forma usada no índice de vencimentos.
+
+    Args:
+        data (str or datetime.date): Data no formato YYYY-MM-DD ou objeto date.
+
+    Returns:
+        int: O ordinal da data (ver `date.toordinal`).
+
+    Raises:
+        ValueError: Se a data não estiver no formato YYYY-MM-DD.
+    """
+    if isinstance(data, date):
+        return data.toordinal()
+    try:
+        dia = date.fromisoformat(data)
+    except (TypeError, ValueError):
+        dia = None
+    # A partir do Python 3.11, `fromisoformat` aceita outras formas ISO 8601, como
+    # "20250105"; como em `tarefa._ordinal_da_data`, só YYYY-MM-DD é aceito.
+    if dia is None or dia.isoformat() != data:
+        raise ValueError(f"Data inválida: '{data}'. Use o formato YYYY-MM-DD.")
+    return dia.toordinal()
+
+
+class IndiceStatus:
+    """
+    Particiona as chaves das tarefas entre pendentes e concluídas.
+
+    Cada chave recebe, ao entrar no índice, um número de sequência que mantém ao
+    mudar de status. Cada partição é uma lista ordenada de pares (sequência, chave),
+    buscada com `bisect`, então as chaves de um status saem na ordem de inserção
+    das tarefas, e não na ordem em que passaram a ter o status. Inserir uma chave
+    nova é um `append`; mover ou remover uma chave custa O(log n) na busca mais o
+    deslocamento da lista.
+    """
+    def __init__(self):
+        self.limpar()
+
+    def adicionar(self, chave, concluida):
+        """Coloca a chave na partição do status informado, retirando-a da outra."""
+        concluida = bool(concluida)
+        atual = self._por_chave.get(chave)
+        if atual is None:
+            sequencia = self._proxima_sequencia
+            self._proxima_sequencia += 1
+        else:
+            sequencia, status = atual
+            if status == concluida:
+                return
+            self._retirar(sequencia, status)
+        # A sequência é única e crescente: a chave nova vai para o fim da lista.
+        bisect.insort(self._particoes[concluida], (sequencia, chave))
+        self._por_chave[chave] = (sequencia, concluida)
+
+    def remover(self, chave):
+        """Retira a chave do índice. Chaves ausentes são ignoradas."""
+        atual = self._por_chave.pop(chave, None)
+        if atual is not None:
+            self._retirar(*atual)
+
+    def _retirar(self, sequencia, concluida):
+        # (sequência,) é prefixo da entrada, então bisect_left a encontra.
+        particao = self._particoes[concluida]
+        del particao[bisect.bisect_left(particao, (sequencia,))]
+
+    def contem(self, chave, concluida):
+        """Retorna True se a chave está na partição do status informado."""
+        atual = self._por_chave.get(chave)
+        return atual is not None and atual[1] == bool(concluida)
+
+    def chaves(self, concluida):
+        """Retorna um iterador sobre as chaves do status informado, na ordem de inserção."""
+        return (chave for _, chave in self._particoes[bool(concluida)])
+
+    def reconstruir(self, pares):
+        """
+        Substitui o conteúdo do índice de uma vez, sem buscas.
+
+        Args:
+            pares (iterable): Pares (chave, concluida), na ordem de inserção.
+        """
+        self.limpar()
+        particoes, por_chave = self._particoes, self._por_chave
+        for sequencia, (chave, concluida) in enumerate(pares):
+            concluida = bool(concluida)
+            particoes[concluida].append((sequencia, chave))
+            por_chave[chave] = (sequencia, concluida)
+        self._proxima_sequencia = len(particoes[False]) + len(particoes[True])
+
+    def limpar(self):
+        """Esvazia o índice."""
+        self._particoes = {False: [], True: []}
+        self._por_chave = {}
+        self._proxima_sequencia = 0
+
+
+class IndiceVencimento:
+    """
+    Mantém as chaves das tarefas ordenadas pela data de vencimento.
+
+    As entradas são tuplas (ordinal, sequência, chave) em uma lista ordenada, buscada
+    com `bisect`; a sequência desempata tarefas com a mesma data pela ordem de inserção
+    (e evita comparar chaves de tipos diferentes). Tarefas sem data válida não entram.
+    """
+    def __init__(self):
+        self._entradas = []
+        self._por_chave = {}
+        self._proxima_sequencia = 0
+
+    def adicionar(self, chave, ordinal):
+        """
+        Indexa (ou reindexa) a chave com o ordinal da data de vencimento.
+        Com ordinal None, a chave apenas deixa de estar indexada.
+        """
+        self.remover(chave)
+        if ordinal is None:
+            return
+        entrada = (ordinal, self._proxima_sequencia, chave)
+        self._proxima_sequencia += 1
+        bisect.insort(self._entradas, entrada)
+        self._por_chave[chave] = entrada[:2]
+
+    def remover(self, chave):
+        """Retira a chave do índice. Chaves ausentes são ignoradas."""
+        posicao = self._por_chave.pop(chave, None)
+        if posicao is not None:
+            # (ordinal, sequência) é prefixo da entrada, então bisect_left a encontra.
+            del self._entradas[bisect.bisect_left(self._entradas, posicao)]
+
+    def intervalo(self, inicio=None, fim=None):
+        """
+        Retorna as chaves com vencimento entre dois ordinais, inclusive, em ordem de data.
+
+        Args:
+            inicio (int, optional): Ordinal mínimo; None para não limitar.
+            fim (int, optional): Ordinal máximo; None para não limitar.
+
+        Returns:
+            list: As chaves no intervalo.
+        """
+        baixo = 0 if inicio is None else bisect.bisect_left(self._entradas, (inicio,))
+        alto = len(self._entradas) if fim is None else bisect.bisect_left(self._entradas, (fim + 1,))
+        return [entrada[2] for entrada in self._entradas[baixo:alto]]
+
+    def reconstruir(self, pares):
+        """
+        Substitui o conteúdo do índice de uma vez, ordenando uma única vez.
+
+        Args:
+            pares (iterable): Pares (chave, ordinal); ordinais None são ignorados.
+        """
+        self._entradas = []
+        self._por_chave = {}
+        sequencia = 0
+        for chave, ordinal in pares:
+            if ordinal is not None:
+                self._entradas.append((ordinal, sequencia, chave))
+                self._por_chave[chave] = (ordinal, sequencia)
+                sequencia += 1
+        self._proxima_sequencia = sequencia
+        self._entradas.sort()
+
+    def __len__(self):
+        return len(self._entradas)
+
+
+def normalizar_texto(texto):
+    """
+    Remove acentos e diferenças de maiúsculas/minúsculas de um texto, para que
+    "Ação" e "acao" sejam o mesmo termo.
+    """
+    return _DIACRITICOS.sub("", unicodedata.normalize("NFKD", texto)).casefold()
+
+
+def termos_do_texto(texto):
+    """Retorna a lista de termos normalizados de um texto, na ordem em que aparecem."""
+    return _TERMO.findall(normalizar_texto(texto))
+
+
+class IndiceTexto:
+    """
+    Índice invertido das descrições: cada termo normalizado (ver `normalizar_texto`)
+    aponta para as chaves das tarefas que o contêm.
+
+    Os termos também ficam em uma lista ordenada, para que a busca por prefixo seja
+    um `bisect` seguido de uma varredura apenas dos termos com aquele prefixo; depois
+    de `reconstruir`, essa lista só é ordenada na primeira busca por prefixo. Cada
+    chave recebe um número de sequência ao ser indexada, usado para devolver os
+    resultados na ordem de inserção sem percorrer todas as tarefas.
+    """
+    def __init__(self):
+        self._postagens = {}
+        self._termos_ordenados = []
+        self._por_chave = {}
+        self._proxima_sequencia = 0
+
+    def adicionar(self, chave, texto):
+        """Indexa a chave com os termos do texto. Reindexar mantém a posição da chave."""
+        anterior = self._por_chave.get(chave)
+        if anterior is None:
+            sequencia = self._proxima_sequencia
+            self._proxima_sequencia += 1
+        else:
+            sequencia = anterior[0]
+            self.remover(chave)
+        termos = frozenset(termos_do_texto(texto)) if isinstance(texto, str) else frozenset()
+        self._por_chave[chave] = (sequencia, termos)
+        for termo in termos:
+            chaves = self._postagens.get(termo)
+            if chaves is None:
+                chaves = self._postagens[termo] = set()
+                if self._termos_ordenados is not None:
+                    bisect.insort(self._termos_ordenados, termo)
+            chaves.add(chave)
+
+    def remover(self, chave):
+        """Retira a chave do índice. Chaves ausentes são ignoradas."""
+        entrada = self._por_chave.pop(chave, None)
+        if entrada is None:
+            return
+        for termo in entrada[1]:
+            chaves = self._postagens[termo]
+            chaves.discard(chave)
+            if not chaves:
+                del self._postagens[termo]
+                if self._termos_ordenados is not None:
+                    del self._termos_ordenados[bisect.bisect_left(self._termos_ordenados, termo)]
+
+    def reconstruir(self, pares):
+        """
+        Substitui o conteúdo do índice de uma vez, adiando a ordenação dos termos.
+
+        Args:
+            pares (iterable): Pares (chave, texto), na ordem de inserção.
+        """
+        self.limpar()
+        self._termos_ordenados = None
+        for chave, texto in pares:
+            self.adicionar(chave, texto)
+
+    def limpar(self):
+        """Esvazia o índice."""
+        self._postagens = {}
+        self._termos_ordenados = []
+        self._por_chave = {}
+
+    def _chaves_do_termo(self, termo, prefixo):
+        # Conjunto de chaves que contêm o termo (ou algum termo com esse prefixo).
+        if not prefixo:
+            return self._postagens.get(termo, set())
+        chaves = set()
+        if self._termos_ordenados is None:
+            self._termos_ordenados = sorted(self._postagens)
+        termos = self._termos_ordenados
+        posicao = bisect.bisect_left(termos, termo)
+        while posicao < len(termos) and termos[posicao].startswith(termo):
+            chaves |= self._postagens[termos[posicao]]
+            posicao += 1
+        return chaves
+
+    def buscar(self, consulta):
+        """
+        Retorna as chaves que atendem a uma consulta, na ordem em que foram indexadas.
+
+        Os termos da consulta são normalizados como as descrições. Termos separados
+        por espaço devem aparecer todos (E implícito; "E" e "AND" também são aceitos);
+        "OU" ou "OR", em maiúsculas, separam alternativas. Um termo terminado em "*"
+        casa com qualquer termo que comece com ele.
+
+        Args:
+            consulta (str): O texto da consulta, por exemplo "relatório OU planilha mensa*".
+
+        Returns:
+            list: As chaves encontradas.
+        """
+        encontradas = set()
+        for alternativa in re.split(r"\s+(?:OU|OR)\s+", consulta.strip()):
+            grupo = None
+            for palavra in alternativa.split():
+                if palavra in ("E", "AND"):
+                    continue
+                termos = termos_do_texto(palavra)
+                for posicao, termo in enumerate(termos):
+                    prefixo = posicao == len(termos) - 1 and palavra.endswith("*")
+                    chaves = self._chaves_do_termo(termo, prefixo)
+                    # Interseção a partir do menor conjunto.
+                    grupo = set(chaves) if grupo is None else (
+                        grupo & chaves if len(grupo) <= len(chaves) else chaves & grupo
+                    )
+                    if not grupo:
+                        break
+                if grupo is not None and not grupo:
+                    break
+            if grupo:
+                encontradas |= grupo
+        return sorted(encontradas, key=lambda chave: self._por_chave[chave][0])
+
+    def __len__(self):
+        return len(self._por_chave)
+
+
+class ErroIdAmbiguo(ValueError):
+    """O prefixo informado corresponde ao ID de mais de uma tarefa."""
+
+    def __init__(self, prefixo, candidatos, total):
+        """
+        Args:
+            prefixo (str): O prefixo informado.
+            candidatos (list): Alguns dos IDs correspondentes, em ordem.
+            total (int): Quantos IDs correspondem ao prefixo.
+        """
+        super().__init__(
+            f"O ID '{prefixo}' é ambíguo: corresponde a {total} tarefas "
+            f"({', '.join(candidatos)}{', ...' if total > len(candidatos) else ''}). "
+            "Digite mais caracteres do ID."
+        )
+        self.prefixo = prefixo
+        self.candidatos = candidatos
+        self.total = total
+
+
+class IndiceIds:
+    """
+    Mantém as chaves dos IDs ordenadas para resolver IDs abreviados (prefixos).
+
+    As chaves de UUIDs canônicos são inteiros (ver `chave_do_id`) e os demais IDs são
+    textos; cada grupo fica em sua própria lista ordenada. Como a ordem dos inteiros é
+    a mesma do texto hexadecimal, um prefixo de UUID corresponde a um intervalo
+    contíguo de inteiros, encontrado com `bisect` em O(log n). As listas guardam
+    referências às mesmas chaves do índice principal, sem cópias dos textos.
+    """
+    def __init__(self):
+        self._uuids = []
+        self._outros = []
+
+    def _lista(self, chave):
+        # Lista ordenada em que a chave fica, ou None para IDs que não são texto.
+        if type(chave) is int:
+            return self._uuids
+        if type(chave) is str:
+            return self._outros
+        return None
+
+    def adicionar(self, chave):
+        """Indexa a chave de um ID."""
+        lista = self._lista(chave)
+        if lista is not None:
+            bisect.insort(lista, chave)
+
+    def remover(self, chave):
+        """Retira a chave do índice. Chaves ausentes são ignoradas."""
+        lista = self._lista(chave)
+        if lista is not None:
+            posicao = bisect.bisect_left(lista, chave)
+            if posicao < len(lista) and lista[posicao] == chave:
+                del lista[posicao]
+
+    def reconstruir(self, chaves):
+        """Substitui o conteúdo do índice de uma vez, ordenando uma única vez."""
+        self._uuids = []
+        self._outros = []
+        for chave in chaves:
+            lista = self._lista(chave)
+            if lista is not None:
+                lista.append(chave)
+        self._uuids.sort()
+        self._outros.sort()
+
+    def _intervalos(self, prefixo):
+        # Pares (lista, início, fim) com as posições das chaves que têm o prefixo.
+        intervalos = []
+        if _PREFIXO_UUID.fullmatch(prefixo):
+            digitos = prefixo.replace("-", "")
+            if len(digitos) <= 32:
+                deslocamento = 4 * (32 - len(digitos))
+                menor = int(digitos, 16) << deslocamento if digitos else 0
+                # Os hífens do prefixo precisam estar nas posições do formato canônico.
+                if id_da_chave(menor).startswith(prefixo):
+                    intervalos.append((
+                        self._uuids,
+                        bisect.bisect_left(self._uuids, menor),
+                        bisect.bisect_left(self._uuids, menor + (1 << deslocamento)),
+                    ))
+        # Os textos com o prefixo ficam entre ele e o primeiro texto maior que todos
+        # eles: o prefixo com o último caractere incrementado.
+        intervalos.append((
+            self._outros,
+            bisect.bisect_left(self._outros, prefixo),
+            bisect.bisect_left(self._outros, prefixo[:-1] + chr(ord(prefixo[-1]) + 1)),
+        ))
+        return intervalos
+
+    def resolver(self, prefixo):
+        """
+        Encontra a única chave cujo ID começa com o prefixo.
+
+        Args:
+            prefixo (str): O ID completo ou o seu início.
+
+        Returns:
+            A chave encontrada, ou None se nenhum ID começar com o prefixo.
+
+        Raises:
+            ErroIdAmbiguo: Se mais de um ID começar com o prefixo.
+        """
+        if not prefixo:
+            return None
+        intervalos = self._intervalos(prefixo)
+        total = sum(fim - inicio for _, inicio, fim in intervalos)
+        if total == 0:
+            return None
+        if total > 1:
+            candidatos = []
+            for lista, inicio, fim in intervalos:
+                fim = min(fim, inicio + MAX_CANDIDATOS_EXIBIDOS - len(candidatos))
+                candidatos.extend(id_da_chave(chave) for chave in lista[inicio:fim])
+            raise ErroIdAmbiguo(prefixo, candidatos, total)
+        for lista, inicio, fim in intervalos:
+            if fim > inicio:
+                return lista[inicio]
+
+    def __len__(self):
+        return len(self._uuids) + len(self._outros)
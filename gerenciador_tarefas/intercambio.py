@@ -0,0 +1,183 @@
+# gerenciador_tarefas/intercambio.py
+
+import csv
+import json
+import os
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+from .tarefa import Tarefa
+
+# Formatos de importação e exportação, deduzidos pela extensão do arquivo.
+EXTENSOES_FORMATOS = {".ndjson": "ndjson", ".jsonl": "ndjson", ".csv": "csv"}
+
+# Colunas do formato CSV, na ordem em que são exportadas.
+COLUNAS_CSV = ("id", "descricao", "data_vencimento", "concluida")
+
+# Quantidade de registros enviados de uma vez para validação (em um processo do pool).
+TAMANHO_BLOCO_IMPORTACAO = 5000
+
+_VERDADEIROS = ("true", "1", "sim", "verdadeiro")
+_FALSOS = ("false", "0", "nao", "não", "falso", "")
+
+
+class ResultadoImportacao(namedtuple("ResultadoImportacao", "importadas duplicadas invalidas segundos")):
+    """Resumo de uma importação: quantos registros entraram, foram ignorados e o tempo gasto."""
+
+    @property
+    def registros_por_segundo(self):
+        """float: Registros lidos (importados ou não) por segundo."""
+        total = self.importadas + self.duplicadas + self.invalidas
+        return total / self.segundos if self.segundos > 0 else float("inf")
+
+
+def formato_do_caminho(caminho, formato=None):
+    """
+    Determina o formato de importação/exportação de um arquivo.
+
+    Args:
+        caminho (str): Caminho do arquivo.
+        formato (str, optional): "ndjson" ou "csv". Se None, é deduzido pela extensão
+                                 (.ndjson, .jsonl ou .csv). Defaults to None.
+
+    Returns:
+        str: "ndjson" ou "csv".
+
+    Raises:
+        ValueError: Se o formato não for reconhecido.
+    """
+    if formato is None:
+        formato = EXTENSOES_FORMATOS.get(os.path.splitext(caminho)[1].lower())
+    if formato not in ("ndjson", "csv"):
+        raise ValueError(f"Formato de importação/exportação desconhecido para '{caminho}'. Use ndjson ou csv.")
+    return formato
+
+
+def _registro_do_csv(linha):
+    """Converte uma linha do CSV (dicionário de textos) no dicionário aceito por `Tarefa.from_dict`."""
+    concluida = (linha.get("concluida") or "").strip().lower()
+    if concluida not in _VERDADEIROS and concluida not in _FALSOS:
+        raise ValueError(f"Valor inválido para 'concluida': '{linha.get('concluida')}'")
+    return {
+        "id": linha.get("id") or None,
+        "descricao": linha.get("descricao"),
+        "data_vencimento": linha.get("data_vencimento") or None,
+        "concluida": concluida in _VERDADEIROS,
+    }
+
+
+def validar_bloco(formato, bloco):
+    """
+    Decodifica e valida um bloco de registros. Executada nos processos do pool, por
+    isso recebe e retorna apenas dados serializáveis com pickle.
+
+    Args:
+        formato (str): "ndjson" (registros são linhas de texto) ou "csv" (registros
+                       são dicionários lidos pelo `csv.DictReader`).
+        bloco (list): Pares (número da linha, registro).
+
+    Returns:
+        list: Triplas (número da linha, Tarefa ou None, mensagem de erro ou None).
+    """
+    resultado = []
+    for numero, registro in bloco:
+        try:
+            dados = json.loads(registro) if formato == "ndjson" else _registro_do_csv(registro)
+            tarefa = Tarefa.from_dict(dados)
+            # Um ID que não pode ser chave de dicionário (como uma lista) levanta TypeError.
+            hash(tarefa.chave)
+            resultado.append((numero, tarefa, None))
+        except (ValueError, TypeError) as e:
+            resultado.append((numero, None, str(e)))
+    return resultado
+
+
+def _iterar_blocos(arquivo, formato, tamanho_bloco):
+    """Lê o arquivo em blocos de pares (número da linha, registro), sem carregá-lo inteiro."""
+    if formato == "ndjson":
+        registros = ((numero, linha) for numero, linha in enumerate(arquivo, start=1) if linha.strip())
+    else:
+        leitor = csv.DictReader(arquivo)
+        if leitor.fieldnames is None or "descricao" not in leitor.fieldnames:
+            raise ValueError("O cabeçalho do CSV não tem a coluna 'descricao'.")
+        registros = ((leitor.line_num, linha) for linha in leitor)
+    bloco = []
+    for registro in registros:
+        bloco.append(registro)
+        if len(bloco) == tamanho_bloco:
+            yield bloco
+            bloco = []
+    if bloco:
+        yield bloco
+
+
+def validar_registros(arquivo, formato, processos=None, tamanho_bloco=TAMANHO_BLOCO_IMPORTACAO):
+    """
+    Lê, decodifica e valida os registros de um arquivo NDJSON ou CSV.
+
+    A leitura é sequencial e a validação é feita por blocos. Se o arquivo tiver mais de
+    um bloco, os blocos são validados em paralelo em um pool de processos, com no máximo
+    dois blocos por processo em andamento, de modo que a memória usada é limitada pelo
+    tamanho do bloco e não pelo tamanho do arquivo. Os resultados saem na ordem do arquivo.
+
+    Args:
+        arquivo: Arquivo aberto em modo texto (com newline="" no caso de CSV).
+        formato (str): "ndjson" ou "csv".
+        processos (int, optional): Número de processos do pool; 1 valida no próprio
+                                   processo. Se None, usa o número de CPUs. Defaults to None.
+        tamanho_bloco (int, optional): Registros por bloco. Defaults to TAMANHO_BLOCO_IMPORTACAO.
+
+    Yields:
+        tuple: (número da linha, Tarefa ou None, mensagem de erro ou None).
+
+    Raises:
+        ValueError: Se o cabeçalho do CSV não tiver a coluna "descricao".
+    """
+    processos = processos or os.cpu_count() or 1
+    blocos = _iterar_blocos(arquivo, formato, tamanho_bloco)
+    iniciais = list(islice(blocos, 2))
+    todos = chain(iniciais, blocos)
+    if len(iniciais) < 2 or processos == 1:
+        # Um único bloco não compensa o custo de iniciar os processos.
+        for bloco in todos:
+            yield from validar_bloco(formato, bloco)
+        return
+
+    with ProcessPoolExecutor(max_workers=processos) as pool:
+        pendentes = deque()
+        for bloco in todos:
+            if len(pendentes) >= 2 * processos:
+                yield from pendentes.popleft().result()
+            pendentes.append(pool.submit(validar_bloco, formato, bloco))
+        while pendentes:
+            yield from pendentes.popleft().result()
+
+
+def escrever_tarefas(arquivo, formato, tarefas):
+    """
+    Escreve tarefas em NDJSON (um objeto por linha) ou CSV (com cabeçalho).
+
+    Args:
+        arquivo: Arquivo aberto em modo texto.
+        formato (str): "ndjson" ou "csv".
+        tarefas (iterable): As tarefas a escrever, consumidas uma a uma.
+
+    Returns:
+        int: Quantas tarefas foram escritas.
+    """
+    total = 0
+    if formato == "ndjson":
+        for tarefa in tarefas:
+            arquivo.write(json.dumps(tarefa.to_dict(), ensure_ascii=False))
+            arquivo.write("\n")
+            total += 1
+        return total
+    escritor = csv.writer(arquivo, lineterminator="\n")
+    escritor.writerow(COLUNAS_CSV)
+    for tarefa in tarefas:
+        escritor.writerow((
+            tarefa.id, tarefa.descricao, tarefa.data_vencimento or "",
+            "true" if tarefa.concluida else "false",
+        ))
+        total += 1
+    return total
@@ -0,0 +1,127 @@
+# gerenciador_tarefas/json_incremental.py
+
+import json
+import re
+
+# Espaços em branco aceitos entre tokens JSON.
+_ESPACOS = re.compile(r"[ \t\n\r]*")
+
+# Separador entre elementos, com os espaços ao redor (caminho rápido do laço principal).
+_SEPARADOR = re.compile(r"[ \t\n\r]*([,\]])[ \t\n\r]*")
+
+# Caracteres que podem continuar um número JSON.
+_CARACTERES_NUMERICOS = frozenset("0123456789+-.eE")
+
+# Quantidade de caracteres lidos do arquivo por vez.
+TAMANHO_BLOCO = 64 * 1024
+
+
+class ErroConteudoNaoLista(ValueError):
+    """O arquivo contém JSON válido, mas o valor de nível superior não é uma lista."""
+
+
+def iterar_array_json(arquivo, tamanho_bloco=TAMANHO_BLOCO):
+    """
+    Percorre os elementos do array JSON de nível superior de um arquivo, um por vez.
+
+    O arquivo é lido em blocos e cada elemento é decodificado com
+    `json.JSONDecoder.raw_decode` assim que está completo no buffer, de modo que
+    apenas um bloco e o elemento corrente ficam em memória, e não o texto inteiro
+    nem a lista inteira de dicionários.
+
+    Args:
+        arquivo: Arquivo aberto em modo texto.
+        tamanho_bloco (int, optional): Caracteres lidos por vez. Defaults to TAMANHO_BLOCO.
+
+    Yields:
+        object: Cada elemento do array, já decodificado.
+
+    Raises:
+        json.JSONDecodeError: Se o conteúdo não for JSON válido.
+        ErroConteudoNaoLista: Se o conteúdo for JSON válido mas não for uma lista.
+    """
+    # `scan_once` é o analisador (em C, quando disponível) por trás de `raw_decode`;
+    # chamá-lo diretamente evita uma camada por elemento.
+    analisar = json.JSONDecoder().scan_once
+    buffer = ""
+    pos = 0
+    fim_do_arquivo = False
+    leitura = tamanho_bloco
+
+    def ler_mais():
+        # Descarta o que já foi consumido e anexa o próximo bloco ao buffer.
+        nonlocal buffer, pos, fim_do_arquivo
+        bloco = arquivo.read(leitura)
+        if not bloco:
+            fim_do_arquivo = True
+        buffer = buffer[pos:] + bloco
+        pos = 0
+
+    def pular_espacos():
+        # Avança sobre espaços; retorna o próximo caractere ou "" no fim do arquivo.
+        nonlocal pos
+        while True:
+            pos = _ESPACOS.match(buffer, pos).end()
+            if pos < len(buffer) or fim_do_arquivo:
+                return buffer[pos:pos + 1]
+            ler_mais()
+
+    def erro(mensagem):
+        return json.JSONDecodeError(mensagem, buffer, pos)
+
+    primeiro = pular_espacos()
+    if primeiro != "[":
+        # Não é um array: decodifica o restante de uma vez apenas para distinguir
+        # JSON válido de outro tipo (ex.: um objeto) de conteúdo corrompido.
+        resto = buffer[pos:] + arquivo.read()
+        json.loads(resto)
+        raise ErroConteudoNaoLista("O valor de nível superior não é uma lista.")
+    pos += 1
+
+    if pular_espacos() == "]":
+        pos += 1
+    else:
+        while True:
+            while True:
+                try:
+                    elemento, fim = analisar(buffer, pos)
+                except (StopIteration, json.JSONDecodeError) as e:
+                    if fim_do_arquivo:
+                        if isinstance(e, StopIteration):
+                            raise erro("Esperado um valor") from None
+                        raise
+                    elemento = fim = None
+                # Um número seguido apenas do fim do buffer, ou de um caractere que
+                # poderia continuá-lo, pode ter sido cortado na fronteira do bloco
+                # (ex.: "-1.5" de "-1.5e10"); nesse caso lê mais antes de aceitá-lo.
+                if fim is not None and (fim_do_arquivo or not (
+                    fim == len(buffer) or (
+                        isinstance(elemento, (int, float)) and buffer[fim] in _CARACTERES_NUMERICOS
+                    )
+                )):
+                    break
+                ler_mais()
+                # Elementos maiores que um bloco: dobra a leitura para não decodificar
+                # o mesmo prefixo repetidas vezes.
+                leitura *= 2
+            leitura = tamanho_bloco
+            pos = fim
+            yield elemento
+
+            correspondencia = _SEPARADOR.match(buffer, pos)
+            if correspondencia and (correspondencia.end() < len(buffer) or fim_do_arquivo):
+                separador = correspondencia.group(1)
+                pos = correspondencia.end()
+            else:
+                # Separador ausente ou cortado na fronteira do bloco.
+                separador = pular_espacos()
+                if separador not in (",", "]"):
+                    raise erro("Esperado ',' ou ']' entre os elementos da lista")
+                pos += 1
+                if separador == ",":
+                    pular_espacos()
+            if separador == "]":
+                break
+
+    if pular_espacos():
+        raise erro("Dados extras após o fim da lista")
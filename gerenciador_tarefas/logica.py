@@ -1,14 +1,41 @@
 # gerenciador_tarefas/logica.py
 
-import json
-from .tarefa import Tarefa
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
+from datetime import date
+from .adiamento import GravadorAdiado
+from .armazenamento import ArmazenamentoJSON, _gravar_atomicamente
+from .eventos import ERRO, INFORMACAO, notificar
+from .indices import ErroIdAmbiguo, IndiceIds, IndiceStatus, IndiceTexto, IndiceVencimento, ordinal_da_data
+from .intercambio import ResultadoImportacao, escrever_tarefas, formato_do_caminho, validar_registros
+from .metricas import SEM_MEDICAO
+from .tarefa import Tarefa, chave_do_id, ordinal_do_vencimento
+from .trava import TravaLeituraEscrita
+
+# Métodos públicos contados e cronometrados quando a coleta de métricas está ativa,
+# com o nome da operação usado nas métricas (ver o módulo `metricas`).
+OPERACOES_INSTRUMENTADAS = {
+    "adicionar_tarefa": "adicionar",
+    "marcar_tarefa_como_concluida": "concluir",
+    "remover_tarefa": "remover",
+    "encontrar_tarefa_por_id": "encontrar",
+    "visualizar_tarefas": "visualizar",
+    "buscar_tarefas": "buscar",
+    "importar": "importar",
+    "exportar": "exportar",
+    "limpar_todas_as_tarefas": "limpar",
+}
 
 class GerenciadorDeTarefas:
     """
     Gerencia a coleção de tarefas, permitindo adicionar, remover,
     visualizar e modificar tarefas.
     """
-    def __init__(self, arquivo_json="tarefas.json"):
+    def __init__(self, arquivo_json="tarefas.json", usar_diario=False, politica_fsync="sempre",
+                 carregamento_preguicoso=False, armazenamento=None, gravar_em_segundo_plano=False,
+                 metricas=None, adiar_gravacao=None, atraso_maximo_gravacao=None):
         """
         Inicializa o gerenciador de tarefas.
         Tenta carregar tarefas de um arquivo JSON, se existir.
@@ -16,10 +43,143 @@ class GerenciadorDeTarefas:
         Args:
             arquivo_json (str, optional): Nome do arquivo JSON para persistência.
                                          Defaults to "tarefas.json".
+            usar_diario (bool, optional): Se True, cada alteração é anexada como um
+                                          registro compacto ao arquivo de diário
+                                          (`<arquivo_json>.diario`) em vez de reescrever
+                                          o arquivo JSON inteiro. Defaults to False.
+            politica_fsync (str, optional): Quando sincronizar as gravações com o disco:
+                                            "sempre", "ao_fechar" ou "nunca".
+                                            Defaults to "sempre".
+            carregamento_preguicoso (bool, optional): Se True, o carregamento guarda os
+                                                      registros lidos do arquivo e só cria
+                                                      cada Tarefa no primeiro acesso a ela
+                                                      (por ID ou ao percorrer as tarefas).
+                                                      Defaults to False.
+            armazenamento (Armazenamento, optional): Meio de persistência a usar. Se None,
+                                                     usa um ArmazenamentoJSON criado com
+                                                     `arquivo_json`, `usar_diario` e
+                                                     `politica_fsync`. Defaults to None.
+            gravar_em_segundo_plano (bool, optional): Se True, as alterações são gravadas
+                                                      por uma thread própria, e quem as fez
+                                                      não espera pelo disco (ver
+                                                      `aguardar_gravacoes`). Defaults to False.
+            metricas (Metricas, optional): Se informado, recebe contadores e latências
+                                           das operações, do carregamento e das
+                                           gravações (ver o módulo `metricas`). Sem ele,
+                                           nada é medido. Defaults to None.
+            adiar_gravacao (float, optional): Se informado, ativa a gravação adiada: as
+                                              alterações só marcam o gerenciador como
+                                              sujo, e uma thread própria as grava depois
+                                              de tantos segundos sem novas alterações
+                                              (ver `descarregar`). Defaults to None.
+            atraso_maximo_gravacao (float, optional): Com a gravação adiada, máximo de
+                                                      segundos que uma alteração espera
+                                                      para ser gravada, mesmo que outras
+                                                      continuem chegando. Se None, usa
+                                                      `adiamento.ATRASO_MAXIMO_PADRAO`.
+                                                      Defaults to None.
+
+        Raises:
+            ValueError: Se a política de fsync não for reconhecida, se os tempos da
+                        gravação adiada forem inválidos ou se ela for combinada com
+                        `gravar_em_segundo_plano`.
         """
-        self.tarefas = []
-        self.arquivo_json = arquivo_json
+        if adiar_gravacao is not None and gravar_em_segundo_plano:
+            raise ValueError("adiar_gravacao e gravar_em_segundo_plano não podem ser combinados.")
+        if armazenamento is None:
+            armazenamento = ArmazenamentoJSON(arquivo_json, usar_diario=usar_diario, politica_fsync=politica_fsync)
+        self._armazenamento = armazenamento
+        # Índice chave do id -> Tarefa (ver `chave_do_id`). Dicionários preservam a
+        # ordem de inserção, então ele é ao mesmo tempo o índice e a lista ordenada.
+        # No carregamento preguiçoso, o valor pode ser o registro lido do arquivo
+        # (um dicionário ou um `mapeado.RegistroMapeado`) até que a tarefa seja
+        # materializada (ver `_materializar`).
+        self._indice = {}
+        # Índices secundários sobre as chaves de `_indice`, mantidos a cada alteração
+        # (ver `_indexar`) para consultar por status e por vencimento sem varrer tudo.
+        self._status = IndiceStatus()
+        self._vencimentos = IndiceVencimento()
+        # O índice invertido das descrições só é construído na primeira busca (ver
+        # `buscar_tarefas`); até lá, carregar e alterar tarefas não pagam por ele.
+        self._texto = None
+        # IDs ordenados para resolver IDs abreviados; também construído sob demanda
+        # (ver `resolver_id`).
+        self._ids = None
+        self.carregamento_preguicoso = carregamento_preguicoso
+        self.arquivo_json = armazenamento.caminho
+        # Estado de um lote em andamento (ver `lote`).
+        self._profundidade_lote = 0
+        self._alteracoes_pendentes = []
+        # Leituras concorrentes ou uma escrita exclusiva entre as threads que usam o
+        # gerenciador. Métodos públicos que só consultam usam `_leitura`; os que
+        # alteram as tarefas, a trava de escrita.
+        self._trava = TravaLeituraEscrita()
+        # Alterações já aplicadas em memória e ainda não entregues ao armazenamento
+        # (ver `_gravar_pendentes`), e a thread que as grava em segundo plano ou o
+        # gravador da gravação adiada.
+        self._a_gravar = []
+        self._gravacoes = None
+        self._gravacao_agendada = None
+        self._adiamento = None
+        if gravar_em_segundo_plano:
+            self._gravacoes = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gravacao-tarefas")
+        # Chaves das tarefas alteradas por atribuição direta, fora das operações
+        # entregues ao armazenamento, e ainda não gravadas: vão junto com a próxima
+        # operação, se o armazenamento as grava (ver `Armazenamento.registra_alteradas`),
+        # ou em `_salvar_tarefas`. None quando o índice foi trocado por inteiro.
+        self._alteradas = None
+        self._metricas = metricas
+        if metricas is not None:
+            armazenamento.metricas = metricas
+            # Os métodos são embrulhados só nesta instância: sem métricas, chamá-los
+            # não passa por nenhuma camada extra.
+            for metodo, operacao in OPERACOES_INSTRUMENTADAS.items():
+                setattr(self, metodo, metricas.instrumentar(operacao, getattr(self, metodo)))
         self._carregar_tarefas()
+        if adiar_gravacao is not None:
+            self._adiamento = GravadorAdiado(self._gravar_em_segundo_plano, adiar_gravacao, atraso_maximo_gravacao)
+
+    @property
+    def metricas(self):
+        """Metricas or None: O coletor de métricas informado na criação, se houver."""
+        return self._metricas
+
+    def _cronometrar(self, nome):
+        """Mede a duração do bloco `with` se a coleta de métricas estiver ativa. Método privado."""
+        return SEM_MEDICAO if self._metricas is None else self._metricas.cronometrar(nome)
+
+    @property
+    def tarefas(self):
+        """
+        Lista das tarefas na ordem em que foram adicionadas.
+
+        A lista é uma cópia construída a partir do índice interno; alterá-la
+        não altera o gerenciador. Atribuir uma nova lista substitui todas as tarefas.
+        """
+        with self._leitura():
+            return list(self._iterar_tarefas())
+
+    @tarefas.setter
+    def tarefas(self, tarefas):
+        with self._trava.escrita():
+            self._substituir_indice({tarefa.chave: tarefa for tarefa in tarefas})
+
+    def _leitura(self):
+        """
+        Trava para os métodos que só consultam as tarefas. No carregamento preguiçoso,
+        consultar também materializa (e descarta) tarefas, então a trava é exclusiva.
+        Método privado.
+        """
+        return self._trava.escrita() if self.carregamento_preguicoso else self._trava.leitura()
+
+    def __len__(self):
+        """
+        Retorna o número de tarefas, sem construir a lista. No carregamento preguiçoso,
+        os registros inválidos já foram descartados na carga, e o número não muda
+        quando as tarefas são materializadas; a exceção é um registro corrompido no
+        heap do ArmazenamentoMapeado, descoberto só no acesso.
+        """
+        return len(self._indice)
 
     def adicionar_tarefa(self, descricao, data_vencimento=None):
         """
@@ -32,19 +192,21 @@ class GerenciadorDeTarefas:
         Returns:
             Tarefa: O objeto Tarefa criado e adicionado, ou None se a descrição for inválida.
         """
-        if not descricao or not isinstance(descricao, str) or not descricao.strip():
-            print("Erro: A descrição da tarefa não pode ser vazia.")
-            return None
-        try:
-            nova_tarefa = Tarefa(descricao.strip(), data_vencimento)
-            self.tarefas.append(nova_tarefa)
-            self._salvar_tarefas()
-            print(f"Tarefa '{nova_tarefa.descricao}' adicionada com sucesso.")
-            return nova_tarefa
-        except ValueError as e:
-            print(f"Erro ao criar tarefa: {e}")
-            return None
-
+        with self._trava.escrita():
+            if not descricao or not isinstance(descricao, str) or not descricao.strip():
+                notificar(ERRO, "tarefa.invalida", "Erro: A descrição da tarefa não pode ser vazia.")
+                return None
+            try:
+                nova_tarefa = Tarefa(descricao.strip(), data_vencimento)
+                self._indice[nova_tarefa.chave] = nova_tarefa
+                self._indexar(nova_tarefa.chave, nova_tarefa)
+                self._registrar_alteracao("adicionar", nova_tarefa)
+                notificar(INFORMACAO, "tarefa.adicionada", f"Tarefa '{nova_tarefa.descricao}' adicionada com sucesso.",
+                          id=nova_tarefa.id)
+                return nova_tarefa
+            except ValueError as e:
+                notificar(ERRO, "tarefa.invalida", f"Erro ao criar tarefa: {e}")
+                return None
 
     def visualizar_tarefas(self, mostrar_concluidas=True, mostrar_pendentes=True):
         """
@@ -58,19 +220,64 @@ class GerenciadorDeTarefas:
             list: Lista de strings, cada uma representando uma tarefa.
                   Retorna uma lista com uma mensagem se não houver tarefas.
         """
-        if not self.tarefas:
-            return ["Nenhuma tarefa cadastrada."]
+        with self._leitura():
+            if not self._indice:
+                return ["Nenhuma tarefa cadastrada."]
 
-        tarefas_filtradas = []
-        for tarefa in self.tarefas:
-            if (mostrar_concluidas and tarefa.concluida) or \
-               (mostrar_pendentes and not tarefa.concluida):
-                tarefas_filtradas.append(str(tarefa))
+            tarefas_filtradas = list(self.iterar_visualizacao(mostrar_concluidas, mostrar_pendentes))
         
-        if not tarefas_filtradas:
-            return ["Nenhuma tarefa corresponde aos critérios de filtro."]
+            if not tarefas_filtradas:
+                return ["Nenhuma tarefa corresponde aos critérios de filtro."]
             
-        return tarefas_filtradas
+            return tarefas_filtradas
+
+    def iterar_visualizacao(self, mostrar_concluidas=True, mostrar_pendentes=True, deslocamento=0, limite=None):
+        """
+        Gera, sob demanda, as strings que representam as tarefas.
+
+        Ao contrário de `visualizar_tarefas`, só as chaves da página pedida são
+        copiadas, e cada linha é formatada quando consumida, então obter uma página
+        custa proporcionalmente ao tamanho dela, e não ao total de tarefas; as tarefas
+        do deslocamento são puladas sem serem formatadas. Tarefas removidas depois da
+        chamada são puladas, sem que outras entrem no lugar.
+
+        Args:
+            mostrar_concluidas (bool): Se True, inclui tarefas concluídas.
+            mostrar_pendentes (bool): Se True, inclui tarefas pendentes.
+            deslocamento (int, optional): Quantas tarefas filtradas pular. Defaults to 0.
+            limite (int, optional): Máximo de tarefas a gerar; None para todas. Defaults to None.
+
+        Quando apenas um dos status é pedido, só as tarefas daquele status são
+        percorridas, pelo índice de status.
+
+        Returns:
+            iterator: Strings das tarefas filtradas, na ordem de inserção. Não há mensagem
+                      para lista vazia; o iterador simplesmente não gera nada.
+        """
+        fim = None if limite is None else deslocamento + limite
+        with self._leitura():
+            if mostrar_concluidas and mostrar_pendentes:
+                chaves = self._indice
+            elif mostrar_concluidas or mostrar_pendentes:
+                chaves = self._status.chaves(mostrar_concluidas)
+            else:
+                chaves = ()
+            pagina = list(islice(chaves, deslocamento, fim))
+        return self._formatar_sob_demanda(pagina)
+
+    def _formatar_sob_demanda(self, chaves):
+        """
+        Gera as strings das tarefas com as chaves informadas, obtendo a trava de
+        leitura a cada tarefa, e não durante toda a iteração: quem pagina pode demorar
+        entre uma página e outra. Tarefas removidas nesse meio tempo são puladas.
+        Método privado.
+        """
+        for chave in chaves:
+            with self._leitura():
+                tarefa = self._materializar(chave)
+                linha = None if tarefa is None else str(tarefa)
+            if linha is not None:
+                yield linha
 
     def encontrar_tarefa_por_id(self, id_tarefa):
         """
@@ -82,109 +289,698 @@ class GerenciadorDeTarefas:
         Returns:
             Tarefa or None: O objeto Tarefa se encontrado, caso contrário None.
         """
-        if not id_tarefa or not isinstance(id_tarefa, str):
+        with self._leitura():
+            if not id_tarefa or not isinstance(id_tarefa, str):
+                return None
+            return self._materializar(chave_do_id(id_tarefa))
+
+    def resolver_id(self, id_tarefa):
+        """
+        Encontra uma tarefa pelo ID completo ou por um ID abreviado (o início do ID).
+
+        Um ID completo é buscado diretamente no índice. Caso contrário, o texto é
+        tratado como prefixo e resolvido por busca binária nos IDs ordenados, índice
+        construído no primeiro uso e mantido a cada alteração.
+
+        Args:
+            id_tarefa (str): O ID da tarefa ou o seu início (ex.: "3f2a9c").
+
+        Returns:
+            Tarefa or None: A tarefa encontrada, ou None se nenhuma corresponder.
+
+        Raises:
+            ErroIdAmbiguo: Se o prefixo corresponder a mais de uma tarefa.
+        """
+        with self._leitura():
+            if not id_tarefa or not isinstance(id_tarefa, str):
+                return None
+            chave = chave_do_id(id_tarefa)
+            if chave not in self._indice:
+                if self._ids is None:
+                    # Montado antes de ser publicado: outras threads podem estar lendo.
+                    ids = IndiceIds()
+                    ids.reconstruir(self._indice)
+                    self._ids = ids
+                chave = self._ids.resolver(id_tarefa)
+            return self._materializar(chave)
+
+    def _materializar(self, chave):
+        """
+        Retorna a tarefa com a chave informada, criando o objeto Tarefa a partir do
+        registro lido do arquivo se ela ainda não tiver sido materializada.
+        Um registro inválido é descartado com a mesma mensagem do carregamento.
+        Método privado.
+
+        Args:
+            chave: A chave do ID da tarefa (ver `chave_do_id`).
+
+        Returns:
+            Tarefa or None: A tarefa, ou None se não existir ou se o registro for inválido.
+        """
+        valor = self._indice.get(chave)
+        if valor is None or type(valor) is Tarefa:
+            return valor
+        tarefa = self._tarefa_do_registro(valor)
+        if tarefa is None:
+            self._descartar(chave)
+        else:
+            self._indice[chave] = tarefa
+            tarefa._observador = self._ao_alterar_tarefa
+        return tarefa
+
+    def _tarefa_do_registro(self, registro):
+        """
+        Cria a Tarefa de um registro do arquivo (um dicionário ou um registro com o
+        método `tarefa`, como `mapeado.RegistroMapeado`), ou informa o erro e retorna None.
+        """
+        try:
+            if type(registro) is dict:
+                return Tarefa.from_dict(registro)
+            return registro.tarefa()
+        except ValueError as ve:
+            notificar(
+                ERRO, "carga.registro_invalido",
+                f"Erro nos dados ao carregar uma tarefa do arquivo {self.arquivo_json}: {ve}. Tarefa ignorada.",
+                caminho=self.arquivo_json,
+            )
+            if self._metricas is not None:
+                self._metricas.incrementar("carga.registros_ignorados")
             return None
-        for tarefa in self.tarefas:
-            if tarefa.id == id_tarefa:
-                return tarefa
-        return None
+
+    def _iterar_tarefas(self, chaves=None):
+        """
+        Percorre as tarefas na ordem de inserção, materializando as que ainda estão
+        na forma de registro. Registros inválidos são descartados ao final.
+        Método privado.
+
+        Args:
+            chaves (iterable, optional): Chaves a percorrer, na ordem desejada (por
+                                         exemplo, uma partição do índice de status).
+                                         Se None, percorre todas as tarefas.
+
+        Yields:
+            Tarefa: Cada tarefa válida.
+        """
+        indice = self._indice
+        invalidas = []
+        try:
+            if chaves is None:
+                itens = indice.items()
+            else:
+                itens = ((chave, indice[chave]) for chave in chaves)
+            for chave, valor in itens:
+                if type(valor) is not Tarefa:
+                    valor = self._tarefa_do_registro(valor)
+                    if valor is None:
+                        invalidas.append(chave)
+                        continue
+                    # Trocar o valor de uma chave existente não altera o tamanho do
+                    # dicionário, então é permitido durante a iteração.
+                    indice[chave] = valor
+                    valor._observador = self._ao_alterar_tarefa
+                yield valor
+        finally:
+            for chave in invalidas:
+                self._descartar(chave)
+
+    def _indexar(self, chave, valor):
+        """
+        Registra nos índices secundários uma tarefa (ou registro ainda não
+        materializado) que está em `_indice`.
+        Método privado.
+        """
+        if type(valor) is dict:
+            self._status.adicionar(chave, valor.get("concluida", False))
+            self._vencimentos.adicionar(chave, ordinal_do_vencimento(valor.get("data_vencimento")))
+        else:
+            self._status.adicionar(chave, valor.concluida)
+            self._vencimentos.adicionar(chave, valor.vencimento_ordinal)
+            if type(valor) is Tarefa:
+                valor._observador = self._ao_alterar_tarefa
+        if self._texto is not None:
+            self._texto.adicionar(chave, self._descricao_de(valor))
+        if self._ids is not None:
+            self._ids.adicionar(chave)
+
+    def _descartar(self, chave):
+        """
+        Retira uma chave de `_indice` e dos índices secundários.
+        Método privado.
+        """
+        valor = self._indice.pop(chave, None)
+        if type(valor) is Tarefa:
+            valor._observador = None
+        self._status.remover(chave)
+        self._vencimentos.remover(chave)
+        if self._texto is not None:
+            self._texto.remover(chave)
+        if self._ids is not None:
+            self._ids.remover(chave)
+
+    def _substituir_indice(self, indice):
+        """
+        Troca todo o conteúdo de `_indice` e reconstrói os índices secundários.
+        Método privado.
+        """
+        for valor in self._indice.values():
+            if type(valor) is Tarefa:
+                valor._observador = None
+        self._indice = indice
+        self._alteradas = None
+        self._texto = None
+        self._ids = None
+        status, vencimentos = [], []
+        for chave, valor in indice.items():
+            if type(valor) is dict:
+                status.append((chave, valor.get("concluida", False)))
+                vencimentos.append((chave, ordinal_do_vencimento(valor.get("data_vencimento"))))
+            else:
+                status.append((chave, valor.concluida))
+                vencimentos.append((chave, valor.vencimento_ordinal))
+                if type(valor) is Tarefa:
+                    valor._observador = self._ao_alterar_tarefa
+        self._status.reconstruir(status)
+        self._vencimentos.reconstruir(vencimentos)
+
+    def _ao_alterar_tarefa(self, tarefa, atributo):
+        """
+        Observador das tarefas (ver `Tarefa`): mantém os índices secundários em dia
+        quando o status ou a data de uma tarefa muda, mesmo fora do gerenciador.
+        Método privado.
+        """
+        if self._indice.get(tarefa.chave) is not tarefa:
+            return
+        if self._alteradas is not None:
+            self._alteradas.add(tarefa.chave)
+        if atributo == "concluida":
+            self._status.adicionar(tarefa.chave, tarefa.concluida)
+        elif atributo == "data_vencimento":
+            self._vencimentos.adicionar(tarefa.chave, tarefa.vencimento_ordinal)
+        elif atributo == "descricao" and self._texto is not None:
+            self._texto.adicionar(tarefa.chave, tarefa.descricao)
+
+    @staticmethod
+    def _descricao_de(valor):
+        """Descrição de uma tarefa ou de um registro ainda não materializado."""
+        return valor.get("descricao") if type(valor) is dict else valor.descricao
+
+    def buscar_tarefas(self, consulta):
+        """
+        Busca tarefas pelas palavras da descrição, usando um índice invertido.
+
+        A busca ignora acentos e maiúsculas/minúsculas. Palavras separadas por espaço
+        devem aparecer todas na descrição; "OU" (em maiúsculas) separa alternativas; e
+        uma palavra terminada em "*" casa com qualquer palavra que comece com ela.
+        Exemplo: "relatório OU planilha mens*".
+
+        O índice é construído na primeira busca e, a partir daí, atualizado a cada
+        tarefa adicionada, removida ou alterada.
+
+        Args:
+            consulta (str): O texto da consulta.
+
+        Returns:
+            list: As tarefas encontradas, na ordem de inserção.
+        """
+        with self._leitura():
+            if not consulta or not isinstance(consulta, str):
+                return []
+            if self._texto is None:
+                texto = IndiceTexto()
+                texto.reconstruir((chave, self._descricao_de(valor)) for chave, valor in self._indice.items())
+                self._texto = texto
+            return list(self._iterar_tarefas(self._texto.buscar(consulta)))
+
+    def tarefas_por_status(self, concluida):
+        """
+        Retorna as tarefas de um status, usando o índice de status.
+
+        Args:
+            concluida (bool): True para as concluídas, False para as pendentes.
+
+        Returns:
+            list: As tarefas, na ordem de inserção.
+        """
+        with self._leitura():
+            return list(self._iterar_tarefas(list(self._status.chaves(concluida))))
+
+    def tarefas_com_vencimento_entre(self, inicio=None, fim=None, concluida=None):
+        """
+        Retorna as tarefas com data de vencimento em um intervalo, usando o índice de
+        vencimentos. Tarefas sem data (ou com data fora do formato YYYY-MM-DD) nunca
+        entram no resultado.
+
+        Args:
+            inicio (str or datetime.date, optional): Primeira data do intervalo (inclusive);
+                                                     None para não limitar. Defaults to None.
+            fim (str or datetime.date, optional): Última data do intervalo (inclusive);
+                                                  None para não limitar. Defaults to None.
+            concluida (bool, optional): Se informado, restringe ao status. Defaults to None.
+
+        Returns:
+            list: As tarefas, em ordem de data de vencimento.
+
+        Raises:
+            ValueError: Se uma das datas não estiver no formato YYYY-MM-DD.
+        """
+        with self._leitura():
+            inicio = None if inicio is None else ordinal_da_data(inicio)
+            fim = None if fim is None else ordinal_da_data(fim)
+            chaves = self._vencimentos.intervalo(inicio, fim)
+            if concluida is not None:
+                chaves = [chave for chave in chaves if self._status.contem(chave, concluida)]
+            return list(self._iterar_tarefas(chaves))
+
+    def tarefas_atrasadas(self, hoje=None):
+        """
+        Retorna as tarefas pendentes cuja data de vencimento já passou.
+
+        Args:
+            hoje (str or datetime.date, optional): Data de referência. Defaults to a data atual.
+
+        Returns:
+            list: As tarefas atrasadas, em ordem de data de vencimento.
+        """
+        ontem = ordinal_da_data(date.today() if hoje is None else hoje) - 1
+        return self.tarefas_com_vencimento_entre(fim=date.fromordinal(ontem), concluida=False)
 
     def marcar_tarefa_como_concluida(self, id_tarefa):
         """
         Marca uma tarefa como concluída.
 
         Args:
-            id_tarefa (str): O ID da tarefa a ser marcada.
+            id_tarefa (str): O ID da tarefa a ser marcada, completo ou abreviado
+                             (ver `resolver_id`).
 
         Returns:
             bool: True se a tarefa foi marcada com sucesso, False caso contrário.
         """
-        tarefa = self.encontrar_tarefa_por_id(id_tarefa)
-        if tarefa:
-            if not tarefa.concluida:
-                tarefa.marcar_como_concluida()
-                self._salvar_tarefas()
-                print(f"Tarefa '{tarefa.descricao}' marcada como concluída.")
-                return True
+        with self._trava.escrita():
+            try:
+                tarefa = self.resolver_id(id_tarefa)
+            except ErroIdAmbiguo as e:
+                notificar(ERRO, "tarefa.id_ambiguo", f"Erro: {e}")
+                return False
+            if tarefa:
+                if not tarefa.concluida:
+                    ja_alterada = self._alteradas is not None and tarefa.chave in self._alteradas
+                    tarefa.marcar_como_concluida()
+                    if not ja_alterada and self._alteradas is not None:
+                        # A conclusão é gravada pela operação "concluir", e não como atribuição direta.
+                        self._alteradas.discard(tarefa.chave)
+                    self._registrar_alteracao("concluir", tarefa)
+                    notificar(INFORMACAO, "tarefa.concluida", f"Tarefa '{tarefa.descricao}' marcada como concluída.",
+                              id=tarefa.id)
+                    return True
+                else:
+                    notificar(INFORMACAO, "tarefa.ja_concluida", f"Tarefa '{tarefa.descricao}' já estava concluída.",
+                              id=tarefa.id)
+                    return False
             else:
-                print(f"Tarefa '{tarefa.descricao}' já estava concluída.")
+                notificar(ERRO, "tarefa.nao_encontrada", f"Erro: Tarefa com ID '{id_tarefa}' não encontrada.", id=id_tarefa)
                 return False
-        else:
-            print(f"Erro: Tarefa com ID '{id_tarefa}' não encontrada.")
-            return False
 
     def remover_tarefa(self, id_tarefa):
         """
         Remove uma tarefa da lista.
 
         Args:
-            id_tarefa (str): O ID da tarefa a ser removida.
+            id_tarefa (str): O ID da tarefa a ser removida, completo ou abreviado
+                             (ver `resolver_id`).
 
         Returns:
             bool: True se a tarefa foi removida com sucesso, False caso contrário.
         """
-        tarefa = self.encontrar_tarefa_por_id(id_tarefa)
-        if tarefa:
-            self.tarefas.remove(tarefa)
+        with self._trava.escrita():
+            try:
+                tarefa = self.resolver_id(id_tarefa)
+            except ErroIdAmbiguo as e:
+                notificar(ERRO, "tarefa.id_ambiguo", f"Erro: {e}")
+                return False
+            if tarefa:
+                self._descartar(tarefa.chave)
+                self._registrar_alteracao("remover", tarefa)
+                notificar(INFORMACAO, "tarefa.removida", f"Tarefa '{tarefa.descricao}' removida com sucesso.", id=tarefa.id)
+                return True
+            else:
+                notificar(ERRO, "tarefa.nao_encontrada", f"Erro: Tarefa com ID '{id_tarefa}' não encontrada para remoção.",
+                          id=id_tarefa)
+                return False
+
+    def importar(self, caminho, formato=None, processos=None):
+        """
+        Importa tarefas de um arquivo NDJSON (um objeto por linha) ou CSV (com as colunas
+        id, descricao, data_vencimento e concluida).
+
+        O arquivo é lido em fluxo e validado por blocos com `Tarefa.from_dict`, em
+        paralelo quando há mais de um bloco (ver `intercambio.validar_registros`). IDs que
+        já existem, no gerenciador ou antes no próprio arquivo, são detectados pelo índice
+        de IDs e ignorados, assim como registros inválidos. Tudo é gravado de uma vez no
+        final; se a leitura falhar no meio, nada é importado.
+
+        Args:
+            caminho (str): O arquivo a importar.
+            formato (str, optional): "ndjson" ou "csv"; se None, é deduzido pela extensão.
+            processos (int, optional): Processos usados na validação; 1 para não usar o
+                                       pool. Defaults to None (número de CPUs).
+
+        Returns:
+            ResultadoImportacao or None: Contagens e duração da importação (incluindo
+                                         `registros_por_segundo`), ou None se o arquivo
+                                         não pôde ser lido.
+
+        Raises:
+            ValueError: Se o formato não for reconhecido.
+        """
+        with self._trava.escrita():
+            formato = formato_do_caminho(caminho, formato)
+            inicio = time.perf_counter()
+            importadas = duplicadas = invalidas = 0
+            try:
+                with open(caminho, "r", encoding="utf-8", newline="") as arquivo, self.lote():
+                    for numero, tarefa, erro in validar_registros(arquivo, formato, processos):
+                        if tarefa is None:
+                            notificar(
+                                ERRO, "importacao.registro_invalido",
+                                f"Erro na linha {numero} de {caminho}: {erro}. Registro ignorado.",
+                                caminho=caminho,
+                            )
+                            invalidas += 1
+                        elif tarefa.chave in self._indice:
+                            notificar(
+                                ERRO, "importacao.registro_invalido",
+                                f"Erro na linha {numero} de {caminho}: ID duplicado '{tarefa.id}'. Registro ignorado.",
+                                caminho=caminho,
+                            )
+                            duplicadas += 1
+                        else:
+                            self._indice[tarefa.chave] = tarefa
+                            self._indexar(tarefa.chave, tarefa)
+                            self._registrar_alteracao("adicionar", tarefa)
+                            importadas += 1
+            except (OSError, ValueError) as e:
+                notificar(ERRO, "importacao.erro", f"Erro ao importar o arquivo {caminho}: {e}", caminho=caminho)
+                return None
+            resultado = ResultadoImportacao(importadas, duplicadas, invalidas, time.perf_counter() - inicio)
+            notificar(
+                INFORMACAO, "importacao.concluida",
+                f"{importadas} tarefa(s) importada(s) de {caminho} ({duplicadas} duplicada(s), "
+                f"{invalidas} inválida(s)) em {resultado.segundos:.2f}s: "
+                f"{resultado.registros_por_segundo:.0f} registros/s.",
+                caminho=caminho, importadas=importadas, duplicadas=duplicadas, invalidas=invalidas,
+            )
+            return resultado
+
+    def exportar(self, caminho, formato=None):
+        """
+        Exporta todas as tarefas para um arquivo NDJSON ou CSV, escrevendo uma tarefa
+        por vez. O arquivo é substituído de forma atômica.
+
+        Args:
+            caminho (str): O arquivo de destino.
+            formato (str, optional): "ndjson" ou "csv"; se None, é deduzido pela extensão.
+
+        Returns:
+            int or None: Quantas tarefas foram exportadas, ou None se houve erro de escrita.
+
+        Raises:
+            ValueError: Se o formato não for reconhecido.
+        """
+        with self._leitura():
+            formato = formato_do_caminho(caminho, formato)
+            inicio = time.perf_counter()
+            exportadas = []
+            try:
+                _gravar_atomicamente(
+                    caminho, lambda f: exportadas.append(escrever_tarefas(f, formato, self._iterar_tarefas()))
+                )
+            except OSError as e:
+                notificar(ERRO, "exportacao.erro", f"Erro ao exportar para o arquivo {caminho}: {e}", caminho=caminho)
+                return None
+            segundos = time.perf_counter() - inicio
+            taxa = exportadas[0] / segundos if segundos > 0 else float("inf")
+            notificar(
+                INFORMACAO, "exportacao.concluida",
+                f"{exportadas[0]} tarefa(s) exportada(s) para {caminho} em {segundos:.2f}s: {taxa:.0f} registros/s.",
+                caminho=caminho,
+            )
+            return exportadas[0]
+
+    def fechar(self):
+        """
+        Encerra o uso do gerenciador, concluindo as gravações pendentes: as da thread
+        de gravação em segundo plano, as adiadas, as de tarefas alteradas por atribuição
+        direta e as do armazenamento (por exemplo, a sincronização da política de fsync
+        "ao_fechar").
+        """
+        if self._adiamento is not None:
+            self._adiamento.fechar()
+            # Alterações feitas depois de fechar são gravadas na própria thread.
+            self._adiamento = None
+        self.aguardar_gravacoes()
+        if self._gravacoes is not None:
+            self._gravacoes.shutdown()
+            # Alterações feitas depois de fechar são gravadas na própria thread.
+            self._gravacoes = None
+        if self._alteradas:
+            # Tarefas alteradas por atribuição direta depois da última gravação.
             self._salvar_tarefas()
-            print(f"Tarefa '{tarefa.descricao}' removida com sucesso.")
-            return True
+        self._armazenamento.fechar()
+
+    def aguardar_gravacoes(self):
+        """
+        Espera que as alterações feitas até aqui sejam entregues ao armazenamento.
+        Sem gravação em segundo plano, elas já foram, e o retorno é imediato. Não deve
+        ser chamado dentro de um lote, pois a thread de gravação pode precisar da
+        trava de escrita que o lote mantém.
+        """
+        agendada = self._gravacao_agendada
+        if agendada is not None:
+            agendada.result()
+
+    def descarregar(self):
+        """
+        Grava as alterações ainda não persistidas e espera a gravação, para quem
+        precisa de durabilidade em um ponto específico. Com a gravação adiada, grava
+        na hora, sem esperar o silêncio; nos demais modos, equivale a
+        `aguardar_gravacoes`. Não deve ser chamado dentro de um lote.
+        """
+        if self._adiamento is not None:
+            self._adiamento.descarregar()
+        self.aguardar_gravacoes()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo_excecao, excecao, rastreamento):
+        self.fechar()
+
+    @contextmanager
+    def lote(self):
+        """
+        Agrupa várias alterações em uma única gravação.
+
+        Dentro do bloco `with gerenciador.lote():` as alterações não são persistidas
+        uma a uma; ao sair do bloco elas são gravadas de uma só vez. Se uma exceção
+        escapar do bloco, as tarefas em memória voltam ao estado anterior ao lote e
+        nada é gravado. Lotes aninhados são absorvidos pelo lote mais externo.
+
+        Yields:
+            GerenciadorDeTarefas: O próprio gerenciador.
+        """
+        with self._trava.escrita():
+            if self._profundidade_lote:
+                self._profundidade_lote += 1
+                try:
+                    yield self
+                finally:
+                    self._profundidade_lote -= 1
+                return
+            yield from self._lote_externo()
+
+    def _lote_externo(self):
+        """Corpo de `lote` para o lote mais externo, já com a trava de escrita. Método privado."""
+        estado_anterior = [
+            (chave, valor, valor.concluida if type(valor) is Tarefa else None)
+            for chave, valor in self._indice.items()
+        ]
+        self._profundidade_lote = 1
+        self._alteracoes_pendentes = []
+        try:
+            yield self
+        except BaseException:
+            for chave, valor, concluida in estado_anterior:
+                if concluida is not None:
+                    valor.concluida = concluida
+            self._substituir_indice({chave: valor for chave, valor, _ in estado_anterior})
+            raise
         else:
-            print(f"Erro: Tarefa com ID '{id_tarefa}' não encontrada para remoção.")
-            return False
+            pendentes = self._alteracoes_pendentes
+            self._profundidade_lote = 0
+            self._descarregar_alteracoes(pendentes)
+        finally:
+            self._profundidade_lote = 0
+            self._alteracoes_pendentes = []
 
-    def _salvar_tarefas(self):
+    def _registrar_alteracao(self, operacao, tarefa):
         """
-        Salva a lista de tarefas em um arquivo JSON.
+        Persiste uma alteração feita em uma tarefa, ou a adia se houver um lote em andamento.
         Método privado.
+
+        Args:
+            operacao (str): "adicionar", "concluir", "remover" ou "limpar".
+            tarefa (Tarefa): A tarefa alterada (None para "limpar").
+        """
+        if self._profundidade_lote:
+            self._alteracoes_pendentes.append((operacao, tarefa))
+        else:
+            self._descarregar_alteracoes([(operacao, tarefa)])
+
+    def _descarregar_alteracoes(self, alteracoes):
+        """
+        Entrega um conjunto de alterações ao armazenamento.
+        Método privado.
+
+        Args:
+            alteracoes (list): Pares (operacao, tarefa) na ordem em que ocorreram.
+        """
+        if not alteracoes:
+            return
+        agendar = not self._a_gravar
+        self._a_gravar.extend(alteracoes)
+        if self._adiamento is not None:
+            self._adiamento.marcar()
+        elif self._gravacoes is None:
+            self._gravar_pendentes()
+        elif agendar:
+            # Se já havia alterações na fila, a gravação agendada para elas ainda não
+            # começou e levará estas junto.
+            self._gravacao_agendada = self._gravacoes.submit(self._gravar_em_segundo_plano)
+
+    def _gravar_em_segundo_plano(self):
+        """
+        Executado na thread de gravação em segundo plano ou da gravação adiada; erros
+        inesperados são informados. Método privado.
         """
         try:
-            with open(self.arquivo_json, "w", encoding="utf-8") as f:
-                json.dump([tarefa.to_dict() for tarefa in self.tarefas], f, indent=4, ensure_ascii=False)
-        except IOError as e:
-            print(f"Erro de E/S ao salvar tarefas em {self.arquivo_json}: {e}")
+            self._gravar_pendentes()
+        except Exception as e:
+            notificar(ERRO, "gravacao.erro", f"Erro ao gravar as tarefas de {self.arquivo_json} em segundo plano: {e}",
+                      caminho=self.arquivo_json)
 
+    def _gravar_pendentes(self):
+        """
+        Entrega ao armazenamento as alterações da fila `_a_gravar`.
+
+        Na gravação em segundo plano ou adiada, o armazenamento recebe uma cópia do índice,
+        tirada com a trava de leitura, e grava sem travar o gerenciador, de modo que
+        leitores não esperam pelo disco. Se outro processo gravou o arquivo, as
+        tarefas precisam ser recarregadas: a trava de escrita é obtida antes da trava
+        do arquivo, na mesma ordem de quem grava na própria thread, e as alterações que
+        chegaram à fila nesse meio tempo são reaplicadas junto.
+        Método privado.
+        """
+        em_segundo_plano = self._gravacoes is not None or self._adiamento is not None
+        with self._trava.leitura():
+            alteracoes, self._a_gravar = self._a_gravar, []
+            tarefas = dict(self._indice) if em_segundo_plano else self._indice
+            if not alteracoes:
+                return
+            # Vão junto as tarefas alteradas por atribuição direta, que não entram na fila,
+            # se o armazenamento as grava; senão, ficam para `_salvar_tarefas`.
+            alteradas = None
+            if self._alteradas is not None and self._armazenamento.registra_alteradas:
+                alteradas, self._alteradas = self._alteradas, set()
+        try:
+            with self._cronometrar("gravacao.duracao_s"):
+                self._entregar_alteracoes(alteracoes, tarefas, alteradas)
+        except BaseException:
+            # Sem a gravação, as chaves continuam pendentes para a próxima.
+            if alteradas is not None and self._alteradas is not None:
+                self._alteradas |= alteradas
+            raise
+        if self._metricas is not None:
+            self._metricas.incrementar("gravacao.alteracoes", len(alteracoes))
+
+    def _entregar_alteracoes(self, alteracoes, tarefas, alteradas):
+        """
+        Corpo de `_gravar_pendentes`, já com a fila e as chaves alteradas retiradas.
+        A lista `alteracoes` recebe as que chegarem à fila se for preciso recarregar.
+        Método privado.
+        """
+        with self._armazenamento.bloquear():
+            if not self._armazenamento.desatualizado():
+                self._armazenamento.registrar(alteracoes, tarefas, alteradas)
+                return
+        with self._trava.escrita(), self._armazenamento.bloquear():
+            alteracoes += self._a_gravar
+            self._a_gravar = []
+            if self._armazenamento.desatualizado():
+                self._reaplicar_alteracoes(alteracoes)
+            self._armazenamento.registrar(alteracoes, self._indice, alteradas)
+
+    def _reaplicar_alteracoes(self, alteracoes):
+        """
+        Recarrega as tarefas gravadas por outro processo e reaplica sobre elas as
+        alterações ainda não persistidas, em vez de sobrescrever o que foi gravado.
+        Concluir ou alterar uma tarefa que o outro processo removeu não a traz de volta.
+        Método privado.
+
+        Args:
+            alteracoes (list): Pares (operacao, tarefa) na ordem em que ocorreram; além
+                               das operações do armazenamento, "alterar" reaplica uma
+                               tarefa alterada por atribuição direta.
+        """
+        tarefas = self._armazenamento.carregar(preguicoso=self.carregamento_preguicoso)
+        for operacao, tarefa in alteracoes:
+            if operacao == "limpar":
+                tarefas.clear()
+            elif operacao == "adicionar":
+                tarefas[tarefa.chave] = tarefa
+            elif operacao == "remover":
+                tarefas.pop(tarefa.chave, None)
+            elif operacao in ("concluir", "alterar") and tarefa.chave in tarefas:
+                tarefas[tarefa.chave] = tarefa
+        self._substituir_indice(tarefas)
+
+    def _salvar_tarefas(self):
+        """
+        Salva o conjunto completo de tarefas no armazenamento, informando quais
+        mudaram desde a última gravação (ver `Armazenamento.salvar_alteradas`). Se
+        outro processo gravou o arquivo, as tarefas são recarregadas antes e as
+        alteradas por atribuição direta, reaplicadas, como em `_entregar_alteracoes`.
+        Método privado.
+        """
+        with self._trava.escrita(), self._armazenamento.bloquear(), self._cronometrar("gravacao.duracao_s"):
+            if self._alteradas is not None and self._armazenamento.desatualizado():
+                self._reaplicar_alteracoes([("alterar", self._indice[chave]) for chave in self._alteradas
+                                            if type(self._indice.get(chave)) is Tarefa])
+            if self._alteradas is None:
+                self._armazenamento.salvar(self._indice)
+            else:
+                self._armazenamento.salvar_alteradas(self._indice, self._alteradas)
+            self._alteradas = set()
 
     def _carregar_tarefas(self):
         """
-        Carrega a lista de tarefas de um arquivo JSON.
+        Carrega as tarefas do armazenamento.
         Método privado.
         """
-        try:
-            with open(self.arquivo_json, "r", encoding="utf-8") as f:
-                tarefas_data = json.load(f)
-                
-                if not isinstance(tarefas_data, list):
-                    print(f"Erro: O conteúdo do arquivo {self.arquivo_json} não é uma lista JSON válida. Iniciando com lista vazia.")
-                    self.tarefas = []
-                    return
-
-                novas_tarefas = []
-                for data in tarefas_data:
-                    try:
-                        novas_tarefas.append(Tarefa.from_dict(data))
-                    except ValueError as ve:
-                        print(f"Erro nos dados ao carregar uma tarefa do arquivo {self.arquivo_json}: {ve}. Tarefa ignorada.")
-                self.tarefas = novas_tarefas
-            
-            if self.tarefas or (not self.tarefas and isinstance(tarefas_data, list) and not tarefas_data): # Se carregou tarefas ou o arquivo era uma lista vazia
-                 print(f"Tarefas carregadas de {self.arquivo_json}")
-
-        except FileNotFoundError:
-            print(f"Arquivo {self.arquivo_json} não encontrado. Iniciando com lista de tarefas vazia.")
-            self.tarefas = []
-        except (json.JSONDecodeError, UnicodeDecodeError) as e:
-            print(f"Erro ao decodificar JSON do arquivo {self.arquivo_json}: {e}. Iniciando com lista vazia.")
-            self.tarefas = []
-        except IOError as e: 
-            print(f"Erro de E/S ao tentar ler o arquivo {self.arquivo_json}: {e}. Iniciando com lista vazia.")
-            self.tarefas = []
-            
+        with self._trava.escrita():
+            with self._cronometrar("carga.duracao_s"):
+                tarefas = self._armazenamento.carregar(preguicoso=self.carregamento_preguicoso)
+            self._substituir_indice(tarefas)
+            self._alteradas = set()
+            if self._metricas is not None:
+                self._metricas.incrementar("carga.registros", len(tarefas))
+
     def limpar_todas_as_tarefas(self):
         """
         Remove todas as tarefas da lista e do arquivo de persistência.
         Útil para testes ou para resetar o estado.
         """
-        self.tarefas = []
-        self._salvar_tarefas() 
-        print("Todas as tarefas foram removidas.")
\ No newline at end of file
+        with self._trava.escrita():
+            self._substituir_indice({})
+            self._registrar_alteracao("limpar", None)
+            notificar(INFORMACAO, "tarefa.limpeza", "Todas as tarefas foram removidas.")
+
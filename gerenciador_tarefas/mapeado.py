@@ -0,0 +1,151 @@
+# gerenciador_tarefas/mapeado.py
+
+"""
+Layout do armazenamento mapeado em memória (ver `ArmazenamentoMapeado`).
+
+São dois arquivos. O arquivo de registros, mapeado com `mmap`, tem um cabeçalho
+e um registro de tamanho fixo por tarefa, na ordem de inserção (inteiros
+little-endian):
+
+    cabeçalho:  4s  mágico b"TARM"
+                H   versão do formato
+                H   reservado (zero)
+                Q   registros em uso (os demais são espaço reservado para crescer)
+                Q   geração do heap de descrições
+    registro:   B   estado (ESTADO_CONCLUIDA, ESTADO_REMOVIDA)
+                7x  reservado
+                Q   posição da tarefa no heap
+
+O heap (`<arquivo>.heap.<geração>`) só recebe acréscimos: cada tarefa é gravada
+nele uma vez, como um registro do formato `binario`. Concluir uma tarefa muda só
+o byte de estado do registro fixo, e remover a marca como removida (uma lápide);
+o espaço das lápides é recuperado na compactação, que grava um heap de nova geração.
+"""
+
+import struct
+from datetime import date
+from .binario import ErroFormatoBinario, decodificar_registro
+from .tarefa import Tarefa, ordinal_do_vencimento
+
+MAGICO_MAPEADO = b"TARM"
+VERSAO_MAPEADO = 1
+
+ESTADO_CONCLUIDA = 0x01
+ESTADO_REMOVIDA = 0x02
+
+CABECALHO = struct.Struct("<4sHHQQ")
+REGISTRO = struct.Struct("<B7xQ")
+
+
+def caminho_do_heap(caminho, geracao):
+    """Retorna o caminho do heap de descrições de uma geração."""
+    return f"{caminho}.heap.{geracao}"
+
+
+def codificar_cabecalho(usados, geracao):
+    """Retorna os bytes do cabeçalho do arquivo de registros."""
+    return CABECALHO.pack(MAGICO_MAPEADO, VERSAO_MAPEADO, 0, usados, geracao)
+
+
+def decodificar_cabecalho(dados):
+    """
+    Lê e valida só o cabeçalho, sem conferir se os registros cabem no arquivo:
+    `dados` pode conter apenas os primeiros CABECALHO.size bytes.
+
+    Args:
+        dados: O início do arquivo de registros.
+
+    Returns:
+        tuple: (registros em uso, geração do heap).
+
+    Raises:
+        ErroFormatoBinario: Se o cabeçalho for inválido ou a versão não for suportada.
+    """
+    if len(dados) < CABECALHO.size:
+        raise ErroFormatoBinario("Cabeçalho ausente ou incompleto")
+    magico, versao, _, usados, geracao = CABECALHO.unpack_from(dados)
+    if magico != MAGICO_MAPEADO:
+        raise ErroFormatoBinario("O arquivo não é um arquivo de registros mapeado")
+    if versao > VERSAO_MAPEADO:
+        raise ErroFormatoBinario(f"Versão {versao} do formato não suportada (máxima: {VERSAO_MAPEADO})")
+    return usados, geracao
+
+
+def ler_cabecalho(dados):
+    """
+    Lê e valida o cabeçalho do arquivo de registros.
+
+    Args:
+        dados: O conteúdo (ou o mmap) do arquivo de registros.
+
+    Returns:
+        tuple: (registros em uso, geração do heap).
+
+    Raises:
+        ErroFormatoBinario: Se o cabeçalho for inválido, a versão não for suportada
+                            ou o arquivo for menor que os registros em uso.
+    """
+    usados, geracao = decodificar_cabecalho(dados)
+    if CABECALHO.size + usados * REGISTRO.size > len(dados):
+        raise ErroFormatoBinario(f"Arquivo truncado: {usados} registros em uso não cabem no arquivo")
+    return usados, geracao
+
+
+def posicao_do_registro(indice):
+    """Retorna a posição, no arquivo de registros, do registro fixo de número `indice`."""
+    return CABECALHO.size + indice * REGISTRO.size
+
+
+class RegistroMapeado:
+    """
+    Tarefa do arquivo mapeado ainda não materializada (carregamento preguiçoso).
+
+    Guarda o status, o ordinal do vencimento e a posição do registro no conteúdo
+    do heap; a descrição é decodificada só quando pedida, e `tarefa` cria a Tarefa.
+    Tem os atributos de leitura da Tarefa usados pelos armazenamentos e pelos
+    índices do gerenciador.
+    """
+    __slots__ = ("_heap", "_deslocamento", "_data_vencimento", "chave", "vencimento_ordinal", "concluida")
+
+    def __init__(self, heap, deslocamento, chave, ordinal, data_vencimento, concluida):
+        """
+        Args:
+            heap (bytes): O conteúdo do heap de que o registro foi lido.
+            deslocamento (int): A posição do registro no heap.
+            chave: A chave do ID (ver `chave_do_id`).
+            ordinal (int or None): O ordinal do dia de vencimento, se houver.
+            data_vencimento: A data de vencimento em texto, quando não há ordinal.
+            concluida (bool): O status de conclusão (do registro fixo).
+        """
+        self._heap = heap
+        self._deslocamento = deslocamento
+        self._data_vencimento = data_vencimento
+        self.chave = chave
+        self.vencimento_ordinal = ordinal if ordinal is not None else ordinal_do_vencimento(data_vencimento)
+        self.concluida = concluida
+
+    @property
+    def data_vencimento(self):
+        """str or None: A data de vencimento da tarefa."""
+        if self._data_vencimento is None and self.vencimento_ordinal is not None:
+            return date.fromordinal(self.vencimento_ordinal).isoformat()
+        return self._data_vencimento
+
+    @property
+    def descricao(self):
+        """str: A descrição, decodificada do heap."""
+        return decodificar_registro(self._heap, self._deslocamento)[0][1]
+
+    def tarefa(self):
+        """
+        Cria a Tarefa do registro.
+
+        Raises:
+            ValueError: Se o registro for inválido (por exemplo, sem descrição).
+        """
+        (chave, descricao, ordinal, data_vencimento, _), _ = decodificar_registro(self._heap, self._deslocamento)
+        return Tarefa._de_forma_compacta(chave, descricao, ordinal, data_vencimento, self.concluida)
+
+    def to_dict(self):
+        """Retorna o dicionário da tarefa, como `Tarefa.to_dict`."""
+        return self.tarefa().to_dict()
@@ -0,0 +1,184 @@
+# gerenciador_tarefas/metricas.py
+
+"""
+Contadores e histogramas opcionais do GerenciadorDeTarefas e dos armazenamentos.
+
+A coleta só existe quando um objeto `Metricas` é passado ao gerenciador: sem ele,
+as operações não são embrulhadas e os pontos de medição internos custam apenas a
+verificação de um atributo None. Nomes usados:
+
+    operacoes.<operação>            chamadas de cada operação pública
+    latencia.<operação>             duração de cada chamada, em segundos
+    carga.duracao_s                 duração de cada carregamento
+    carga.registros                 tarefas carregadas
+    carga.registros_ignorados       registros inválidos descartados na carga
+    gravacao.duracao_s              duração de cada gravação (salvar ou registrar)
+    gravacao.alteracoes             alterações entregues ao armazenamento
+    gravacao.serializacao_s         tempo gerando o conteúdo de um arquivo
+    gravacao.sincronizacao_s        tempo de fsync e troca do arquivo
+    gravacao.bytes                  bytes gravados em arquivos
+    gravacao.segmentos              segmentos regravados (armazenamento segmentado)
+    gravacao.registros_ignorados    tarefas inválidas não gravadas
+"""
+
+import math
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+
+# Usado no lugar de `Metricas.cronometrar` quando a coleta está desativada.
+SEM_MEDICAO = nullcontext()
+
+
+class Histograma:
+    """
+    Distribuição de valores não negativos em baldes de potências de 2: o balde `e`
+    conta os valores em [2^(e-1), 2^e). Os percentis são estimados pelo limite
+    superior do balde, com erro relativo de no máximo 2x.
+    """
+    __slots__ = ("contagem", "soma", "minimo", "maximo", "_baldes")
+
+    def __init__(self):
+        self.contagem = 0
+        self.soma = 0.0
+        self.minimo = math.inf
+        self.maximo = 0.0
+        self._baldes = {}
+
+    def observar(self, valor):
+        """Registra um valor."""
+        self.contagem += 1
+        self.soma += valor
+        self.minimo = min(self.minimo, valor)
+        self.maximo = max(self.maximo, valor)
+        expoente = math.frexp(valor)[1] if valor > 0 else None
+        self._baldes[expoente] = self._baldes.get(expoente, 0) + 1
+
+    def percentil(self, fracao):
+        """
+        Estima um percentil.
+
+        Args:
+            fracao (float): Entre 0 e 1 (por exemplo, 0.99).
+
+        Returns:
+            float: O limite superior do balde do percentil, limitado ao máximo
+                   observado; 0.0 se não houver valores.
+        """
+        if not self.contagem:
+            return 0.0
+        alvo = max(1, math.ceil(fracao * self.contagem))
+        acumulado = 0
+        for expoente in sorted(self._baldes, key=lambda e: -math.inf if e is None else e):
+            acumulado += self._baldes[expoente]
+            if acumulado >= alvo:
+                return 0.0 if expoente is None else min(math.ldexp(1.0, expoente), self.maximo)
+        return self.maximo
+
+    def resumo(self):
+        """Retorna contagem, soma, mínimo, máximo, média e os percentis 50, 90 e 99."""
+        return {
+            "contagem": self.contagem,
+            "soma": self.soma,
+            "minimo": self.minimo if self.contagem else 0.0,
+            "maximo": self.maximo,
+            "media": self.soma / self.contagem if self.contagem else 0.0,
+            "p50": self.percentil(0.5),
+            "p90": self.percentil(0.9),
+            "p99": self.percentil(0.99),
+        }
+
+
+class Metricas:
+    """
+    Coleta contadores e histogramas. Pode ser usada por várias threads ao mesmo tempo.
+    """
+    def __init__(self):
+        self._contadores = {}
+        self._histogramas = {}
+        self._mutex = threading.Lock()
+
+    def incrementar(self, nome, quantidade=1):
+        """Soma `quantidade` ao contador `nome`."""
+        with self._mutex:
+            self._contadores[nome] = self._contadores.get(nome, 0) + quantidade
+
+    def observar(self, nome, valor):
+        """Registra um valor no histograma `nome`."""
+        with self._mutex:
+            histograma = self._histogramas.get(nome)
+            if histograma is None:
+                histograma = self._histogramas[nome] = Histograma()
+            histograma.observar(valor)
+
+    @contextmanager
+    def cronometrar(self, nome):
+        """Registra no histograma `nome` a duração do bloco `with`, em segundos."""
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observar(nome, time.perf_counter() - inicio)
+
+    def instrumentar(self, operacao, funcao):
+        """
+        Embrulha uma função para contar as chamadas (`operacoes.<operação>`) e
+        registrar a duração de cada uma (`latencia.<operação>`).
+
+        Returns:
+            callable: A função embrulhada.
+        """
+        contador, histograma = f"operacoes.{operacao}", f"latencia.{operacao}"
+
+        @wraps(funcao)
+        def instrumentada(*args, **kwargs):
+            inicio = time.perf_counter()
+            try:
+                return funcao(*args, **kwargs)
+            finally:
+                duracao = time.perf_counter() - inicio
+                self.incrementar(contador)
+                self.observar(histograma, duracao)
+        return instrumentada
+
+    def instantaneo(self):
+        """
+        Retorna uma cópia dos valores coletados até aqui.
+
+        Returns:
+            dict: {"contadores": {nome: valor}, "histogramas": {nome: resumo}}, com os
+                  nomes em ordem alfabética (ver `Histograma.resumo`).
+        """
+        with self._mutex:
+            return {
+                "contadores": dict(sorted(self._contadores.items())),
+                "histogramas": {nome: self._histogramas[nome].resumo() for nome in sorted(self._histogramas)},
+            }
+
+    def zerar(self):
+        """Descarta todos os valores coletados."""
+        with self._mutex:
+            self._contadores.clear()
+            self._histogramas.clear()
+
+
+def formatar_instantaneo(instantaneo):
+    """
+    Formata um instantâneo (ver `Metricas.instantaneo`) como linhas de texto. As
+    durações (histogramas `latencia.*` e terminados em "_s") são exibidas em milissegundos.
+
+    Returns:
+        list: As linhas.
+    """
+    linhas = []
+    for nome, valor in instantaneo["contadores"].items():
+        linhas.append(f"{nome:<32} {valor:>12}")
+    for nome, resumo in instantaneo["histogramas"].items():
+        duracao = nome.startswith("latencia.") or nome.endswith("_s")
+        escala, unidade = (1000, "ms") if duracao else (1, "")
+        valores = "  ".join(
+            f"{campo}={resumo[campo] * escala:.3f}{unidade}" for campo in ("media", "p50", "p90", "p99", "maximo")
+        )
+        linhas.append(f"{nome:<32} {resumo['contagem']:>12}  {valores}")
+    return linhas
@@ -0,0 +1,113 @@
+# gerenciador_tarefas/segmentos.py
+
+"""
+Layout do armazenamento segmentado (ver `ArmazenamentoSegmentado`).
+
+O arquivo de tarefas guarda só um manifesto pequeno; as tarefas ficam, na ordem
+de inserção, em segmentos de até N tarefas cada, em um diretório ao lado dele:
+
+    <arquivo>                               {"versao": 1, "proximo": S, "segmentos": ["segmento-00000000.json", ...]}
+    <arquivo>.segmentos/segmento-<S>.json   lista JSON, um objeto por linha
+
+Cada objeto é o de `Tarefa.to_dict`, então um segmento tem o mesmo formato do
+ArmazenamentoJSON. Um segmento alterado nunca é regravado no lugar: vai para um
+arquivo novo, com o próximo número S, e só passa a valer quando o manifesto é
+trocado, o que torna atômica a gravação de vários segmentos. Os arquivos
+substituídos são removidos depois da troca.
+"""
+
+import json
+import os
+
+VERSAO_SEGMENTADO = 1
+
+# Sufixo do diretório dos segmentos, ao lado do arquivo do manifesto.
+SUFIXO_DIRETORIO = ".segmentos"
+
+
+def diretorio_dos_segmentos(caminho):
+    """Retorna o diretório dos segmentos do arquivo de tarefas informado."""
+    return caminho + SUFIXO_DIRETORIO
+
+
+def nome_do_segmento(numero):
+    """Retorna o nome do arquivo de segmento de número `numero`."""
+    return f"segmento-{numero:08d}.json"
+
+
+def eh_segmento(nome):
+    """Indica se um nome de arquivo é o de um segmento."""
+    return nome.startswith("segmento-") and nome.endswith(".json")
+
+
+def eh_manifesto(caminho):
+    """
+    Indica se um arquivo existente é um manifesto de segmentos. Um arquivo que não
+    começa com um objeto JSON (como a lista do ArmazenamentoJSON) não é lido além
+    dos primeiros bytes.
+    """
+    try:
+        with open(caminho, "r", encoding="utf-8") as f:
+            if f.read(64).lstrip()[:1] != "{":
+                return False
+            f.seek(0)
+            dados = json.load(f)
+    except (OSError, ValueError):
+        return False
+    return isinstance(dados, dict) and "segmentos" in dados
+
+
+def codificar_manifesto(nomes, proximo):
+    """
+    Retorna o conteúdo do manifesto.
+
+    Args:
+        nomes (list): Os nomes dos arquivos de segmento, na ordem.
+        proximo (int): O número do próximo arquivo de segmento.
+    """
+    return json.dumps({"versao": VERSAO_SEGMENTADO, "proximo": proximo, "segmentos": nomes}) + "\n"
+
+
+def ler_manifesto(f):
+    """
+    Lê e valida um manifesto.
+
+    Args:
+        f: O arquivo do manifesto, aberto em modo texto.
+
+    Returns:
+        tuple: (nomes dos segmentos, número do próximo segmento).
+
+    Raises:
+        ValueError: Se o manifesto for inválido ou a versão não for suportada.
+    """
+    dados = json.load(f)
+    if not isinstance(dados, dict):
+        raise ValueError("O manifesto não é um objeto JSON")
+    if dados.get("versao", 0) > VERSAO_SEGMENTADO:
+        raise ValueError(f"Versão {dados['versao']} do formato não suportada (máxima: {VERSAO_SEGMENTADO})")
+    nomes, proximo = dados.get("segmentos"), dados.get("proximo")
+    if not isinstance(nomes, list) or type(proximo) is not int:
+        raise ValueError("Lista de segmentos ou próximo número inválidos")
+    for nome in nomes:
+        # Só nomes de segmento, sem diretórios: o manifesto não aponta para fora.
+        if not isinstance(nome, str) or os.path.basename(nome) != nome or not eh_segmento(nome):
+            raise ValueError(f"Nome de segmento inválido: {nome!r}")
+    return nomes, proximo
+
+
+def escrever_segmento(f, registros):
+    """
+    Escreve um segmento: uma lista JSON com um objeto por linha.
+
+    Args:
+        f: Arquivo aberto em modo texto.
+        registros (iterable): Os dicionários das tarefas.
+    """
+    f.write("[")
+    separador = "\n"
+    for dados in registros:
+        f.write(separador)
+        f.write(json.dumps(dados, ensure_ascii=False))
+        separador = ",\n"
+    f.write("\n]\n")
@@ -1,11 +1,106 @@
 # gerenciador_tarefas/tarefa.py
 
+import re
 import uuid
+from datetime import date
+from functools import lru_cache
+
+# Forma canônica de um UUID em texto, como produzida por str(uuid.UUID(...)).
+_UUID_CANONICO = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+
+
+def chave_do_id(id_tarefa):
+    """
+    Converte um ID de tarefa para a forma compacta usada internamente.
+
+    IDs que são UUIDs canônicos (36 caracteres, minúsculos) viram o inteiro de 128 bits
+    correspondente, que ocupa metade da memória da string. Outros textos são mantidos
+    como estão, o que preserva IDs personalizados, e IDs de outros tipos (como o
+    inteiro de um JSON escrito à mão) são guardados em uma tupla de um elemento para
+    não serem confundidos com um UUID. Assim, `id_da_chave(chave_do_id(x)) == x`.
+
+    Args:
+        id_tarefa: O ID da tarefa.
+
+    Returns:
+        int, str or tuple: A chave compacta do ID.
+    """
+    if type(id_tarefa) is str:
+        if len(id_tarefa) == 36 and _UUID_CANONICO.fullmatch(id_tarefa):
+            return int(id_tarefa.replace("-", ""), 16)
+        return id_tarefa
+    return (id_tarefa,)
+
+
+def id_da_chave(chave):
+    """Converte a chave compacta de volta para o ID original."""
+    if type(chave) is int:
+        h = "%032x" % chave
+        return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+    if type(chave) is tuple:
+        return chave[0]
+    return chave
+
+
+def _vencimento_compacto(data_vencimento):
+    """
+    Converte uma data de vencimento para a forma armazenada internamente.
+
+    Datas no formato YYYY-MM-DD viram o ordinal do dia (int). Outros textos são
+    mantidos como estão, e valores de outros tipos são guardados em uma tupla de um
+    elemento para não serem confundidos com um ordinal.
+    """
+    if data_vencimento is None:
+        return None
+    if not isinstance(data_vencimento, str):
+        return (data_vencimento,)
+    if len(data_vencimento) == 10:
+        return _ordinal_da_data(data_vencimento)
+    return data_vencimento
+
+
+@lru_cache(maxsize=4096)
+def _ordinal_da_data(texto):
+    # O cache faz tarefas com a mesma data compartilharem o mesmo objeto int.
+    try:
+        dia = date.fromisoformat(texto)
+    except ValueError:
+        return texto
+    return dia.toordinal() if dia.isoformat() == texto else texto
+
+
+def ordinal_do_vencimento(data_vencimento):
+    """
+    Retorna o ordinal do dia de uma data de vencimento no formato YYYY-MM-DD,
+    ou None se ela não estiver nesse formato.
+    """
+    vencimento = _vencimento_compacto(data_vencimento)
+    return vencimento if type(vencimento) is int else None
+
+
+def _vencimento_original(vencimento):
+    """Converte a data de vencimento armazenada de volta para o valor original."""
+    if type(vencimento) is int:
+        return date.fromordinal(vencimento).isoformat()
+    if type(vencimento) is tuple:
+        return vencimento[0]
+    return vencimento
+
 
 class Tarefa:
     """
     Representa uma tarefa individual no sistema.
+
+    Para reduzir a memória ocupada por cada tarefa, a classe usa `__slots__` e guarda
+    o ID e a data de vencimento em forma compacta (ver `chave_do_id`). Os atributos
+    `id` e `data_vencimento` continuam lendo e aceitando os mesmos textos de antes.
+
+    Quem mantém índices sobre as tarefas pode registrar um observador em
+    `_observador`: ele é chamado como `observador(tarefa, atributo)` sempre que
+    `descricao`, `concluida` ou `data_vencimento` mudam, mesmo por atribuição direta.
     """
+    __slots__ = ("_chave", "_descricao", "_vencimento", "_concluida", "_observador")
+
     def __init__(self, descricao, data_vencimento=None, id_tarefa=None, concluida=False):
         """
         Inicializa uma nova tarefa.
@@ -28,7 +123,8 @@ class Tarefa:
         if not desc_stripped:
             raise ValueError("A descrição da tarefa não pode ser vazia.")
 
-        self.id = id_tarefa if id_tarefa else str(uuid.uuid4())
+        self._observador = None
+        self._chave = chave_do_id(id_tarefa) if id_tarefa else uuid.uuid4().int
         self.descricao = desc_stripped
 
         # MODIFICATION START
@@ -41,6 +137,58 @@ class Tarefa:
         
         self.concluida = concluida
 
+    @property
+    def id(self):
+        """str: O ID único da tarefa."""
+        return id_da_chave(self._chave)
+
+    @id.setter
+    def id(self, id_tarefa):
+        self._chave = chave_do_id(id_tarefa)
+
+    @property
+    def chave(self):
+        """A forma compacta do ID, usada como chave nos índices (ver `chave_do_id`)."""
+        return self._chave
+
+    @property
+    def descricao(self):
+        """str: A descrição da tarefa."""
+        return self._descricao
+
+    @descricao.setter
+    def descricao(self, descricao):
+        self._descricao = descricao
+        if self._observador is not None:
+            self._observador(self, "descricao")
+
+    @property
+    def data_vencimento(self):
+        """str or None: A data de vencimento da tarefa."""
+        return _vencimento_original(self._vencimento)
+
+    @data_vencimento.setter
+    def data_vencimento(self, data_vencimento):
+        self._vencimento = _vencimento_compacto(data_vencimento)
+        if self._observador is not None:
+            self._observador(self, "data_vencimento")
+
+    @property
+    def vencimento_ordinal(self):
+        """int or None: O ordinal do dia de vencimento, se a data estiver no formato YYYY-MM-DD."""
+        return self._vencimento if type(self._vencimento) is int else None
+
+    @property
+    def concluida(self):
+        """bool: O status de conclusão da tarefa."""
+        return self._concluida
+
+    @concluida.setter
+    def concluida(self, concluida):
+        self._concluida = concluida
+        if self._observador is not None:
+            self._observador(self, "concluida")
+
     def marcar_como_concluida(self):
         """Marca a tarefa como concluída."""
         self.concluida = True
@@ -57,6 +205,10 @@ class Tarefa:
         data_str = f", Vencimento: {self.data_vencimento}" if self.data_vencimento else ""
         return f"ID: {self.id} | Descrição: {self.descricao}{data_str} | Status: {status}"
 
+    def __reduce__(self):
+        # Copiar ou serializar com pickle não leva junto o observador.
+        return (type(self), (self.descricao, self.data_vencimento, self.id, self.concluida))
+
     def to_dict(self):
         """
         Converte o objeto Tarefa para um dicionário, útil para serialização JSON.
@@ -68,6 +220,26 @@ class Tarefa:
             "concluida": self.concluida,
         }
 
+    @classmethod
+    def _de_forma_compacta(cls, chave, descricao, ordinal, data_vencimento, concluida):
+        """
+        Recria uma tarefa a partir da chave do ID e do ordinal do vencimento, sem
+        convertê-los de e para texto. Usado pelos formatos binários de persistência.
+        Método privado.
+
+        Raises:
+            ValueError: Se a descrição estiver vazia.
+        """
+        if not descricao.strip():
+            raise ValueError("A descrição da tarefa não pode ser vazia.")
+        tarefa = cls.__new__(cls)
+        tarefa._observador = None
+        tarefa._chave = chave
+        tarefa._descricao = descricao
+        tarefa._vencimento = ordinal if ordinal is not None else _vencimento_compacto(data_vencimento)
+        tarefa._concluida = concluida
+        return tarefa
+
     @classmethod
     def from_dict(cls, data_dict):
         """
@@ -0,0 +1,225 @@
+# gerenciador_tarefas/trava.py
+
+"""
+Travas usadas pelo gerenciador de tarefas.
+
+`TravaLeituraEscrita` coordena as threads de um mesmo processo que usam um
+gerenciador: várias leituras ao mesmo tempo ou uma escrita exclusiva.
+
+`TravaDeArquivo` coordena processos que usam o mesmo arquivo de tarefas. Cada arquivo de persistência tem ao lado um arquivo de trava (`<arquivo>.trava`).
+Ele é travado com `fcntl.flock` (ou `msvcrt.locking`, no Windows) enquanto um
+processo lê ou grava as tarefas, e guarda o número da geração: um inteiro
+incrementado a cada gravação. Um processo que carregou as tarefas na geração N e
+encontra outra geração ao gravar sabe que outro processo gravou nesse meio tempo.
+
+O arquivo de trava não é o próprio arquivo de tarefas porque este é substituído
+a cada gravação atômica (`os.replace`), e a trava ficaria presa ao arquivo antigo.
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+from .eventos import AVISO, notificar
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+def _travar(fd):
+    """Obtém a trava exclusiva do arquivo, esperando o tempo que for preciso."""
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        return
+    os.lseek(fd, 0, os.SEEK_SET)
+    while True:
+        try:
+            # LK_LOCK desiste após cerca de 10 segundos com OSError; tenta de novo.
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            pass
+
+
+def _destravar(fd):
+    """Libera a trava exclusiva do arquivo."""
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        return
+    os.lseek(fd, 0, os.SEEK_SET)
+    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+class TravaDeArquivo:
+    """
+    Trava exclusiva e reentrante sobre um arquivo de trava, com o contador de geração.
+
+    Attributes:
+        caminho (str): Caminho do arquivo de trava.
+        geracao (int or None): A última geração lida (`sincronizar`) ou gravada
+                               (`avancar`) por esta instância; None se nenhuma.
+    """
+    def __init__(self, caminho):
+        """
+        Args:
+            caminho (str): Caminho do arquivo de trava, criado se não existir.
+        """
+        self.caminho = caminho
+        self.geracao = None
+        self._fd = None
+        self._profundidade = 0
+        # Exclui as outras threads do processo, que compartilhariam o mesmo descritor.
+        self._mutex = threading.RLock()
+
+    @contextmanager
+    def exclusiva(self):
+        """
+        Mantém a trava durante o bloco `with`. Blocos aninhados na mesma thread
+        reaproveitam a trava já obtida; outras threads esperam. Se o arquivo de trava
+        não puder ser criado (por exemplo, em um diretório somente leitura), avisa e
+        segue sem a trava entre processos.
+        """
+        with self._mutex:
+            if self._profundidade == 0:
+                try:
+                    fd = os.open(self.caminho, os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o666)
+                except OSError as e:
+                    notificar(
+                        AVISO, "trava.indisponivel",
+                        f"Aviso: não foi possível criar a trava {self.caminho}: {e}. Continuando sem trava.",
+                        caminho=self.caminho,
+                    )
+                    fd = None
+                if fd is not None:
+                    try:
+                        _travar(fd)
+                    except BaseException:
+                        os.close(fd)
+                        raise
+                self._fd = fd
+            self._profundidade += 1
+            try:
+                yield self
+            finally:
+                self._profundidade -= 1
+                if self._profundidade == 0 and self._fd is not None:
+                    fd, self._fd = self._fd, None
+                    try:
+                        _destravar(fd)
+                    finally:
+                        os.close(fd)
+
+    def _ler(self):
+        """Geração gravada no arquivo de trava (0 se vazio ou sem trava). Método privado."""
+        if self._fd is None:
+            return 0
+        os.lseek(self._fd, 0, os.SEEK_SET)
+        conteudo = os.read(self._fd, 32).strip()
+        try:
+            return int(conteudo or 0)
+        except ValueError:
+            return 0
+
+    def sincronizar(self):
+        """Registra a geração atual como a conhecida por esta instância. Requer a trava."""
+        self.geracao = self._ler()
+
+    def desatualizada(self):
+        """
+        Indica se outro processo gravou desde a última sincronização ou gravação
+        desta instância. Requer a trava.
+
+        Returns:
+            bool: True se a geração no arquivo for outra que a conhecida.
+        """
+        return self.geracao is not None and self._fd is not None and self._ler() != self.geracao
+
+    def avancar(self):
+        """Incrementa a geração no arquivo e a registra como a conhecida. Requer a trava."""
+        if self._fd is None:
+            return
+        geracao = self._ler() + 1
+        dados = str(geracao).encode("ascii")
+        os.lseek(self._fd, 0, os.SEEK_SET)
+        os.write(self._fd, dados)
+        os.ftruncate(self._fd, len(dados))
+        self.geracao = geracao
+
+
+class TravaLeituraEscrita:
+    """
+    Trava de leitura e escrita entre threads: vários leitores ao mesmo tempo ou um
+    único escritor.
+
+    É reentrante: uma thread que já lê pode ler de novo, e uma thread que escreve
+    pode ler e escrever de novo. Passar de leitura para escrita na mesma thread não
+    é permitido, pois duas threads fazendo isso se esperariam para sempre. Escritores
+    esperando têm preferência sobre novos leitores, para não esperarem indefinidamente.
+    """
+    def __init__(self):
+        self._condicao = threading.Condition(threading.Lock())
+        self._leitores = 0
+        self._escritores_esperando = 0
+        self._escritor = None
+        self._profundidade_escrita = 0
+        self._local = threading.local()
+
+    @contextmanager
+    def leitura(self):
+        """Mantém a trava de leitura durante o bloco `with`."""
+        thread = threading.get_ident()
+        if self._escritor == thread:
+            # Quem escreve também pode ler.
+            yield self
+            return
+        profundidade = getattr(self._local, "profundidade", 0)
+        if profundidade == 0:
+            with self._condicao:
+                while self._escritor is not None or self._escritores_esperando:
+                    self._condicao.wait()
+                self._leitores += 1
+        self._local.profundidade = profundidade + 1
+        try:
+            yield self
+        finally:
+            self._local.profundidade = profundidade
+            if profundidade == 0:
+                with self._condicao:
+                    self._leitores -= 1
+                    if self._leitores == 0:
+                        self._condicao.notify_all()
+
+    @contextmanager
+    def escrita(self):
+        """
+        Mantém a trava de escrita durante o bloco `with`.
+
+        Raises:
+            RuntimeError: Se a thread estiver com a trava de leitura.
+        """
+        thread = threading.get_ident()
+        if self._escritor != thread:
+            if getattr(self._local, "profundidade", 0):
+                raise RuntimeError("Não é possível obter a trava de escrita durante uma leitura na mesma thread.")
+            with self._condicao:
+                self._escritores_esperando += 1
+                try:
+                    while self._escritor is not None or self._leitores:
+                        self._condicao.wait()
+                except BaseException:
+                    self._escritores_esperando -= 1
+                    self._condicao.notify_all()
+                    raise
+                self._escritores_esperando -= 1
+                self._escritor = thread
+        self._profundidade_escrita += 1
+        try:
+            yield self
+        finally:
+            self._profundidade_escrita -= 1
+            if self._profundidade_escrita == 0:
+                with self._condicao:
+                    self._escritor = None
+                    self._condicao.notify_all()
@@ -1,7 +1,13 @@
 # main.py
 
+import argparse
+import json
+import shlex
 import sys
+from gerenciador_tarefas import eventos
+from gerenciador_tarefas.armazenamento import criar_armazenamento, migrar, tipo_do_caminho
 from gerenciador_tarefas.logica import GerenciadorDeTarefas
+from gerenciador_tarefas.metricas import Metricas, formatar_instantaneo
 
 def exibir_menu():
     """Exibe o menu de opções para o usuário."""
@@ -10,15 +16,311 @@ def exibir_menu():
     print("2. Visualizar Tarefas")
     print("3. Marcar Tarefa como Concluída")
     print("4. Remover Tarefa")
+    # Sair fica por último na tela, mas mantém o número 5, usado por scripts que
+    # alimentam o menu pela entrada padrão.
+    print("6. Buscar Tarefas")
     print("5. Sair")
     print("------------------------------")
 
-def main():
-    """Função principal que executa o loop da aplicação CLI."""
+# Quantidade de tarefas exibidas por página na opção "Visualizar Tarefas".
+TAMANHO_PAGINA = 20
+
+def exibir_tarefas_paginadas(gerenciador, tamanho_pagina=TAMANHO_PAGINA):
+    """
+    Exibe as tarefas uma página por vez. Cada página é pedida ao gerenciador com o
+    seu deslocamento e limite, então nem as demais tarefas são formatadas nem as
+    chaves de todas são copiadas; entre as páginas, o usuário pode continuar ou
+    voltar ao menu.
+    """
+    deslocamento = 0
+    pagina = list(gerenciador.iterar_visualizacao(deslocamento=deslocamento, limite=tamanho_pagina))
+    if not pagina:
+        print("Nenhuma tarefa cadastrada." if len(gerenciador) == 0
+              else "Nenhuma tarefa corresponde aos critérios de filtro.")
+        return
+
+    while pagina:
+        for t_str in pagina:
+            print(t_str)
+        # Busca a próxima página antes de perguntar, para só perguntar se ela existir.
+        deslocamento += tamanho_pagina
+        pagina = list(gerenciador.iterar_visualizacao(deslocamento=deslocamento, limite=tamanho_pagina))
+        if pagina:
+            resposta = input("Pressione Enter para ver mais tarefas ou digite 'q' para voltar ao menu: ")
+            if resposta.strip().lower() == "q":
+                break
+
+# Arquivo de persistência usado quando nenhum é informado.
+ARQUIVO_PADRAO = "tarefas.json"
+
+# Subcomandos não interativos, aceitos na linha de comando e nas linhas de um lote.
+SUBCOMANDOS = ("add", "list", "done", "rm", "import", "export", "stats")
+
+# Opções globais que recebem um valor (ver `_separar_subcomando`).
+_OPCOES_COM_VALOR = ("--armazenamento", "--migrar", "--batch", "--fragmentos", "--refragmentar")
+
+# Campos posicionais e opções de cada comando na forma NDJSON de um lote.
+_CAMPOS_NDJSON = {"add": ("descricao",), "list": (), "done": ("id",), "rm": ("id",),
+                  "import": ("origem",), "export": ("destino",), "stats": ()}
+_OPCOES_NDJSON = (("data_vencimento", "--vencimento"), ("status", "--status"), ("formato", "--formato"))
+
+def _adicionar_subcomandos(subparsers):
+    """Registra os subcomandos não interativos em um conjunto de subparsers."""
+    add = subparsers.add_parser("add", help="adiciona uma tarefa")
+    add.add_argument("descricao", help="descrição da tarefa")
+    add.add_argument("--vencimento", metavar="YYYY-MM-DD", help="data de vencimento")
+    listar = subparsers.add_parser("list", help="lista as tarefas")
+    listar.add_argument("--status", choices=["todas", "pendentes", "concluidas"], default="todas",
+                        help="quais tarefas listar (padrão: todas)")
+    concluir = subparsers.add_parser("done", help="marca uma tarefa como concluída")
+    concluir.add_argument("id", help="ID da tarefa, completo ou abreviado")
+    remover = subparsers.add_parser("rm", help="remove uma tarefa")
+    remover.add_argument("id", help="ID da tarefa, completo ou abreviado")
+    importar = subparsers.add_parser("import", help="importa tarefas de um arquivo NDJSON ou CSV")
+    importar.add_argument("origem", help="arquivo .ndjson, .jsonl ou .csv")
+    importar.add_argument("--formato", choices=["ndjson", "csv"], help="formato, se não for deduzido pela extensão")
+    exportar = subparsers.add_parser("export", help="exporta as tarefas para um arquivo NDJSON ou CSV")
+    exportar.add_argument("destino", help="arquivo .ndjson, .jsonl ou .csv")
+    exportar.add_argument("--formato", choices=["ndjson", "csv"], help="formato, se não for deduzido pela extensão")
+    estatisticas = subparsers.add_parser("stats", help="mostra as métricas de carga, gravação e operações")
+    estatisticas.add_argument("--formato", choices=["texto", "json"], default="texto",
+                              help="texto (padrão) ou JSON, para consumo por outros programas")
+
+def criar_parser_de_comandos(prog="main.py [arquivo]"):
+    """Cria o parser de um subcomando, usado na linha de comando e em cada linha de um lote."""
+    parser = argparse.ArgumentParser(prog=prog, add_help=False)
+    _adicionar_subcomandos(parser.add_subparsers(dest="comando", required=True))
+    return parser
+
+def criar_parser():
+    """Cria o parser dos argumentos de linha de comando."""
+    parser = argparse.ArgumentParser(
+        description="Gerenciador de Tarefas Simples (CLI). Sem subcomando, abre o menu interativo.",
+        usage="%(prog)s [opções] [arquivo] [COMANDO ...]",
+        epilog="comandos (após o arquivo): add DESCRICAO [--vencimento YYYY-MM-DD], "
+               "list [--status {todas,pendentes,concluidas}], done ID, rm ID, "
+               "import ORIGEM, export DESTINO, stats [--formato json]. "
+               "Ex.: python main.py tarefas.json add \"Comprar pão\"",
+    )
+    parser.add_argument("arquivo", nargs="?", default=ARQUIVO_PADRAO,
+                        help="arquivo de persistência (padrão: tarefas.json)")
+    parser.add_argument("--armazenamento", choices=["json", "sqlite", "binario", "mapeado", "fragmentado", "segmentado"],
+                        help="formato de persistência; por padrão é deduzido pela extensão do arquivo "
+                             "(.db, .sqlite e .sqlite3 usam SQLite; .bin e .tarefas, o formato binário; "
+                             ".mmap, o armazenamento mapeado em memória; um diretório, ou um caminho "
+                             "terminado em barra, o armazenamento fragmentado; um arquivo com um "
+                             "manifesto de segmentos, o segmentado)")
+    parser.add_argument("--migrar", metavar="DESTINO",
+                        help="copia as tarefas do arquivo para DESTINO (formato deduzido pela extensão) e sai")
+    parser.add_argument("--fragmentos", metavar="N", type=int,
+                        help="número de fragmentos de um diretório fragmentado novo (o do arquivo ou, "
+                             "com --migrar, o de DESTINO)")
+    parser.add_argument("--refragmentar", metavar="N", type=int,
+                        help="redistribui as tarefas do diretório fragmentado em N fragmentos e sai")
+    parser.add_argument("--metricas", action="store_true",
+                        help="coleta contadores e latências do carregamento, das gravações e das operações "
+                             "e os exibe ao final (o subcomando stats já as coleta)")
+    parser.add_argument("--batch", metavar="ARQUIVO",
+                        help="executa os comandos de ARQUIVO ('-' para a entrada padrão), um por linha, "
+                             "em texto (ex.: add \"Comprar pão\" --vencimento 2025-01-01) ou NDJSON "
+                             "(ex.: {\"comando\": \"done\", \"id\": \"3f2a\"}), com um único carregamento "
+                             "e uma única gravação")
+    return parser
+
+def _separar_subcomando(argv):
+    """
+    Separa os argumentos globais dos do subcomando, que começam no primeiro argumento
+    posicional com o nome de um subcomando. O argparse não consegue combinar o arquivo
+    (posicional opcional) com subparsers: `main.py tarefas.json` seria lido como um
+    subcomando chamado "tarefas.json".
+
+    Returns:
+        tuple: (argumentos globais, argumentos do subcomando ou None).
+    """
+    posicao = 0
+    while posicao < len(argv):
+        argumento = argv[posicao]
+        if argumento in _OPCOES_COM_VALOR:
+            posicao += 2
+        elif argumento in SUBCOMANDOS:
+            return argv[:posicao], argv[posicao:]
+        else:
+            posicao += 1
+    return argv, None
+
+def executar_subcomando(gerenciador, args):
+    """
+    Executa um subcomando já interpretado.
+
+    Returns:
+        bool: True se o comando teve sucesso, False caso contrário.
+    """
+    if args.comando == "add":
+        return gerenciador.adicionar_tarefa(args.descricao, args.vencimento) is not None
+    if args.comando == "list":
+        for t_str in gerenciador.visualizar_tarefas(mostrar_concluidas=args.status != "pendentes",
+                                                    mostrar_pendentes=args.status != "concluidas"):
+            print(t_str)
+        return True
+    if args.comando == "done":
+        return gerenciador.marcar_tarefa_como_concluida(args.id)
+    if args.comando == "rm":
+        return gerenciador.remover_tarefa(args.id)
+    if args.comando == "stats":
+        return exibir_metricas(gerenciador, args.formato)
+    try:
+        if args.comando == "import":
+            return gerenciador.importar(args.origem, formato=args.formato) is not None
+        return gerenciador.exportar(args.destino, formato=args.formato) is not None
+    except ValueError as e:
+        print(f"Erro: {e}")
+        return False
+
+def exibir_metricas(gerenciador, formato="texto"):
+    """
+    Exibe o instantâneo das métricas do gerenciador, em texto ou JSON.
+
+    Returns:
+        bool: False se a coleta de métricas estiver desativada.
+    """
+    if gerenciador.metricas is None:
+        print("As métricas estão desativadas. Use a opção --metricas.")
+        return False
+    instantaneo = gerenciador.metricas.instantaneo()
+    if formato == "json":
+        print(json.dumps(instantaneo, indent=4, ensure_ascii=False))
+    else:
+        for linha in formatar_instantaneo(instantaneo):
+            print(linha)
+    return True
+
+def _argumentos_da_linha(linha):
+    """
+    Converte uma linha de lote (texto ou objeto NDJSON) nos argumentos de um comando.
+    Retorna None para linhas vazias e comentários (iniciados por '#').
+
+    Raises:
+        ValueError: Se a linha não puder ser interpretada.
+    """
+    linha = linha.strip()
+    if not linha or linha.startswith("#"):
+        return None
+    if not linha.startswith("{"):
+        return shlex.split(linha)
+    registro = json.loads(linha)
+    if not isinstance(registro, dict):
+        raise ValueError("o registro NDJSON deve ser um objeto")
+    comando = str(registro.get("comando"))
+    argv = [comando] + [str(registro[campo]) for campo in _CAMPOS_NDJSON.get(comando, ())
+                        if registro.get(campo) is not None]
+    for campo, opcao in _OPCOES_NDJSON:
+        if registro.get(campo) is not None:
+            argv += [opcao, str(registro[campo])]
+    return argv
+
+def executar_lote(gerenciador, linhas):
+    """
+    Executa um comando por linha dentro de um único lote do gerenciador, de modo que
+    as tarefas são gravadas uma só vez, ao final. Linhas inválidas são informadas e
+    não interrompem as seguintes.
+
+    Args:
+        gerenciador (GerenciadorDeTarefas): O gerenciador já carregado.
+        linhas (iterable): As linhas do lote (ex.: um arquivo aberto).
+
+    Returns:
+        int: Quantos comandos falharam.
+    """
+    parser = criar_parser_de_comandos(prog="lote")
+    falhas = 0
+    with gerenciador.lote():
+        for numero, linha in enumerate(linhas, start=1):
+            try:
+                argv = _argumentos_da_linha(linha)
+                if argv is None:
+                    continue
+                args = parser.parse_args(argv)
+            except (ValueError, SystemExit):
+                # O argparse informa o erro de uso e sai com SystemExit.
+                print(f"Erro na linha {numero} do lote: comando inválido: {linha.strip()}")
+                falhas += 1
+                continue
+            if not executar_subcomando(gerenciador, args):
+                falhas += 1
+    return falhas
+
+def main(argv=None):
+    """
+    Função principal da aplicação CLI. Sem subcomando nem `--batch`, executa o loop
+    do menu interativo.
+
+    Returns:
+        int: O código de saída (0 em caso de sucesso; 1 se algum comando falhou).
+    """
+    # A biblioteca é silenciosa por padrão; a linha de comando exibe as mensagens.
+    eventos.instalar(eventos.NotificadorConsole())
     # Usa o primeiro argumento da linha de comando como nome do arquivo,
     # caso contrário, usa o padrão "tarefas.json".
-    nome_arquivo = sys.argv[1] if len(sys.argv) > 1 else "tarefas.json"
-    gerenciador = GerenciadorDeTarefas(arquivo_json=nome_arquivo)
+    parser = criar_parser()
+    globais, argv_comando = _separar_subcomando(sys.argv[1:] if argv is None else argv)
+    args = parser.parse_args(globais)
+    comando = None if argv_comando is None else criar_parser_de_comandos().parse_args(argv_comando)
+    if args.batch and comando:
+        parser.error("--batch não pode ser combinado com um subcomando")
+    tipo = args.armazenamento or tipo_do_caminho(args.arquivo)
+    tipo_destino = tipo_do_caminho(args.migrar) if args.migrar else None
+    if args.fragmentos is not None and "fragmentado" not in (tipo, tipo_destino):
+        parser.error("--fragmentos só se aplica ao armazenamento fragmentado")
+    if args.refragmentar is not None and tipo != "fragmentado":
+        parser.error("--refragmentar só se aplica ao armazenamento fragmentado")
+    fragmentos = {} if args.fragmentos is None else {"fragmentos": args.fragmentos}
+    try:
+        armazenamento = criar_armazenamento(args.arquivo, tipo=tipo, **(fragmentos if tipo == "fragmentado" else {}))
+        destino = args.migrar and criar_armazenamento(
+            args.migrar, **(fragmentos if tipo_destino == "fragmentado" else {})
+        )
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.refragmentar is not None:
+        try:
+            total = armazenamento.refragmentar(args.refragmentar)
+        except ValueError as e:
+            parser.error(str(e))
+        finally:
+            armazenamento.fechar()
+        print(f"{total} tarefa(s) redistribuída(s) em {args.refragmentar} fragmento(s) em {args.arquivo}.")
+        return 0
+
+    if args.migrar:
+        total = migrar(armazenamento, destino)
+        print(f"{total} tarefa(s) migrada(s) de {args.arquivo} para {args.migrar}.")
+        return 0
+
+    estatisticas = comando is not None and comando.comando == "stats"
+    metricas = Metricas() if args.metricas or estatisticas else None
+    gerenciador = GerenciadorDeTarefas(armazenamento=armazenamento, metricas=metricas)
+
+    if comando:
+        with gerenciador:
+            sucesso = executar_subcomando(gerenciador, comando)
+        if args.metricas and not estatisticas:
+            exibir_metricas(gerenciador)
+        return 0 if sucesso else 1
+    if args.batch:
+        with gerenciador:
+            if args.batch == "-":
+                falhas = executar_lote(gerenciador, sys.stdin)
+            else:
+                try:
+                    with open(args.batch, "r", encoding="utf-8") as arquivo:
+                        falhas = executar_lote(gerenciador, arquivo)
+                except OSError as e:
+                    print(f"Erro ao ler o arquivo de comandos {args.batch}: {e}")
+                    return 1
+        if args.metricas:
+            exibir_metricas(gerenciador)
+        return 1 if falhas else 0
 
     while True:
         exibir_menu()
@@ -32,27 +334,34 @@ def main():
         
         elif escolha == "2":
             print("\n--- Lista de Tarefas ---")
-            tarefas_str = gerenciador.visualizar_tarefas()
-            # A função visualizar_tarefas já retorna uma lista com mensagens apropriadas
-            # se não houver tarefas, então podemos simplesmente iterar e imprimir.
-            for t_str in tarefas_str:
-                print(t_str)
+            exibir_tarefas_paginadas(gerenciador)
             print("------------------------")
 
         elif escolha == "3":
-            id_tarefa = input("Digite o ID da tarefa a ser marcada como concluída: ")
+            id_tarefa = input("Digite o ID da tarefa a ser marcada como concluída (ou apenas o início dele): ")
             gerenciador.marcar_tarefa_como_concluida(id_tarefa)
 
         elif escolha == "4":
-            id_tarefa = input("Digite o ID da tarefa a ser removida: ")
+            id_tarefa = input("Digite o ID da tarefa a ser removida (ou apenas o início dele): ")
             gerenciador.remover_tarefa(id_tarefa)
 
+        elif escolha == "6":
+            consulta = input("Digite as palavras da busca (use OU para alternativas e * no fim para prefixos): ")
+            print("\n--- Resultado da Busca ---")
+            encontradas = gerenciador.buscar_tarefas(consulta)
+            for tarefa in encontradas:
+                print(tarefa)
+            if not encontradas:
+                print("Nenhuma tarefa encontrada para a busca.")
+            print("--------------------------")
+
         elif escolha == "5":
             print("Saindo do Gerenciador de Tarefas. Até logo!")
-            break
+            gerenciador.fechar()
+            return 0
         
         else:
             print("Opção inválida. Por favor, tente novamente.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
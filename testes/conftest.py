@@ -0,0 +1,65 @@
+# testes/conftest.py
+
+import glob
+import os
+import threading
+import time
+import pytest
+from gerenciador_tarefas import eventos
+from gerenciador_tarefas.logica import GerenciadorDeTarefas
+
+
+@pytest.fixture(autouse=True, scope="session")
+def remover_travas():
+    """Remove os arquivos de trava (`*.trava`) que os testes deixam no diretório atual."""
+    existentes = set(glob.glob("*.trava"))
+    yield
+    for caminho in set(glob.glob("*.trava")) - existentes:
+        try:
+            os.remove(caminho)
+        except OSError:
+            pass
+
+
+@pytest.fixture(autouse=True)
+def notificador_console():
+    """
+    Instala o notificador da linha de comando durante cada teste, para que as
+    mensagens da biblioteca continuem aparecendo em `capsys`.
+    """
+    with eventos.usando(eventos.NotificadorConsole()) as notificador:
+        yield notificador
+
+
+@pytest.fixture
+def contar_gravacoes():
+    """
+    Fábrica que substitui o `registrar` do armazenamento de um gerenciador por um
+    que anota cada chamada, como (nome da thread, número de alterações), e pode
+    demorar `atraso` segundos. Retorna a lista das chamadas.
+    """
+    def contar(gerenciador, atraso=0):
+        chamadas = []
+        registrar_original = gerenciador._armazenamento.registrar
+
+        def registrar(alteracoes, tarefas, alteradas=None):
+            chamadas.append((threading.current_thread().name, len(alteracoes)))
+            time.sleep(atraso)
+            registrar_original(alteracoes, tarefas, alteradas)
+
+        gerenciador._armazenamento.registrar = registrar
+        return chamadas
+    return contar
+
+
+@pytest.fixture
+def abrir_gerenciador(fabrica_de_armazenamento):
+    """
+    Fábrica de gerenciadores sobre o armazenamento criado por `fabrica_de_armazenamento`,
+    fixture que cada módulo de testes de armazenamento define. As opções nomeadas vão
+    para o armazenamento; as do gerenciador, em `opcoes_do_gerenciador`.
+    """
+    def abrir(caminho, opcoes_do_gerenciador=None, **opcoes):
+        armazenamento = fabrica_de_armazenamento(caminho, **opcoes)
+        return GerenciadorDeTarefas(armazenamento=armazenamento, **(opcoes_do_gerenciador or {}))
+    return abrir
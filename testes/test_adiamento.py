@@ -0,0 +1,106 @@
+# testes/test_adiamento.py
+
+import json
+import os
+import subprocess
+import sys
+import time
+import pytest
+from gerenciador_tarefas.adiamento import GravadorAdiado
+from gerenciador_tarefas.logica import GerenciadorDeTarefas
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def ids_gravados(caminho):
+    if not os.path.exists(caminho):
+        return []
+    with open(caminho, encoding="utf-8") as f:
+        return [dados["id"] for dados in json.load(f)]
+
+
+def esperar(condicao, limite=5.0):
+    fim = time.monotonic() + limite
+    while not condicao():
+        if time.monotonic() > fim:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+class TestGravacaoAdiada:
+    """
+    Conjunto de testes para a gravação adiada (write-behind) do gerenciador.
+    """
+
+    def test_rajada_vira_poucas_gravacoes(self, tmp_path, contar_gravacoes):
+        """Muitas alterações seguidas são gravadas juntas depois do silêncio."""
+        caminho = str(tmp_path / "tarefas.json")
+        ger = GerenciadorDeTarefas(arquivo_json=caminho, adiar_gravacao=0.3, atraso_maximo_gravacao=30)
+        chamadas = contar_gravacoes(ger)
+        tarefas = [ger.adicionar_tarefa(f"Tarefa {i}") for i in range(300)]
+        for tarefa in tarefas[::2]:
+            ger.marcar_tarefa_como_concluida(tarefa.id)
+        assert chamadas == []
+
+        # Espera pelas chamadas, e não lendo o arquivo, que não pode estar aberto
+        # enquanto é substituído no Windows.
+        assert esperar(lambda: sum(n for _, n in chamadas) == 450)
+        assert len(chamadas) <= 2
+        ger.fechar()
+        assert len(ids_gravados(caminho)) == 300
+        recarregado = GerenciadorDeTarefas(arquivo_json=caminho)
+        assert sum(t.concluida for t in recarregado.tarefas) == 150
+
+    def test_atraso_maximo(self, tmp_path, contar_gravacoes):
+        """Se as alterações não param, a gravação acontece no atraso máximo."""
+        caminho = str(tmp_path / "tarefas.json")
+        ger = GerenciadorDeTarefas(arquivo_json=caminho, adiar_gravacao=0.2, atraso_maximo_gravacao=0.4)
+        chamadas = contar_gravacoes(ger)
+        fim = time.monotonic() + 1.5
+        while time.monotonic() < fim:
+            ger.adicionar_tarefa("Contínua")
+            time.sleep(0.02)
+        assert len(chamadas) >= 2
+        ger.fechar()
+        assert len(ids_gravados(caminho)) == len(ger)
+
+    def test_descarregar_e_fechar(self, tmp_path, contar_gravacoes):
+        """`descarregar` grava na hora; `fechar` grava o que restou."""
+        caminho = str(tmp_path / "tarefas.json")
+        ger = GerenciadorDeTarefas(arquivo_json=caminho, adiar_gravacao=60)
+        chamadas = contar_gravacoes(ger)
+        primeira = ger.adicionar_tarefa("Primeira")
+        ger.descarregar()
+        assert ids_gravados(caminho) == [primeira.id] and [n for _, n in chamadas] == [1]
+        ger.descarregar()
+        assert len(chamadas) == 1
+
+        segunda = ger.adicionar_tarefa("Segunda")
+        assert ids_gravados(caminho) == [primeira.id]
+        ger.fechar()
+        assert ids_gravados(caminho) == [primeira.id, segunda.id]
+        # Depois de fechar, as alterações são gravadas na hora.
+        terceira = ger.adicionar_tarefa("Terceira")
+        assert ids_gravados(caminho)[-1] == terceira.id
+
+    def test_grava_ao_fim_do_processo(self, tmp_path):
+        """Um gerenciador não fechado grava as alterações pendentes quando o processo termina."""
+        caminho = str(tmp_path / "tarefas.json")
+        codigo = (
+            "from gerenciador_tarefas.logica import GerenciadorDeTarefas\n"
+            f"ger = GerenciadorDeTarefas(arquivo_json={caminho!r}, adiar_gravacao=60)\n"
+            "ger.adicionar_tarefa('Sem fechar')\n"
+        )
+        subprocess.run([sys.executable, "-c", codigo], cwd=RAIZ, check=True, timeout=60)
+        assert len(ids_gravados(caminho)) == 1
+
+    def test_opcoes_invalidas(self, tmp_path):
+        """Tempos inválidos e a combinação com a gravação em segundo plano são recusados."""
+        caminho = str(tmp_path / "tarefas.json")
+        with pytest.raises(ValueError):
+            GerenciadorDeTarefas(arquivo_json=caminho, adiar_gravacao=1, gravar_em_segundo_plano=True)
+        with pytest.raises(ValueError):
+            GravadorAdiado(lambda: None, silencio=2, atraso_maximo=1)
+        with pytest.raises(ValueError):
+            GravadorAdiado(lambda: None, silencio=-1)
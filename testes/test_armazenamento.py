@@ -0,0 +1,164 @@
+# testes/test_armazenamento.py
+
+import json
+import sqlite3
+import pytest
+from gerenciador_tarefas.armazenamento import (
+    ArmazenamentoJSON, ArmazenamentoSQLite, criar_armazenamento, migrar,
+)
+from gerenciador_tarefas.logica import GerenciadorDeTarefas
+
+
+@pytest.fixture
+def arquivo_banco(tmp_path):
+    """Caminho de um banco SQLite temporário."""
+    return str(tmp_path / "tarefas_teste.db")
+
+
+def linhas_do_banco(caminho):
+    """Lê diretamente as linhas da tabela de tarefas, na ordem de inserção."""
+    with sqlite3.connect(caminho) as conexao:
+        return conexao.execute(
+            "SELECT id, descricao, data_vencimento, concluida FROM tarefas ORDER BY posicao"
+        ).fetchall()
+
+
+class TestArmazenamentoSQLite:
+    """
+    Conjunto de testes para o armazenamento em SQLite.
+    """
+
+    def test_operacoes_persistidas_e_recarregadas(self, arquivo_banco):
+        """Adicionar, concluir e remover são persistidos e recarregados na mesma ordem."""
+        ger = GerenciadorDeTarefas(armazenamento=ArmazenamentoSQLite(arquivo_banco))
+        t1 = ger.adicionar_tarefa("SQLite 1", "2025-01-10")
+        t2 = ger.adicionar_tarefa("SQLite 2")
+        t3 = ger.adicionar_tarefa("SQLite 3")
+        ger.marcar_tarefa_como_concluida(t1.id)
+        ger.remover_tarefa(t2.id)
+        ger.fechar()
+
+        assert linhas_do_banco(arquivo_banco) == [
+            (t1.id, "SQLite 1", "2025-01-10", 1),
+            (t3.id, "SQLite 3", None, 0),
+        ]
+        recarregado = GerenciadorDeTarefas(armazenamento=ArmazenamentoSQLite(arquivo_banco))
+        assert [t.to_dict() for t in recarregado.tarefas] == [t1.to_dict(), t3.to_dict()]
+
+    def test_alteracoes_nao_reescrevem_a_tabela(self, arquivo_banco, monkeypatch):
+        """Cada alteração é um comando de uma linha; a tabela não é regravada por inteiro."""
+        armazenamento = ArmazenamentoSQLite(arquivo_banco)
+        ger = GerenciadorDeTarefas(armazenamento=armazenamento)
+        monkeypatch.setattr(armazenamento, "salvar", lambda tarefas: pytest.fail("salvar completo não esperado"))
+        t1 = ger.adicionar_tarefa("Linha única")
+        ger.marcar_tarefa_como_concluida(t1.id)
+        ger.remover_tarefa(t1.id)
+        assert linhas_do_banco(arquivo_banco) == []
+
+    def test_lote_grava_em_uma_transacao_e_limpar(self, arquivo_banco):
+        """Um lote é gravado de uma vez e limpar esvazia a tabela."""
+        ger = GerenciadorDeTarefas(armazenamento=ArmazenamentoSQLite(arquivo_banco))
+        with ger.lote():
+            for i in range(10):
+                ger.adicionar_tarefa(f"Em lote {i}")
+        assert len(linhas_do_banco(arquivo_banco)) == 10
+
+        ger.limpar_todas_as_tarefas()
+        assert linhas_do_banco(arquivo_banco) == []
+
+    def test_carregamento_preguicoso_descarta_invalidas_na_carga(self, arquivo_banco, capsys):
+        """No modo preguiçoso, uma linha com descrição vazia não entra no gerenciador."""
+        ger = GerenciadorDeTarefas(armazenamento=ArmazenamentoSQLite(arquivo_banco))
+        valida = ger.adicionar_tarefa("Válida")
+        invalida = ger.adicionar_tarefa("Será apagada")
+        ger.fechar()
+        with sqlite3.connect(arquivo_banco) as conexao:
+            conexao.execute("UPDATE tarefas SET descricao = '  ' WHERE id = ?", (invalida.id,))
+
+        ger = GerenciadorDeTarefas(armazenamento=ArmazenamentoSQLite(arquivo_banco), carregamento_preguicoso=True)
+        assert "Tarefa ignorada" in capsys.readouterr().out
+        assert len(ger) == 1
+        assert [t.id for t in ger.tarefas] == [valida.id]
+        assert len(ger) == 1
+
+    def test_indices_criados(self, arquivo_banco):
+        """O esquema tem índices por ID, status e data de vencimento."""
+        ArmazenamentoSQLite(arquivo_banco).carregar()
+        with sqlite3.connect(arquivo_banco) as conexao:
+            colunas_indexadas = {
+                coluna
+                for (nome,) in conexao.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+                for (_, _, coluna) in conexao.execute(f"PRAGMA index_info('{nome}')")
+            }
+        assert {"id", "concluida", "data_vencimento"} <= colunas_indexadas
+
+    def test_banco_invalido_inicia_vazio(self, tmp_path, capsys):
+        """Um arquivo que não é um banco SQLite é informado e o gerenciador inicia vazio."""
+        caminho = tmp_path / "nao_e_banco.db"
+        caminho.write_text("isto não é um banco", encoding="utf-8")
+        ger = GerenciadorDeTarefas(armazenamento=ArmazenamentoSQLite(str(caminho)))
+        assert ger.tarefas == []
+        assert f"Erro ao ler o banco de dados {caminho}" in capsys.readouterr().out
+
+
+class TestCriacaoEMigracao:
+    """
+    Testes para a escolha do armazenamento e a migração entre formatos.
+    """
+
+    @pytest.mark.parametrize("caminho, tipo, esperado", [
+        ("tarefas.json", None, ArmazenamentoJSON),
+        ("tarefas.db", None, ArmazenamentoSQLite),
+        ("tarefas.SQLITE3", None, ArmazenamentoSQLite),
+        ("tarefas.dados", "sqlite", ArmazenamentoSQLite),
+        ("tarefas.db", "json", ArmazenamentoJSON),
+    ])
+    def test_criar_armazenamento(self, caminho, tipo, esperado):
+        """O tipo é deduzido pela extensão, a menos que seja informado."""
+        assert type(criar_armazenamento(caminho, tipo=tipo)) is esperado
+
+    def test_criar_armazenamento_tipo_invalido(self):
+        """Um tipo desconhecido é rejeitado."""
+        with pytest.raises(ValueError, match="Tipo de armazenamento desconhecido"):
+            criar_armazenamento("tarefas.json", tipo="xml")
+
+    def test_migrar_json_para_sqlite(self, tmp_path, arquivo_banco):
+        """A migração copia todas as tarefas, preservando IDs, status e ordem."""
+        arquivo_json = str(tmp_path / "origem.json")
+        origem = GerenciadorDeTarefas(arquivo_json=arquivo_json)
+        t1 = origem.adicionar_tarefa("Migrar 1", "2025-06-01")
+        t2 = origem.adicionar_tarefa("Migrar 2")
+        origem.marcar_tarefa_como_concluida(t2.id)
+
+        total = migrar(ArmazenamentoJSON(arquivo_json), ArmazenamentoSQLite(arquivo_banco))
+        assert total == 2
+
+        migrado = GerenciadorDeTarefas(armazenamento=ArmazenamentoSQLite(arquivo_banco))
+        assert [t.to_dict() for t in migrado.tarefas] == [t1.to_dict(), t2.to_dict()]
+        with open(arquivo_json, "r", encoding="utf-8") as f:
+            assert len(json.load(f)) == 2
+
+    @pytest.mark.parametrize("tipo, opcoes", [
+        ("json", {}),
+        ("json", {"usar_diario": True}),
+        ("sqlite", {}),
+        ("binario", {}),
+        ("mapeado", {}),
+        ("fragmentado", {"fragmentos": 2}),
+        ("segmentado", {"tarefas_por_segmento": 2}),
+    ])
+    def test_atribuicao_direta_sobrevive_a_recarga(self, tmp_path, tipo, opcoes):
+        """Uma atribuição direta seguida de outras alterações é gravada por qualquer armazenamento."""
+        caminho = str(tmp_path / "tarefas")
+        with GerenciadorDeTarefas(armazenamento=criar_armazenamento(caminho, tipo, **opcoes)) as ger:
+            editada = ger.adicionar_tarefa("Original")
+            concluida = ger.adicionar_tarefa("Original também")
+            editada.descricao = "Editada"
+            concluida.descricao = "Editada e concluída"
+            ger.marcar_tarefa_como_concluida(concluida.id)
+            ger.adicionar_tarefa("Nova")
+
+        with GerenciadorDeTarefas(armazenamento=criar_armazenamento(caminho, tipo, **opcoes)) as ger:
+            assert [(t.descricao, t.concluida) for t in ger.tarefas] == [
+                ("Editada", False), ("Editada e concluída", True), ("Nova", False),
+            ]
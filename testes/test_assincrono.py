@@ -0,0 +1,110 @@
+# testes/test_assincrono.py
+
+import asyncio
+import contextlib
+import io
+import json
+import threading
+import time
+import pytest
+from gerenciador_tarefas.assincrono import GerenciadorAssincrono
+from gerenciador_tarefas.logica import GerenciadorDeTarefas
+
+
+def executar(corrotina):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return asyncio.run(corrotina)
+
+
+class TestGerenciadorAssincrono:
+    """
+    Conjunto de testes para a fachada assíncrona do gerenciador.
+    """
+
+    def test_adicionar_concluir_remover_e_listar(self, tmp_path):
+        """As operações assíncronas alteram as tarefas e são gravadas no arquivo."""
+        caminho = str(tmp_path / "assincrono.json")
+
+        async def cenario():
+            async with await GerenciadorAssincrono.abrir(caminho) as ger:
+                t1 = await ger.adicionar_tarefa("Assíncrona 1", "2025-01-01")
+                t2 = await ger.adicionar_tarefa("Assíncrona 2")
+                assert await ger.marcar_tarefa_como_concluida(t1.id)
+                assert await ger.remover_tarefa(t2.id[:8])
+                assert not await ger.remover_tarefa("inexistente")
+                assert await ger.encontrar_tarefa_por_id(t1.id) is t1
+                assert await ger.visualizar_tarefas(mostrar_concluidas=False) == [
+                    "Nenhuma tarefa corresponde aos critérios de filtro."
+                ]
+                return [t.to_dict() for t in await ger.listar_tarefas()]
+
+        em_memoria = executar(cenario())
+        with open(caminho, encoding="utf-8") as f:
+            assert json.load(f) == em_memoria
+        assert em_memoria[0]["concluida"] is True and len(em_memoria) == 1
+
+    def test_alteracoes_da_mesma_volta_sao_gravadas_juntas(self, tmp_path, contar_gravacoes):
+        """Alterações concorrentes na mesma volta do laço resultam em uma única gravação, fora do laço."""
+        caminho = str(tmp_path / "coalescido.json")
+
+        async def cenario():
+            ger = await GerenciadorAssincrono.abrir(caminho)
+            chamadas = contar_gravacoes(ger.gerenciador)
+            tarefas = await asyncio.gather(*(ger.adicionar_tarefa(f"Tarefa {i}") for i in range(200)))
+            assert len(chamadas) == 1
+            await asyncio.gather(*(ger.marcar_tarefa_como_concluida(t.id) for t in tarefas[:50]))
+            assert len(chamadas) == 2
+            await ger.remover_tarefa(tarefas[-1].id)
+            await ger.remover_tarefa(tarefas[-2].id)
+            assert len(chamadas) == 4
+            await ger.fechar()
+            return chamadas
+
+        chamadas = executar(cenario())
+        assert threading.main_thread().name not in [thread for thread, _ in chamadas]
+        recarregado = GerenciadorDeTarefas(arquivo_json=caminho)
+        assert len(recarregado) == 198
+        assert len(recarregado.tarefas_por_status(True)) == 50
+
+    def test_laco_continua_responsivo_com_disco_lento(self, tmp_path, contar_gravacoes):
+        """Com gravações lentas e muitas tarefas concorrentes, o laço continua atendendo outras corrotinas."""
+        caminho = str(tmp_path / "lento.json")
+        atraso = 0.3
+
+        async def pulsar(intervalos, parar):
+            anterior = time.perf_counter()
+            while not parar.is_set():
+                await asyncio.sleep(0.005)
+                agora = time.perf_counter()
+                intervalos.append(agora - anterior)
+                anterior = agora
+
+        async def cliente(ger, numero):
+            tarefa = await ger.adicionar_tarefa(f"Cliente {numero}")
+            await ger.marcar_tarefa_como_concluida(tarefa.id)
+            return tarefa
+
+        async def cenario():
+            ger = await GerenciadorAssincrono.abrir(caminho)
+            chamadas = contar_gravacoes(ger.gerenciador, atraso)
+            intervalos, parar = [], asyncio.Event()
+            pulso = asyncio.ensure_future(pulsar(intervalos, parar))
+            inicio = time.perf_counter()
+            tarefas = await asyncio.gather(*(cliente(ger, i) for i in range(500)))
+            duracao = time.perf_counter() - inicio
+            parar.set()
+            await pulso
+            await ger.fechar()
+            return tarefas, chamadas, intervalos, duracao
+
+        tarefas, chamadas, intervalos, duracao = executar(cenario())
+        assert len(tarefas) == 500 and all(t.concluida for t in tarefas)
+        # Duas gravações (adições e conclusões), cada uma de pelo menos `atraso` segundos.
+        assert len(chamadas) == 2 and duracao >= 2 * atraso
+        assert len(intervalos) > 10
+        assert max(intervalos) < atraso
+
+    def test_exige_gravacao_em_segundo_plano(self, tmp_path):
+        """Envolver um gerenciador que grava na própria thread é recusado."""
+        with pytest.raises(ValueError, match="gravar_em_segundo_plano"):
+            GerenciadorAssincrono(GerenciadorDeTarefas(arquivo_json=str(tmp_path / "x.json")))
@@ -0,0 +1,49 @@
+# testes/test_benchmarks.py
+
+import json
+import pytest
+from benchmarks import bench_operacoes
+from benchmarks.bench_operacoes import OPERACOES_COMPLETAS, OPERACOES_UNITARIAS, comparar, executar
+
+
+def documento(**medianas):
+    return {"resultados": {"1000": {op: {"mediana_s": valor} for op, valor in medianas.items()}}}
+
+
+class TestBenchmarkOperacoes:
+    """
+    Conjunto de testes para o harness `python -m benchmarks`, em tamanhos mínimos.
+    """
+
+    @pytest.mark.parametrize("tipo", ["json", "fragmentado"])
+    def test_executar_mede_todas_as_operacoes(self, tipo):
+        """Cada tamanho tem uma medida positiva para cada operação, e a tabela tem uma linha por tamanho."""
+        linhas = []
+        resultado = executar([10, 40], tipo, repeticoes=3, repeticoes_completas=1, exibir=linhas.append)
+        assert resultado["armazenamento"] == tipo
+        assert sorted(resultado["resultados"]) == ["10", "40"]
+        for medidas in resultado["resultados"].values():
+            assert set(medidas) == set(OPERACOES_UNITARIAS + OPERACOES_COMPLETAS)
+            assert all(medida["mediana_s"] > 0 for medida in medidas.values())
+            assert medidas["adicionar"]["repeticoes"] == 3 and medidas["salvar"]["repeticoes"] == 1
+        assert len(linhas) == 4
+        json.dumps(resultado)
+
+    def test_comparar_aponta_so_o_que_passou_do_limite(self):
+        """Razões acima do limite são regressões; operações sem referência são ignoradas."""
+        atual = documento(encontrar=3.0, salvar=1.4, carregar=1.0)
+        referencia = documento(encontrar=1.0, salvar=1.0)
+        assert comparar(atual, referencia, 1.5) == [("1000", "encontrar", 3.0)]
+        assert comparar(atual, {"resultados": {}}, 1.5) == []
+
+    def test_main_com_saida_e_limite(self, tmp_path, monkeypatch, capsys):
+        """A linha de comando grava o JSON e sai com 1 quando há regressão."""
+        monkeypatch.setattr(bench_operacoes, "executar", lambda *args: documento(salvar=2.0))
+        referencia = tmp_path / "base.json"
+        referencia.write_text(json.dumps(documento(salvar=1.0)), encoding="utf-8")
+        saida = tmp_path / "atual.json"
+
+        assert bench_operacoes.main(["--saida", str(saida), "--comparar", str(referencia), "--limite", "1.5"]) == 1
+        assert "Regressão: salvar com 1000 tarefas levou 2.00x" in capsys.readouterr().out
+        assert json.loads(saida.read_text(encoding="utf-8")) == documento(salvar=2.0)
+        assert bench_operacoes.main(["--comparar", str(referencia), "--limite", "2.5"]) == 0
@@ -0,0 +1,109 @@
+# testes/test_binario.py
+
+import json
+import pytest
+from gerenciador_tarefas.armazenamento import ArmazenamentoBinario, ArmazenamentoJSON, criar_armazenamento, migrar
+from gerenciador_tarefas.binario import (
+    ErroFormatoBinario, VERSAO_FORMATO, codificar_cabecalho, codificar_registro, iterar_registros,
+)
+from gerenciador_tarefas.logica import GerenciadorDeTarefas
+from gerenciador_tarefas.tarefa import Tarefa
+
+
+def tarefas_variadas():
+    """Tarefas que exercitam todos os campos do formato."""
+    return [
+        Tarefa("Com UUID e data", "2025-12-31"),
+        Tarefa("ID personalizado, concluída", id_tarefa="manual-1", concluida=True),
+        Tarefa("Data fora do padrão", "31/12/2025", id_tarefa="manual-2"),
+        Tarefa("Data que não é texto", 20251231),
+        Tarefa("Acentuação: ação, café, 日本語 😀", None),
+    ]
+
+
+@pytest.fixture
+def arquivo_binario(tmp_path):
+    return str(tmp_path / "tarefas.bin")
+
+
+class TestFormatoBinario:
+    """
+    Conjunto de testes para o formato binário de persistência.
+    """
+
+    def test_ida_e_volta_equivale_ao_json(self, tmp_path, arquivo_binario):
+        """Salvar e carregar em binário produz as mesmas tarefas que em JSON."""
+        tarefas = {t.chave: t for t in tarefas_variadas()}
+        arquivo_json = str(tmp_path / "tarefas.json")
+        ArmazenamentoJSON(arquivo_json).salvar(tarefas)
+        ArmazenamentoBinario(arquivo_binario).salvar(tarefas)
+
+        via_json = ArmazenamentoJSON(arquivo_json).carregar()
+        via_binario = ArmazenamentoBinario(arquivo_binario).carregar()
+        assert list(via_binario) == list(via_json) == list(tarefas)
+        assert [t.to_dict() for t in via_binario.values()] == [t.to_dict() for t in via_json.values()]
+
+    def test_arquivo_menor_que_json(self, tmp_path, arquivo_binario):
+        """O formato binário ocupa bem menos espaço que o JSON indentado."""
+        tarefas = {}
+        for i in range(200):
+            tarefa = Tarefa(f"Tarefa {i}", "2025-06-%02d" % (i % 28 + 1), concluida=i % 2 == 0)
+            tarefas[tarefa.chave] = tarefa
+        arquivo_json = tmp_path / "tarefas.json"
+        ArmazenamentoJSON(str(arquivo_json)).salvar(tarefas)
+        ArmazenamentoBinario(arquivo_binario).salvar(tarefas)
+        assert (tmp_path / "tarefas.bin").stat().st_size < arquivo_json.stat().st_size / 3
+
+    def test_cabecalho_e_registros(self):
+        """O cabeçalho traz versão e contagem; cada registro tem prefixo de tamanho."""
+        tarefa = Tarefa("Registro", "2025-01-01", concluida=True)
+        registro = codificar_registro(tarefa.chave, tarefa.descricao, tarefa.vencimento_ordinal,
+                                      tarefa.data_vencimento, tarefa.concluida)
+        # 4 (tamanho) + 1 (bits) + 16 (ID) + 4 (ordinal) + descrição
+        assert len(registro) == 4 + 1 + 16 + 4 + len("Registro")
+        dados = codificar_cabecalho(1) + registro
+        assert dados[:4] == b"TARF" and dados[4] == VERSAO_FORMATO
+        assert list(iterar_registros(dados)) == [
+            (tarefa.chave, "Registro", tarefa.vencimento_ordinal, None, True),
+        ]
+
+    @pytest.mark.parametrize("dados, mensagem", [
+        (b"", "Cabeçalho ausente"),
+        (b"JSON" + bytes(12), "não é um arquivo de tarefas binário"),
+        (codificar_cabecalho(0)[:4] + (VERSAO_FORMATO + 1).to_bytes(2, "little") + bytes(10), "não suportada"),
+        (codificar_cabecalho(2) + codificar_registro("a", "Uma", None, None, False), r"truncado \(registro 2 de 2\)"),
+        (codificar_cabecalho(1) + codificar_registro("a", "Uma", None, None, False)[:-1], r"truncado \(registro 1 de 1\)"),
+    ])
+    def test_conteudo_invalido(self, dados, mensagem):
+        """Arquivos corrompidos, de outra versão ou truncados levantam ErroFormatoBinario."""
+        with pytest.raises(ErroFormatoBinario, match=mensagem):
+            list(iterar_registros(dados))
+
+    def test_arquivo_corrompido_inicia_vazio(self, arquivo_binario, capsys):
+        """Um arquivo que não está no formato é informado e o gerenciador inicia vazio."""
+        with open(arquivo_binario, "wb") as f:
+            f.write(b"[]")
+        ger = GerenciadorDeTarefas(armazenamento=ArmazenamentoBinario(arquivo_binario))
+        assert ger.tarefas == []
+        assert f"Erro ao decodificar o arquivo binário {arquivo_binario}" in capsys.readouterr().out
+
+    def test_gerenciador_com_armazenamento_binario(self, arquivo_binario):
+        """As operações do gerenciador são persistidas no arquivo binário."""
+        ger = GerenciadorDeTarefas(armazenamento=criar_armazenamento(arquivo_binario))
+        t1 = ger.adicionar_tarefa("Binária 1", "2025-02-02")
+        t2 = ger.adicionar_tarefa("Binária 2")
+        ger.marcar_tarefa_como_concluida(t1.id)
+        ger.remover_tarefa(t2.id)
+        ger.fechar()
+
+        recarregado = GerenciadorDeTarefas(armazenamento=ArmazenamentoBinario(arquivo_binario))
+        assert [t.to_dict() for t in recarregado.tarefas] == [t1.to_dict()]
+        assert recarregado.tarefas_com_vencimento_entre("2025-02-01", "2025-02-28")[0].id == t1.id
+
+    def test_migrar_json_para_binario(self, tmp_path, arquivo_binario):
+        """A migração do JSON para o binário preserva as tarefas."""
+        arquivo_json = tmp_path / "origem.json"
+        arquivo_json.write_text(json.dumps([t.to_dict() for t in tarefas_variadas()]), encoding="utf-8")
+        assert migrar(ArmazenamentoJSON(str(arquivo_json)), ArmazenamentoBinario(arquivo_binario)) == 5
+        carregadas = ArmazenamentoBinario(arquivo_binario).carregar()
+        assert [t.to_dict() for t in carregadas.values()] == json.loads(arquivo_json.read_text(encoding="utf-8"))
@@ -0,0 +1,284 @@
+# testes/test_concorrencia.py
+
+import contextlib
+import io
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import pytest
+from gerenciador_tarefas.armazenamento import (
+    ArmazenamentoBinario, ArmazenamentoFragmentado, ArmazenamentoJSON, ArmazenamentoMapeado, ArmazenamentoSegmentado,
+)
+from gerenciador_tarefas.logica import GerenciadorDeTarefas
+from gerenciador_tarefas.trava import TravaDeArquivo, TravaLeituraEscrita
+
+PROCESSOS = 4
+TAREFAS_POR_PROCESSO = 25
+
+ARMAZENAMENTOS = {
+    "json": lambda caminho: ArmazenamentoJSON(caminho + ".json"),
+    "diario": lambda caminho: ArmazenamentoJSON(caminho + ".json", usar_diario=True),
+    "binario": lambda caminho: ArmazenamentoBinario(caminho + ".bin"),
+    "mapeado": lambda caminho: ArmazenamentoMapeado(caminho + ".mmap"),
+    "fragmentado": lambda caminho: ArmazenamentoFragmentado(caminho + ".d", fragmentos=3),
+    "segmentado": lambda caminho: ArmazenamentoSegmentado(caminho + ".json", tarefas_por_segmento=10),
+}
+
+
+def trabalhar(tipo, caminho, numero):
+    """
+    Executado em cada processo do teste de estresse: carrega o arquivo uma única
+    vez e faz várias alterações, concorrendo com os outros processos.
+
+    Returns:
+        list: Os IDs das tarefas que o processo manteve.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        with GerenciadorDeTarefas(armazenamento=ARMAZENAMENTOS[tipo](caminho)) as ger:
+            mantidas = []
+            for i in range(TAREFAS_POR_PROCESSO):
+                tarefa = ger.adicionar_tarefa(f"Processo {numero}, tarefa {i}")
+                if i % 5 == 4:
+                    ger.remover_tarefa(tarefa.id)
+                    continue
+                if i % 2:
+                    ger.marcar_tarefa_como_concluida(tarefa.id)
+                mantidas.append(tarefa.id)
+    return mantidas
+
+
+@pytest.fixture(params=sorted(ARMAZENAMENTOS))
+def tipo(request):
+    return request.param
+
+
+class TestConcorrencia:
+    """
+    Conjunto de testes para o acesso de vários processos ao mesmo arquivo.
+    """
+
+    def test_trava_e_geracao(self, tmp_path):
+        """A geração avança a cada gravação e denuncia a instância desatualizada."""
+        caminho = str(tmp_path / "tarefas.json.trava")
+        primeira, segunda = TravaDeArquivo(caminho), TravaDeArquivo(caminho)
+        with primeira.exclusiva():
+            primeira.sincronizar()
+            with primeira.exclusiva():
+                assert not primeira.desatualizada()
+        with segunda.exclusiva():
+            segunda.sincronizar()
+            segunda.avancar()
+        with primeira.exclusiva():
+            assert primeira.desatualizada()
+            primeira.avancar()
+            assert not primeira.desatualizada()
+        with open(caminho) as f:
+            assert f.read() == "2"
+
+    def test_gravador_desatualizado_reaplica_alteracoes(self, tmp_path, tipo):
+        """Um gerenciador desatualizado recarrega e reaplica suas alterações sem apagar as dos outros."""
+        caminho = str(tmp_path / "compartilhado")
+        primeiro = GerenciadorDeTarefas(armazenamento=ARMAZENAMENTOS[tipo](caminho))
+        comum = primeiro.adicionar_tarefa("Comum")
+        removida = primeiro.adicionar_tarefa("Removida pelo segundo")
+        segundo = GerenciadorDeTarefas(armazenamento=ARMAZENAMENTOS[tipo](caminho))
+
+        do_primeiro = primeiro.adicionar_tarefa("Do primeiro")
+        do_segundo = segundo.adicionar_tarefa("Do segundo")
+        segundo.remover_tarefa(removida.id)
+        primeiro.marcar_tarefa_como_concluida(removida.id)
+        primeiro.marcar_tarefa_como_concluida(comum.id)
+        primeiro.fechar()
+        segundo.fechar()
+
+        with GerenciadorDeTarefas(armazenamento=ARMAZENAMENTOS[tipo](caminho)) as final:
+            assert {t.id: t.concluida for t in final.tarefas} == {
+                comum.id: True, do_primeiro.id: False, do_segundo.id: False,
+            }
+        assert primeiro.encontrar_tarefa_por_id(do_segundo.id) is not None
+
+    def test_atribuicao_direta_em_gerenciador_desatualizado(self, tmp_path, tipo):
+        """Gravar em `fechar` uma atribuição direta não apaga o que outro processo gravou depois da carga."""
+        caminho = str(tmp_path / "compartilhado")
+        with GerenciadorDeTarefas(armazenamento=ARMAZENAMENTOS[tipo](caminho)) as ger:
+            editada = ger.adicionar_tarefa("Original")
+        primeiro = GerenciadorDeTarefas(armazenamento=ARMAZENAMENTOS[tipo](caminho))
+        with GerenciadorDeTarefas(armazenamento=ARMAZENAMENTOS[tipo](caminho)) as segundo:
+            do_segundo = segundo.adicionar_tarefa("Do segundo")
+
+        primeiro.encontrar_tarefa_por_id(editada.id).descricao = "Editada pelo primeiro"
+        primeiro.fechar()
+        with GerenciadorDeTarefas(armazenamento=ARMAZENAMENTOS[tipo](caminho)) as final:
+            assert [(t.id, t.descricao) for t in final.tarefas] == [
+                (editada.id, "Editada pelo primeiro"), (do_segundo.id, "Do segundo"),
+            ]
+
+    def test_estresse_multiprocesso(self, tmp_path, tipo):
+        """Vários processos alterando o mesmo arquivo não perdem as alterações uns dos outros."""
+        caminho = str(tmp_path / "estresse")
+        with ProcessPoolExecutor(max_workers=PROCESSOS) as pool:
+            resultados = list(pool.map(trabalhar, [tipo] * PROCESSOS, [caminho] * PROCESSOS, range(PROCESSOS)))
+
+        esperadas = {id_tarefa for mantidas in resultados for id_tarefa in mantidas}
+        assert len(esperadas) == PROCESSOS * TAREFAS_POR_PROCESSO * 4 // 5
+        with contextlib.redirect_stdout(io.StringIO()):
+            with GerenciadorDeTarefas(armazenamento=ARMAZENAMENTOS[tipo](caminho)) as final:
+                tarefas = final.tarefas
+        assert {t.id for t in tarefas} == esperadas
+        concluidas = sum(t.concluida for t in tarefas)
+        assert concluidas == PROCESSOS * sum(1 for i in range(TAREFAS_POR_PROCESSO) if i % 2 and i % 5 != 4)
+
+    def test_sem_trava_nao_detecta(self, tmp_path):
+        """Sem o arquivo de trava (diretório somente leitura), a gravação segue com um aviso."""
+        caminho = tmp_path / "tarefas.json"
+        caminho.write_text(json.dumps([]), encoding="utf-8")
+        armazenamento = ArmazenamentoJSON(str(caminho))
+        armazenamento._trava.caminho = str(tmp_path / "inexistente" / "tarefas.json.trava")
+        ger = GerenciadorDeTarefas(armazenamento=armazenamento)
+        assert ger.adicionar_tarefa("Sem trava") is not None
+        assert not armazenamento.desatualizado()
+
+
+class TestTravaLeituraEscrita:
+    """
+    Conjunto de testes para a trava de leitura e escrita entre threads.
+    """
+
+    def test_leitores_simultaneos(self):
+        """Vários leitores mantêm a trava ao mesmo tempo."""
+        trava = TravaLeituraEscrita()
+        barreira = threading.Barrier(4, timeout=5)
+
+        def ler():
+            with trava.leitura():
+                barreira.wait()
+            return True
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            assert all(pool.map(lambda _: ler(), range(4)))
+
+    def test_escritor_exclusivo(self):
+        """Com um escritor, nenhuma outra thread lê ou escreve."""
+        trava = TravaLeituraEscrita()
+        dentro = []
+        violacoes = []
+
+        def usar(escrever):
+            with trava.escrita() if escrever else trava.leitura():
+                dentro.append(escrever)
+                if escrever and len(dentro) > 1 or not escrever and True in dentro:
+                    violacoes.append(list(dentro))
+                time.sleep(0.001)
+                dentro.remove(escrever)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(usar, [i % 3 == 0 for i in range(60)]))
+        assert violacoes == []
+
+    def test_reentrancia(self):
+        """Leitura e escrita são reentrantes; passar de leitura para escrita é recusado."""
+        trava = TravaLeituraEscrita()
+        with trava.escrita():
+            with trava.escrita(), trava.leitura():
+                pass
+        with trava.leitura():
+            with trava.leitura():
+                pass
+            with pytest.raises(RuntimeError):
+                with trava.escrita():
+                    pass
+        with trava.escrita():
+            pass
+
+
+class TestGerenciadorEntreThreads:
+    """
+    Conjunto de testes para o uso do gerenciador por várias threads.
+    """
+
+    @pytest.fixture(autouse=True)
+    def trocas_frequentes_de_thread(self):
+        """Faz o interpretador alternar entre as threads com muito mais frequência."""
+        intervalo = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        yield
+        sys.setswitchinterval(intervalo)
+
+    @pytest.mark.parametrize("em_segundo_plano", [False, True])
+    def test_invariantes_sob_carga(self, tmp_path, em_segundo_plano):
+        """Leitores nunca veem um estado inconsistente enquanto escritores alteram as tarefas."""
+        caminho = str(tmp_path / "threads.json")
+        with contextlib.redirect_stdout(io.StringIO()):
+            ger = GerenciadorDeTarefas(arquivo_json=caminho, politica_fsync="nunca",
+                                       gravar_em_segundo_plano=em_segundo_plano)
+
+            def escrever(numero):
+                for i in range(40):
+                    tarefa = ger.adicionar_tarefa(f"Thread {numero} tarefa {i}", f"2025-01-{i % 28 + 1:02d}")
+                    if i % 3 == 0:
+                        ger.marcar_tarefa_como_concluida(tarefa.id)
+                    elif i % 3 == 1:
+                        ger.remover_tarefa(tarefa.id[:20])
+
+            def ler(_):
+                violacoes = []
+                for _ in range(60):
+                    with ger._trava.leitura():
+                        tarefas = ger.tarefas
+                        pendentes = ger.tarefas_por_status(False)
+                        concluidas = ger.tarefas_por_status(True)
+                        com_data = ger.tarefas_com_vencimento_entre()
+                    if len(tarefas) != len(pendentes) + len(concluidas) or len(com_data) != len(tarefas):
+                        violacoes.append((len(tarefas), len(pendentes), len(concluidas), len(com_data)))
+                    if any(t.concluida for t in pendentes) or not all(t.concluida for t in concluidas):
+                        violacoes.append("status")
+                    linhas = ger.visualizar_tarefas()
+                    for tarefa in tarefas[:5]:
+                        ger.encontrar_tarefa_por_id(tarefa.id)
+                    if not linhas:
+                        violacoes.append("visualizar")
+                return violacoes
+
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                escritas = [pool.submit(escrever, numero) for numero in range(4)]
+                leituras = [pool.submit(ler, numero) for numero in range(4)]
+                assert [v for futuro in leituras for v in futuro.result()] == []
+                for futuro in escritas:
+                    futuro.result()
+            ger.fechar()
+
+            assert len(ger) == 4 * 27
+            assert sum(t.concluida for t in ger.tarefas) == 4 * 14
+            recarregado = GerenciadorDeTarefas(arquivo_json=caminho)
+        assert [t.to_dict() for t in recarregado.tarefas] == [t.to_dict() for t in ger.tarefas]
+
+    def test_gravacao_em_segundo_plano_nao_bloqueia_leitores(self, tmp_path):
+        """Com a gravação em segundo plano, um disco lento não atrasa quem altera nem quem lê."""
+        caminho = str(tmp_path / "lento.json")
+        ger = GerenciadorDeTarefas(arquivo_json=caminho, gravar_em_segundo_plano=True)
+        liberar = threading.Event()
+        registrar_original = ger._armazenamento.registrar
+
+        def registrar_lento(alteracoes, tarefas, alteradas=None):
+            assert liberar.wait(timeout=5)
+            registrar_original(alteracoes, tarefas, alteradas)
+
+        ger._armazenamento.registrar = registrar_lento
+        inicio = time.perf_counter()
+        tarefa = ger.adicionar_tarefa("Gravada depois")
+        outra = ger.adicionar_tarefa("Gravada junto")
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            encontrada = pool.submit(ger.encontrar_tarefa_por_id, tarefa.id).result(timeout=1)
+        assert encontrada is tarefa
+        assert time.perf_counter() - inicio < 1
+        assert not os.path.exists(caminho)
+
+        liberar.set()
+        ger.aguardar_gravacoes()
+        with open(caminho, encoding="utf-8") as f:
+            assert [t["id"] for t in json.load(f)] == [tarefa.id, outra.id]
+        ger.fechar()
+        assert ger.adicionar_tarefa("Depois de fechar") is not None
@@ -0,0 +1,75 @@
+# testes/test_eventos.py
+
+import io
+from gerenciador_tarefas import eventos
+from gerenciador_tarefas.eventos import (
+    AVISO, ERRO, INFORMACAO, NotificadorConsole, NotificadorEmBuffer, NotificadorSilencioso, notificar,
+)
+from gerenciador_tarefas.logica import GerenciadorDeTarefas
+
+
+class TestEventos:
+    """
+    Conjunto de testes para os notificadores e os eventos emitidos pela biblioteca.
+    """
+
+    def test_padrao_silencioso(self, tmp_path, capsys):
+        """Sem notificador instalado, a biblioteca não escreve nada na saída padrão."""
+        with eventos.usando(None):
+            assert isinstance(eventos.notificador_atual(), NotificadorSilencioso)
+            ger = GerenciadorDeTarefas(str(tmp_path / "tarefas.json"))
+            tarefa = ger.adicionar_tarefa("Silenciosa")
+            ger.marcar_tarefa_como_concluida(tarefa.id)
+            ger.remover_tarefa("inexistente")
+            ger.fechar()
+        assert capsys.readouterr().out == ""
+
+    def test_usando_restaura_o_anterior(self):
+        """O bloco `with` instala o notificador e devolve o anterior ao sair."""
+        anterior = eventos.notificador_atual()
+        buffer = NotificadorEmBuffer()
+        with eventos.usando(buffer):
+            assert eventos.notificador_atual() is buffer
+        assert eventos.notificador_atual() is anterior
+
+    def test_buffer_niveis_e_capacidade(self):
+        """O buffer respeita o nível mínimo e descarta os eventos mais antigos."""
+        buffer = NotificadorEmBuffer(capacidade=2, nivel_minimo=INFORMACAO)
+        with eventos.usando(buffer):
+            notificar(eventos.DEPURACAO, "teste", "ignorado")
+            notificar(INFORMACAO, "teste", "primeiro")
+            notificar(AVISO, "teste", "segundo", valor=2)
+            notificar(ERRO, "teste", "terceiro")
+        assert [evento.mensagem for evento in buffer.eventos] == ["segundo", "terceiro"]
+        assert buffer.eventos[0].dados == {"valor": 2} and buffer.eventos[0].nome_nivel == "AVISO"
+        assert buffer.mensagens(ERRO) == ["terceiro"]
+
+    def test_buffer_descarregar(self):
+        """Os eventos guardados são repassados a outro notificador e o buffer fica vazio."""
+        buffer = NotificadorEmBuffer()
+        with eventos.usando(buffer):
+            notificar(INFORMACAO, "teste", "informação")
+            notificar(ERRO, "teste", "erro")
+        fluxo = io.StringIO()
+        assert buffer.descarregar(NotificadorConsole(nivel_minimo=ERRO, fluxo=fluxo)) == 2
+        assert fluxo.getvalue() == "erro\n"
+        assert buffer.eventos == []
+
+    def test_eventos_estruturados_do_gerenciador(self, tmp_path):
+        """As operações emitem eventos com tipo e dados, além da mensagem de sempre."""
+        buffer = NotificadorEmBuffer()
+        with eventos.usando(buffer):
+            ger = GerenciadorDeTarefas(str(tmp_path / "tarefas.json"))
+            tarefa = ger.adicionar_tarefa("Estruturada")
+            ger.marcar_tarefa_como_concluida(tarefa.id)
+            ger.remover_tarefa(tarefa.id)
+            ger.remover_tarefa("inexistente")
+            ger.fechar()
+        por_tipo = {evento.tipo: evento for evento in buffer.eventos}
+        assert por_tipo["carga.arquivo_ausente"].nivel == AVISO
+        assert por_tipo["carga.arquivo_ausente"].dados == {"caminho": str(tmp_path / "tarefas.json")}
+        for tipo in ("tarefa.adicionada", "tarefa.concluida", "tarefa.removida"):
+            assert por_tipo[tipo].nivel == INFORMACAO and por_tipo[tipo].dados == {"id": tarefa.id}
+        assert por_tipo["tarefa.adicionada"].mensagem == "Tarefa 'Estruturada' adicionada com sucesso."
+        assert por_tipo["tarefa.nao_encontrada"].nivel == ERRO
+        assert por_tipo["tarefa.nao_encontrada"].dados == {"id": "inexistente"}
@@ -0,0 +1,141 @@
+# testes/test_fragmentado.py
+
+import json
+import os
+import pytest
+from gerenciador_tarefas import armazenamento as modulo_armazenamento
+from gerenciador_tarefas.armazenamento import ArmazenamentoFragmentado, ArmazenamentoJSON, criar_armazenamento, migrar
+from gerenciador_tarefas.fragmentos import MANIFESTO, caminho_do_fragmento, fragmento_da_chave, ler_manifesto
+from gerenciador_tarefas.tarefa import Tarefa, chave_do_id
+
+
+@pytest.fixture
+def diretorio(tmp_path):
+    return str(tmp_path / "tarefas.d")
+
+
+@pytest.fixture
+def fabrica_de_armazenamento():
+    return ArmazenamentoFragmentado
+
+
+def identidade_dos_arquivos(caminho):
+    # Cada regravação atômica cria um arquivo novo, com outro inode.
+    estados = {nome: os.stat(os.path.join(caminho, nome)) for nome in os.listdir(caminho)}
+    return {nome: (estado.st_ino, estado.st_mtime_ns) for nome, estado in estados.items()}
+
+
+class TestArmazenamentoFragmentado:
+    """
+    Conjunto de testes para o armazenamento em um diretório de fragmentos.
+    """
+
+    def test_ida_e_volta_preserva_ordem(self, diretorio):
+        """Salvar e carregar preserva os campos e a ordem de inserção entre fragmentos."""
+        tarefas = [Tarefa(f"Tarefa {i}", "2025-12-31" if i % 3 else None) for i in range(30)]
+        tarefas += [Tarefa("ID personalizado", id_tarefa="manual-1", concluida=True), Tarefa("Data", "31/12/2025")]
+        armazenamento = ArmazenamentoFragmentado(diretorio, fragmentos=4)
+        armazenamento.salvar({t.chave: t for t in tarefas})
+
+        assert ler_manifesto(diretorio) == (4, 1)
+        carregadas = ArmazenamentoFragmentado(diretorio).carregar()
+        assert [t.to_dict() for t in carregadas.values()] == [t.to_dict() for t in tarefas]
+
+    def test_fragmento_da_chave_estavel(self):
+        """O fragmento depende só da chave: UUIDs pelo valor, outros IDs por CRC32."""
+        chave = chave_do_id("3f2a9c10-0000-4000-8000-000000000005")
+        assert fragmento_da_chave(chave, 4) == 1
+        assert fragmento_da_chave("manual-1", 7) == fragmento_da_chave("manual-1", 7) < 7
+
+    def test_alteracao_regrava_so_o_fragmento_tocado(self, diretorio, abrir_gerenciador):
+        """Concluir, remover e adicionar regravam apenas o fragmento da tarefa."""
+        with abrir_gerenciador(diretorio, fragmentos=8) as ger:
+            ids = [ger.adicionar_tarefa(f"Tarefa {i}").id for i in range(40)]
+
+        for operacao in ("concluir", "remover", "adicionar"):
+            antes = identidade_dos_arquivos(diretorio)
+            with abrir_gerenciador(diretorio) as ger:
+                if operacao == "concluir":
+                    chave = chave_do_id(ids[7])
+                    ger.marcar_tarefa_como_concluida(ids[7])
+                elif operacao == "remover":
+                    chave = chave_do_id(ids[8])
+                    ger.remover_tarefa(ids[8])
+                else:
+                    chave = ger.adicionar_tarefa("Nova").chave
+            depois = identidade_dos_arquivos(diretorio)
+            alterados = sorted(nome for nome in depois if depois[nome] != antes.get(nome))
+            assert alterados == [os.path.basename(caminho_do_fragmento(diretorio, 1, fragmento_da_chave(chave, 8)))]
+
+        with abrir_gerenciador(diretorio) as ger:
+            descricoes = [t.descricao for t in ger.tarefas]
+            assert len(descricoes) == 40 and descricoes[-1] == "Nova" and "Tarefa 8" not in descricoes
+            assert ger.encontrar_tarefa_por_id(ids[7]).concluida
+
+    def test_carga_em_paralelo(self, diretorio, monkeypatch, abrir_gerenciador):
+        """Acima do limite de tamanho, os fragmentos são lidos por um pool de processos."""
+        with abrir_gerenciador(diretorio, fragmentos=4) as ger:
+            with ger.lote():
+                esperadas = [ger.adicionar_tarefa(f"Tarefa {i}").id for i in range(200)]
+        monkeypatch.setattr(modulo_armazenamento, "TAMANHO_MINIMO_CARGA_PARALELA", 0)
+        usados = []
+        original = modulo_armazenamento.ProcessPoolExecutor
+
+        def registrar_pool(*args, **kwargs):
+            usados.append(kwargs.get("max_workers"))
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(modulo_armazenamento, "ProcessPoolExecutor", registrar_pool)
+        carregadas = ArmazenamentoFragmentado(diretorio, processos=2).carregar()
+        assert usados == [2]
+        assert [t.id for t in carregadas.values()] == esperadas
+
+    def test_refragmentar(self, diretorio, abrir_gerenciador):
+        """Refragmentar redistribui as tarefas, troca a geração e remove os fragmentos antigos."""
+        with abrir_gerenciador(diretorio, fragmentos=2) as ger:
+            ids = [ger.adicionar_tarefa(f"Tarefa {i}").id for i in range(25)]
+            ger.marcar_tarefa_como_concluida(ids[0])
+
+        assert ArmazenamentoFragmentado(diretorio).refragmentar(5) == 25
+        assert ler_manifesto(diretorio) == (5, 2)
+        assert sorted(n for n in os.listdir(diretorio) if n != MANIFESTO) == [
+            os.path.basename(caminho_do_fragmento(diretorio, 2, i)) for i in range(5)
+        ]
+        with abrir_gerenciador(diretorio, fragmentos=2) as ger:
+            assert ger._armazenamento.fragmentos == 5
+            assert [t.id for t in ger.tarefas] == ids
+            assert ger.encontrar_tarefa_por_id(ids[0]).concluida
+
+    def test_dados_invalidos(self, diretorio, capsys, abrir_gerenciador):
+        """Um fragmento ausente ou um registro inválido são ignorados com uma mensagem."""
+        with abrir_gerenciador(diretorio, fragmentos=2) as ger:
+            for i in range(10):
+                ger.adicionar_tarefa(f"Tarefa {i}")
+        os.remove(caminho_do_fragmento(diretorio, 1, 0))
+        with open(caminho_do_fragmento(diretorio, 1, 1), "r", encoding="utf-8") as f:
+            registros = json.load(f)
+        del registros[0]["posicao"]
+        with open(caminho_do_fragmento(diretorio, 1, 1), "w", encoding="utf-8") as f:
+            json.dump(registros, f)
+        capsys.readouterr()
+
+        carregadas = ArmazenamentoFragmentado(diretorio).carregar()
+        saida = capsys.readouterr().out
+        assert "não encontrado" in saida and "posição ausente ou inválida" in saida
+        assert len(carregadas) == len(registros) - 1
+
+    def test_diretorio_inexistente_e_fragmentos_invalidos(self, diretorio, capsys):
+        """Sem diretório, começa vazio; menos de um fragmento é rejeitado."""
+        assert ArmazenamentoFragmentado(diretorio).carregar() == {}
+        assert "não encontrado" in capsys.readouterr().out
+        with pytest.raises(ValueError, match="pelo menos 1"):
+            ArmazenamentoFragmentado(diretorio, fragmentos=0)
+
+    def test_criacao_e_migracao(self, tmp_path, diretorio):
+        """Diretórios e caminhos com barra final usam o armazenamento fragmentado."""
+        assert isinstance(criar_armazenamento(diretorio + "/"), ArmazenamentoFragmentado)
+        origem = str(tmp_path / "tarefas.json")
+        ArmazenamentoJSON(origem).salvar({t.chave: t for t in (Tarefa("A"), Tarefa("B"))})
+        assert migrar(criar_armazenamento(origem), criar_armazenamento(diretorio + "/", fragmentos=3)) == 2
+        assert isinstance(criar_armazenamento(diretorio), ArmazenamentoFragmentado)
+        assert [t.descricao for t in criar_armazenamento(diretorio).carregar().values()] == ["A", "B"]
@@ -0,0 +1,225 @@
+# testes/test_indices.py
+
+import copy
+from datetime import date
+import pytest
+from gerenciador_tarefas.indices import (
+    ErroIdAmbiguo, IndiceIds, IndiceStatus, IndiceTexto, IndiceVencimento, normalizar_texto, ordinal_da_data, termos_do_texto,
+)
+from gerenciador_tarefas.tarefa import Tarefa, chave_do_id
+
+
+def ordinal(texto):
+    return date.fromisoformat(texto).toordinal()
+
+
+class TestIndiceStatus:
+    """
+    Conjunto de testes para o índice de tarefas por status.
+    """
+
+    def test_adicionar_move_entre_particoes(self):
+        """Reindexar uma chave a move de partição, mantendo a ordem de inserção."""
+        indice = IndiceStatus()
+        for chave in ("a", "b", "c"):
+            indice.adicionar(chave, False)
+        indice.adicionar("a", True)
+        assert list(indice.chaves(False)) == ["b", "c"]
+        assert list(indice.chaves(True)) == ["a"]
+        assert indice.contem("a", True) and not indice.contem("a", False)
+
+        indice.adicionar("c", True)
+        indice.adicionar("a", True)
+        assert list(indice.chaves(True)) == ["a", "c"]
+        indice.adicionar("a", False)
+        assert list(indice.chaves(False)) == ["a", "b"]
+
+    def test_reconstruir(self):
+        """Reconstruir equivale a adicionar as chaves na ordem, e as novas vão para o fim."""
+        indice = IndiceStatus()
+        indice.adicionar("antiga", False)
+        indice.reconstruir([("a", False), ("b", True), ("c", False)])
+        indice.adicionar("d", False)
+        indice.adicionar("a", True)
+        assert list(indice.chaves(False)) == ["c", "d"]
+        assert list(indice.chaves(True)) == ["a", "b"]
+        assert not indice.contem("antiga", False)
+
+    def test_remover_e_limpar(self):
+        """Remover ignora chaves ausentes e limpar esvazia as duas partições."""
+        indice = IndiceStatus()
+        indice.adicionar("a", False)
+        indice.adicionar("b", True)
+        indice.remover("a")
+        indice.remover("inexistente")
+        assert list(indice.chaves(False)) == []
+        indice.limpar()
+        assert list(indice.chaves(True)) == []
+
+
+class TestIndiceVencimento:
+    """
+    Conjunto de testes para o índice ordenado por data de vencimento.
+    """
+
+    def test_intervalo_inclusivo_e_ordenado(self):
+        """O intervalo inclui as duas pontas e desempata pela ordem de inserção."""
+        indice = IndiceVencimento()
+        indice.adicionar("marco", ordinal("2025-03-01"))
+        indice.adicionar("janeiro", ordinal("2025-01-01"))
+        indice.adicionar("fevereiro", ordinal("2025-02-01"))
+        indice.adicionar("fevereiro-2", ordinal("2025-02-01"))
+        indice.adicionar("sem-data", None)
+
+        assert len(indice) == 4
+        assert indice.intervalo() == ["janeiro", "fevereiro", "fevereiro-2", "marco"]
+        assert indice.intervalo(ordinal("2025-02-01"), ordinal("2025-03-01")) == ["fevereiro", "fevereiro-2", "marco"]
+        assert indice.intervalo(fim=ordinal("2025-01-31")) == ["janeiro"]
+
+    def test_reindexar_e_remover(self):
+        """Reindexar muda a posição da chave; remover e ordinal None a retiram."""
+        indice = IndiceVencimento()
+        indice.adicionar("a", ordinal("2025-01-01"))
+        indice.adicionar("b", ordinal("2025-01-02"))
+        indice.adicionar("a", ordinal("2025-01-03"))
+        assert indice.intervalo() == ["b", "a"]
+        indice.adicionar("b", None)
+        indice.remover("inexistente")
+        assert indice.intervalo() == ["a"]
+        indice.remover("a")
+        assert len(indice) == 0
+
+    def test_reconstruir_equivale_a_adicionar(self):
+        """Reconstruir de uma vez produz o mesmo resultado que adicionar uma a uma."""
+        pares = [(i, ordinal("2025-01-01") + (i * 7) % 5) for i in range(20)] + [("x", None)]
+        reconstruido = IndiceVencimento()
+        reconstruido.reconstruir(pares)
+        incremental = IndiceVencimento()
+        for chave, valor in pares:
+            incremental.adicionar(chave, valor)
+        assert reconstruido.intervalo() == incremental.intervalo()
+        reconstruido.adicionar(99, ordinal("2025-01-01"))
+        assert reconstruido.intervalo(fim=ordinal("2025-01-01"))[-1] == 99
+
+
+class TestIndiceTexto:
+    """
+    Conjunto de testes para o índice invertido das descrições.
+    """
+
+    @pytest.fixture
+    def indice(self):
+        indice = IndiceTexto()
+        indice.adicionar(1, "Revisar relatório mensal")
+        indice.adicionar(2, "Comprar CAFÉ e pão")
+        indice.adicionar(3, "Enviar relatorio anual")
+        indice.adicionar(4, "Reunião de planejamento")
+        return indice
+
+    def test_normalizacao(self):
+        """Acentos e maiúsculas são ignorados; pontuação separa os termos."""
+        assert normalizar_texto("AÇÃO Ônibus") == "acao onibus"
+        assert termos_do_texto("Café, pão e leite!") == ["cafe", "pao", "e", "leite"]
+
+    @pytest.mark.parametrize("consulta, esperado", [
+        ("relatorio", [1, 3]),
+        ("RELATÓRIO mensal", [1]),
+        ("relatório E anual", [3]),
+        ("cafe OU anual", [2, 3]),
+        ("pão OR reuniao", [2, 4]),
+        ("rel*", [1, 3]),
+        ("re*", [1, 3, 4]),
+        ("rel", []),
+        ("relatorio inexistente", []),
+        ("inexistente OU mensal", [1]),
+        ("", []),
+    ])
+    def test_buscar(self, indice, consulta, esperado):
+        """Consultas com E implícito, OU e prefixo retornam as chaves na ordem de inserção."""
+        assert indice.buscar(consulta) == esperado
+
+    def test_remover_e_reindexar(self, indice):
+        """Remover retira a chave e os termos que ficaram sem tarefas; reindexar troca os termos."""
+        indice.remover(1)
+        assert indice.buscar("mensal") == []
+        assert indice.buscar("mens*") == []
+        indice.adicionar(3, "Enviar planilha")
+        assert indice.buscar("relatorio") == []
+        assert indice.buscar("planejamento OU planilha") == [3, 4]
+        assert len(indice) == 3
+
+
+class TestIndiceIds:
+    """
+    Conjunto de testes para a resolução de IDs abreviados.
+    """
+
+    IDS = [
+        "3f2a9c10-0000-4000-8000-000000000001",
+        "3f2a9c10-0000-4000-8000-000000000002",
+        "3f2b0000-0000-4000-8000-000000000003",
+        "a1b2c3d4-0000-4000-8000-000000000004",
+        "a1-personalizado",
+        "tarefa-manual",
+    ]
+
+    @pytest.fixture
+    def indice(self):
+        indice = IndiceIds()
+        indice.reconstruir(chave_do_id(id_tarefa) for id_tarefa in self.IDS)
+        return indice
+
+    @pytest.mark.parametrize("prefixo, esperado", [
+        ("3f2b", "3f2b0000-0000-4000-8000-000000000003"),
+        ("3f2a9c10-0000-4000-8000-000000000002", "3f2a9c10-0000-4000-8000-000000000002"),
+        ("a1b", "a1b2c3d4-0000-4000-8000-000000000004"),
+        ("a1-", "a1-personalizado"),
+        ("tarefa", "tarefa-manual"),
+        ("3f2a9c100", None),  # hífen fora da posição canônica
+        ("ffff", None),
+        ("", None),
+    ])
+    def test_resolver_prefixo_unico(self, indice, prefixo, esperado):
+        """Um prefixo único resolve para a chave do ID; sem correspondência, None."""
+        assert indice.resolver(prefixo) == (None if esperado is None else chave_do_id(esperado))
+
+    @pytest.mark.parametrize("prefixo, total", [("3f2a", 2), ("3f", 3), ("a1", 2)])
+    def test_prefixo_ambiguo(self, indice, prefixo, total):
+        """Um prefixo que corresponde a vários IDs levanta ErroIdAmbiguo com os candidatos."""
+        with pytest.raises(ErroIdAmbiguo) as erro:
+            indice.resolver(prefixo)
+        assert erro.value.total == total
+        assert all(candidato.startswith(prefixo) for candidato in erro.value.candidatos)
+        assert "é ambíguo" in str(erro.value)
+
+    def test_adicionar_e_remover(self, indice):
+        """O índice acompanha inclusões e remoções."""
+        indice.remover(chave_do_id(self.IDS[0]))
+        assert indice.resolver("3f2a") == chave_do_id(self.IDS[1])
+        indice.adicionar("3f2a-outro")
+        with pytest.raises(ErroIdAmbiguo):
+            indice.resolver("3f2a")
+        assert len(indice) == 6
+
+
+def test_ordinal_da_data():
+    """Aceita texto YYYY-MM-DD ou date e rejeita outros formatos."""
+    assert ordinal_da_data("2025-01-01") == ordinal_da_data(date(2025, 1, 1))
+    for invalida in ("01/01/2025", "20250105", "2025-01-05T00:00", None):
+        with pytest.raises(ValueError, match="Data inválida"):
+            ordinal_da_data(invalida)
+
+
+def test_observador_da_tarefa():
+    """A Tarefa avisa o observador quando o status ou a data mudam; cópias não o herdam."""
+    tarefa = Tarefa("Observada", "2025-01-01")
+    avisos = []
+    tarefa._observador = lambda t, atributo: avisos.append((t, atributo))
+    tarefa.marcar_como_concluida()
+    tarefa.data_vencimento = "2025-02-01"
+    assert avisos == [(tarefa, "concluida"), (tarefa, "data_vencimento")]
+    assert tarefa.vencimento_ordinal == ordinal("2025-02-01")
+
+    copia = copy.copy(tarefa)
+    assert copia._observador is None
+    assert copia.to_dict() == tarefa.to_dict()
@@ -247,4 +247,305 @@ def test_isolamento_de_dados_com_argumento_cli():
     # Verifica o conteúdo do arquivo_b
     saida_b = executar_comando(['2'], arquivo_json=arquivo_b)
     assert "Tarefa B" in saida_b
-    assert "Tarefa A" not in saida_b
\ No newline at end of file
+    assert "Tarefa A" not in saida_b
+
+
+def test_armazenamento_sqlite_pela_extensao():
+    """
+    Verifica que um arquivo com extensão .db é persistido em SQLite e que as
+    tarefas sobrevivem entre execuções.
+    """
+    arquivo_db = 'tarefas_integracao.db'
+    arquivos_temporarios_a_limpar.append(arquivo_db)
+
+    executar_comando(['1', 'Tarefa no SQLite', ''], arquivo_json=arquivo_db)
+    saida = executar_comando(['2'], arquivo_json=arquivo_db)
+    assert "Tarefa no SQLite" in saida
+
+    with open(arquivo_db, 'rb') as f:
+        assert f.read(16) == b"SQLite format 3\x00"
+
+
+def test_migrar_json_para_sqlite_via_cli():
+    """
+    Verifica que a opção --migrar converte um arquivo JSON existente para SQLite.
+    """
+    arquivo_db = 'tarefas_migradas.db'
+    arquivos_temporarios_a_limpar.append(arquivo_db)
+    executar_comando(['1', 'Tarefa Migrada', '2025-07-07'])
+
+    caminho_main = os.path.join(os.path.dirname(__file__), '..', 'main.py')
+    env = os.environ.copy()
+    env['PYTHONIOENCODING'] = 'utf-8'
+    processo = subprocess.run(
+        [sys.executable, caminho_main, ARQUIVO_JSON_INTEGRACAO, '--migrar', arquivo_db],
+        capture_output=True, text=True, encoding='utf-8', env=env, timeout=10
+    )
+    assert "1 tarefa(s) migrada(s)" in processo.stdout
+
+    saida = executar_comando(['2'], arquivo_json=arquivo_db)
+    assert "Tarefa Migrada" in saida
+    assert "Vencimento: 2025-07-07" in saida
+
+
+def test_visualizar_tarefas_paginadas():
+    """
+    Verifica que a visualização mostra 20 tarefas por página e só continua
+    quando o usuário pede a próxima página.
+    """
+    comandos = []
+    for i in range(25):
+        comandos.extend(["1", f"Tarefa paginada {i}", ""])
+    executar_comando(comandos)
+
+    saida_primeira_pagina = executar_comando(["2", "q"])
+    assert saida_primeira_pagina.count("ID: ") == 20
+    assert "Pressione Enter para ver mais tarefas" in saida_primeira_pagina
+
+    saida_completa = executar_comando(["2", ""])
+    assert saida_completa.count("ID: ") == 25
+    assert saida_completa.count("Pressione Enter para ver mais tarefas") == 1
+    assert "Tarefa paginada 24" in saida_completa
+
+
+def test_paginacao_pede_uma_pagina_por_vez(tmp_path, monkeypatch, capsys):
+    """
+    Verifica que a visualização paginada pede ao gerenciador só a página exibida,
+    com deslocamento e limite, em vez de copiar as chaves de todas as tarefas.
+    """
+    import main
+    from gerenciador_tarefas.logica import GerenciadorDeTarefas
+
+    gerenciador = GerenciadorDeTarefas(arquivo_json=str(tmp_path / "paginas.json"))
+    with gerenciador.lote():
+        for i in range(45):
+            gerenciador.adicionar_tarefa(f"Tarefa {i}")
+    pedidos = []
+    iterar_original = gerenciador.iterar_visualizacao
+
+    def iterar_visualizacao(**opcoes):
+        pedidos.append((opcoes["deslocamento"], opcoes["limite"]))
+        return iterar_original(**opcoes)
+
+    monkeypatch.setattr(gerenciador, "iterar_visualizacao", iterar_visualizacao)
+    monkeypatch.setattr("builtins.input", lambda mensagem: "")
+    capsys.readouterr()
+    main.exibir_tarefas_paginadas(gerenciador)
+    assert capsys.readouterr().out.count("ID: ") == 45
+    tamanho = main.TAMANHO_PAGINA
+    assert pedidos == [(0, tamanho), (tamanho, tamanho), (2 * tamanho, tamanho), (3 * tamanho, tamanho)]
+
+
+def test_menu_lista_sair_por_ultimo(capsys):
+    """
+    Verifica que o menu mostra a busca antes de Sair, mantendo os números das opções.
+    """
+    import main
+
+    main.exibir_menu()
+    opcoes = [linha for linha in capsys.readouterr().out.splitlines() if linha[:1].isdigit()]
+    assert opcoes[-2:] == ["6. Buscar Tarefas", "5. Sair"]
+
+
+def test_buscar_tarefas_via_cli():
+    """
+    Verifica a opção de busca: ignora acentos e maiúsculas, aceita OU e prefixos.
+    """
+    comandos = [
+        "1", "Revisar relatório mensal", "",
+        "1", "Comprar café", "",
+        "1", "Enviar Relatorio anual", "",
+    ]
+    executar_comando(comandos)
+
+    saida = executar_comando(["6", "RELATORIO"])
+    assert "Revisar relatório mensal" in saida
+    assert "Enviar Relatorio anual" in saida
+    assert "Comprar café" not in saida
+
+    saida = executar_comando(["6", "rel* mens*"])
+    assert "Revisar relatório mensal" in saida
+    assert "Enviar Relatorio anual" not in saida
+
+    saida = executar_comando(["6", "cafe OU anual"])
+    assert "Comprar café" in saida
+    assert "Enviar Relatorio anual" in saida
+    assert "Revisar relatório mensal" not in saida
+
+    saida = executar_comando(["6", "inexistente"])
+    assert "Nenhuma tarefa encontrada para a busca." in saida
+
+
+def test_marcar_e_remover_com_id_abreviado_via_cli():
+    """
+    Verifica que as opções 3 e 4 aceitam apenas o início do ID da tarefa.
+    """
+    executar_comando(["1", "Tarefa com ID abreviado", ""])
+    with open(ARQUIVO_JSON_INTEGRACAO, "r", encoding="utf-8") as f:
+        id_tarefa = json.load(f)[0]["id"]
+
+    saida = executar_comando(["3", id_tarefa[:8]])
+    assert "Tarefa 'Tarefa com ID abreviado' marcada como concluída." in saida
+
+    saida = executar_comando(["4", id_tarefa[:8]])
+    assert "Tarefa 'Tarefa com ID abreviado' removida com sucesso." in saida
+
+
+def executar_argumentos(argumentos, entrada=None):
+    """
+    Executa o main.py com argumentos de linha de comando (sem o menu interativo).
+    """
+    caminho_main = os.path.join(os.path.dirname(__file__), '..', 'main.py')
+    env = os.environ.copy()
+    env['PYTHONIOENCODING'] = 'utf-8'
+    return subprocess.run(
+        [sys.executable, caminho_main] + argumentos,
+        input=entrada,
+        capture_output=True,
+        text=True,
+        encoding='utf-8',
+        env=env,
+        timeout=10
+    )
+
+
+def test_subcomandos_add_list_done_rm():
+    """
+    Verifica os subcomandos não interativos e seus códigos de saída.
+    """
+    processo = executar_argumentos([ARQUIVO_JSON_INTEGRACAO, "add", "Tarefa por subcomando", "--vencimento", "2025-09-09"])
+    assert processo.returncode == 0
+    assert "Tarefa 'Tarefa por subcomando' adicionada com sucesso." in processo.stdout
+    with open(ARQUIVO_JSON_INTEGRACAO, "r", encoding="utf-8") as f:
+        id_tarefa = json.load(f)[0]["id"]
+
+    processo = executar_argumentos([ARQUIVO_JSON_INTEGRACAO, "done", id_tarefa[:8]])
+    assert processo.returncode == 0
+    processo = executar_argumentos([ARQUIVO_JSON_INTEGRACAO, "list", "--status", "concluidas"])
+    assert f"ID: {id_tarefa} | Descrição: Tarefa por subcomando, Vencimento: 2025-09-09 | Status: Concluída" in processo.stdout
+    assert "Escolha uma opção" not in processo.stdout
+
+    processo = executar_argumentos([ARQUIVO_JSON_INTEGRACAO, "rm", id_tarefa])
+    assert processo.returncode == 0
+    processo = executar_argumentos([ARQUIVO_JSON_INTEGRACAO, "rm", id_tarefa])
+    assert processo.returncode == 1
+    assert "não encontrada para remoção" in processo.stdout
+
+
+def test_lote_de_comandos_em_arquivo_texto_e_ndjson(tmp_path):
+    """
+    Verifica o modo --batch com linhas em texto e NDJSON, incluindo uma linha inválida.
+    """
+    arquivo_lote = tmp_path / "comandos.txt"
+    arquivo_lote.write_text("\n".join([
+        '# tarefas da semana',
+        'add "Comprar pão" --vencimento 2025-03-01',
+        '{"comando": "add", "descricao": "Lavar o carro"}',
+        '',
+        'comando-desconhecido',
+        '{"comando": "list", "status": "pendentes"}',
+    ]) + "\n", encoding="utf-8")
+
+    processo = executar_argumentos([ARQUIVO_JSON_INTEGRACAO, "--batch", str(arquivo_lote)])
+    assert processo.returncode == 1
+    assert "Erro na linha 5 do lote: comando inválido: comando-desconhecido" in processo.stdout
+    assert "Descrição: Comprar pão, Vencimento: 2025-03-01 | Status: Pendente" in processo.stdout
+    with open(ARQUIVO_JSON_INTEGRACAO, "r", encoding="utf-8") as f:
+        assert [t["descricao"] for t in json.load(f)] == ["Comprar pão", "Lavar o carro"]
+
+
+def test_lote_de_comandos_pela_entrada_padrao():
+    """
+    Verifica o modo --batch lendo os comandos da entrada padrão.
+    """
+    executar_argumentos([ARQUIVO_JSON_INTEGRACAO, "add", "Primeira"])
+    with open(ARQUIVO_JSON_INTEGRACAO, "r", encoding="utf-8") as f:
+        id_tarefa = json.load(f)[0]["id"]
+
+    entrada = f'{{"comando": "done", "id": "{id_tarefa}"}}\nadd Segunda\n'
+    processo = executar_argumentos([ARQUIVO_JSON_INTEGRACAO, "--batch", "-"], entrada=entrada)
+    assert processo.returncode == 0
+    with open(ARQUIVO_JSON_INTEGRACAO, "r", encoding="utf-8") as f:
+        assert [(t["descricao"], t["concluida"]) for t in json.load(f)] == [("Primeira", True), ("Segunda", False)]
+
+
+def test_lote_carrega_e_grava_uma_unica_vez(tmp_path, monkeypatch):
+    """
+    Verifica que um lote com vários comandos resulta em uma única gravação.
+    """
+    import main
+    from gerenciador_tarefas.logica import GerenciadorDeTarefas
+
+    gerenciador = GerenciadorDeTarefas(arquivo_json=str(tmp_path / "lote.json"))
+    gravacoes = []
+    registrar_original = gerenciador._armazenamento.registrar
+    monkeypatch.setattr(gerenciador._armazenamento, "registrar",
+                        lambda alteracoes, tarefas, alteradas=None:
+                        gravacoes.append(len(alteracoes)) or registrar_original(alteracoes, tarefas, alteradas))
+
+    falhas = main.executar_lote(gerenciador, [f"add 'Tarefa {i}'" for i in range(50)] + ["list"])
+    assert falhas == 0
+    assert gravacoes == [50]
+
+
+def test_exportar_e_importar_via_cli(tmp_path):
+    """
+    Verifica os subcomandos import e export.
+    """
+    executar_argumentos([ARQUIVO_JSON_INTEGRACAO, "add", "Tarefa exportada"])
+    arquivo_csv = str(tmp_path / "tarefas.csv")
+    processo = executar_argumentos([ARQUIVO_JSON_INTEGRACAO, "export", arquivo_csv])
+    assert "1 tarefa(s) exportada(s)" in processo.stdout
+
+    outro_json = str(tmp_path / "outro.json")
+    processo = executar_argumentos([outro_json, "import", arquivo_csv])
+    assert processo.returncode == 0
+    assert "1 tarefa(s) importada(s)" in processo.stdout
+    assert "registros/s" in processo.stdout
+    with open(outro_json, "r", encoding="utf-8") as f:
+        assert [t["descricao"] for t in json.load(f)] == ["Tarefa exportada"]
+
+
+def test_armazenamento_fragmentado_e_refragmentar_via_cli(tmp_path):
+    """
+    Verifica a migração para um diretório fragmentado, os subcomandos sobre ele e a
+    opção --refragmentar.
+    """
+    diretorio = str(tmp_path / "tarefas.d")
+    executar_comando(['1', 'Tarefa Fragmentada', '2025-07-07'])
+    processo = executar_argumentos([ARQUIVO_JSON_INTEGRACAO, "--migrar", diretorio + os.sep, "--fragmentos", "3"])
+    assert "1 tarefa(s) migrada(s)" in processo.stdout
+    assert executar_argumentos([diretorio, "add", "Segunda"]).returncode == 0
+
+    processo = executar_argumentos([diretorio, "--refragmentar", "5"])
+    assert processo.returncode == 0
+    assert "2 tarefa(s) redistribuída(s) em 5 fragmento(s)" in processo.stdout
+    with open(os.path.join(diretorio, "manifesto.json"), encoding="utf-8") as f:
+        assert json.load(f)["fragmentos"] == 5
+    processo = executar_argumentos([diretorio, "list"])
+    assert processo.stdout.index("Tarefa Fragmentada") < processo.stdout.index("Segunda")
+
+    processo = executar_argumentos([ARQUIVO_JSON_INTEGRACAO, "--refragmentar", "2"])
+    assert processo.returncode == 2
+    assert "só se aplica ao armazenamento fragmentado" in processo.stderr
+
+
+def test_subcomando_stats_e_opcao_metricas(tmp_path):
+    """
+    Verifica o subcomando stats e a opção --metricas.
+    """
+    arquivo = str(tmp_path / "tarefas.json")
+    processo = executar_argumentos([arquivo, "--metricas", "add", "Medida"])
+    assert processo.returncode == 0
+    assert "operacoes.adicionar" in processo.stdout and "gravacao.serializacao_s" in processo.stdout
+
+    processo = executar_argumentos([arquivo, "stats", "--formato", "json"])
+    assert processo.returncode == 0
+    instantaneo = json.loads(processo.stdout[processo.stdout.index("{"):])
+    assert instantaneo["contadores"]["carga.registros"] == 1
+
+    lote = tmp_path / "lote.txt"
+    lote.write_text("stats\n", encoding="utf-8")
+    processo = executar_argumentos([arquivo, "--batch", str(lote)])
+    assert processo.returncode == 1
+    assert "As métricas estão desativadas" in processo.stdout
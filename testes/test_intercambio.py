@@ -0,0 +1,126 @@
+# testes/test_intercambio.py
+
+import json
+import pytest
+from gerenciador_tarefas.intercambio import ResultadoImportacao, formato_do_caminho, validar_registros
+from gerenciador_tarefas.logica import GerenciadorDeTarefas
+
+
+@pytest.fixture
+def gerenciador(tmp_path):
+    """Gerenciador vazio com um arquivo JSON temporário."""
+    return GerenciadorDeTarefas(arquivo_json=str(tmp_path / "tarefas.json"))
+
+
+def escrever_ndjson(caminho, registros):
+    caminho.write_text("".join(json.dumps(r, ensure_ascii=False) + "\n" for r in registros), encoding="utf-8")
+
+
+class TestImportacaoExportacao:
+    """
+    Conjunto de testes para a importação e exportação em NDJSON e CSV.
+    """
+
+    @pytest.mark.parametrize("extensao", [".ndjson", ".csv"])
+    def test_exportar_e_importar_preserva_tarefas(self, gerenciador, tmp_path, extensao):
+        """Exportar e importar em outro gerenciador preserva IDs, datas, status e ordem."""
+        t1 = gerenciador.adicionar_tarefa("Relatório, com vírgula e \"aspas\"", "2025-05-05")
+        t2 = gerenciador.adicionar_tarefa("Segunda\nlinha")
+        gerenciador.marcar_tarefa_como_concluida(t2.id)
+        arquivo = tmp_path / f"exportadas{extensao}"
+        assert gerenciador.exportar(str(arquivo)) == 2
+
+        destino = GerenciadorDeTarefas(arquivo_json=str(tmp_path / "destino.json"))
+        resultado = destino.importar(str(arquivo), processos=1)
+        assert resultado[:3] == (2, 0, 0)
+        assert [t.to_dict() for t in destino.tarefas] == [t1.to_dict(), t2.to_dict()]
+
+        recarregado = GerenciadorDeTarefas(arquivo_json=str(tmp_path / "destino.json"))
+        assert len(recarregado) == 2
+
+    def test_importar_ignora_duplicadas_e_invalidas(self, gerenciador, tmp_path, capsys):
+        """IDs repetidos (no gerenciador ou no arquivo) e registros inválidos são informados e ignorados."""
+        existente = gerenciador.adicionar_tarefa("Já existente")
+        arquivo = tmp_path / "entrada.ndjson"
+        arquivo.write_text("\n".join([
+            json.dumps({"id": existente.id, "descricao": "Duplicada do gerenciador"}),
+            json.dumps({"id": "novo-1", "descricao": "Nova"}),
+            json.dumps({"id": "novo-1", "descricao": "Duplicada do arquivo"}),
+            json.dumps({"id": "novo-2", "descricao": "   "}),
+            "isto não é json",
+            "",
+            json.dumps({"descricao": "Sem ID", "concluida": True}),
+        ]) + "\n", encoding="utf-8")
+
+        resultado = gerenciador.importar(str(arquivo))
+        assert (resultado.importadas, resultado.duplicadas, resultado.invalidas) == (2, 2, 2)
+        assert [t.descricao for t in gerenciador.tarefas] == ["Já existente", "Nova", "Sem ID"]
+        saida = capsys.readouterr().out
+        assert f"Erro na linha 1 de {arquivo}: ID duplicado '{existente.id}'. Registro ignorado." in saida
+        assert f"Erro na linha 5 de {arquivo}:" in saida
+        assert "registros/s" in saida
+
+    def test_importar_ids_que_nao_sao_texto(self, gerenciador, tmp_path, capsys):
+        """IDs como listas ou objetos contam como registros inválidos; números são aceitos."""
+        arquivo = tmp_path / "ids.ndjson"
+        escrever_ndjson(arquivo, [
+            {"id": [1], "descricao": "Lista"},
+            {"id": {"a": 1}, "descricao": "Objeto"},
+            {"id": 7, "descricao": "Número"},
+        ])
+        resultado = gerenciador.importar(str(arquivo), processos=1)
+        assert (resultado.importadas, resultado.duplicadas, resultado.invalidas) == (1, 0, 2)
+        assert [t.id for t in gerenciador.tarefas] == [7]
+        saida = capsys.readouterr().out
+        assert f"Erro na linha 1 de {arquivo}:" in saida and f"Erro na linha 2 de {arquivo}:" in saida
+
+    def test_importacao_grava_uma_unica_vez(self, gerenciador, tmp_path, monkeypatch):
+        """Todas as tarefas importadas são entregues ao armazenamento de uma só vez."""
+        arquivo = tmp_path / "muitas.ndjson"
+        escrever_ndjson(arquivo, [{"descricao": f"Tarefa {i}"} for i in range(100)])
+        gravacoes = []
+        monkeypatch.setattr(gerenciador._armazenamento, "registrar",
+                            lambda alteracoes, tarefas, alteradas=None: gravacoes.append(len(alteracoes)))
+        gerenciador.importar(str(arquivo), processos=1)
+        assert gravacoes == [100]
+
+    def test_importar_csv_sem_coluna_descricao(self, gerenciador, tmp_path, capsys):
+        """Um CSV sem a coluna descricao é rejeitado sem importar nada."""
+        arquivo = tmp_path / "ruim.csv"
+        arquivo.write_text("id,titulo\n1,Algo\n", encoding="utf-8")
+        assert gerenciador.importar(str(arquivo)) is None
+        assert "não tem a coluna 'descricao'" in capsys.readouterr().out
+        assert len(gerenciador) == 0
+
+    def test_importar_arquivo_inexistente(self, gerenciador, tmp_path, capsys):
+        """Um arquivo inexistente é informado e o resultado é None."""
+        assert gerenciador.importar(str(tmp_path / "nao_existe.csv")) is None
+        assert "Erro ao importar o arquivo" in capsys.readouterr().out
+
+    def test_formato_desconhecido(self, gerenciador):
+        """Extensões desconhecidas exigem o formato explícito."""
+        with pytest.raises(ValueError, match="Formato de importação/exportação desconhecido"):
+            gerenciador.exportar("tarefas.xml")
+        assert formato_do_caminho("dados.txt", "csv") == "csv"
+        assert formato_do_caminho("DADOS.JSONL") == "ndjson"
+
+
+def test_validacao_em_pool_de_processos_preserva_a_ordem(tmp_path):
+    """Com vários blocos, a validação em processos produz o mesmo resultado, na ordem do arquivo."""
+    arquivo = tmp_path / "grande.ndjson"
+    registros = [{"id": f"id-{i}", "descricao": f"Tarefa {i}" if i % 7 else ""} for i in range(200)]
+    escrever_ndjson(arquivo, registros)
+
+    with open(arquivo, "r", encoding="utf-8", newline="") as f:
+        sequencial = [(n, t and t.to_dict(), e) for n, t, e in validar_registros(f, "ndjson", processos=1, tamanho_bloco=16)]
+    with open(arquivo, "r", encoding="utf-8", newline="") as f:
+        paralelo = [(n, t and t.to_dict(), e) for n, t, e in validar_registros(f, "ndjson", processos=2, tamanho_bloco=16)]
+
+    assert paralelo == sequencial
+    assert [n for n, _, _ in paralelo] == list(range(1, 201))
+    assert sum(e is not None for _, _, e in paralelo) == len(range(0, 200, 7))
+
+
+def test_registros_por_segundo():
+    """A vazão considera todos os registros lidos."""
+    assert ResultadoImportacao(8, 1, 1, 2.0).registros_por_segundo == 5.0
@@ -0,0 +1,88 @@
+# testes/test_json_incremental.py
+
+import io
+import json
+import tracemalloc
+import pytest
+from gerenciador_tarefas.json_incremental import ErroConteudoNaoLista, iterar_array_json
+from gerenciador_tarefas.logica import GerenciadorDeTarefas
+
+
+def decodificar(texto, tamanho_bloco=7):
+    """Decodifica o texto com blocos pequenos para exercitar as fronteiras do buffer."""
+    return list(iterar_array_json(io.StringIO(texto), tamanho_bloco=tamanho_bloco))
+
+
+class TestIterarArrayJson:
+    """
+    Conjunto de testes para o decodificador incremental de listas JSON.
+    """
+
+    @pytest.mark.parametrize("texto", [
+        "[]",
+        "  [ ]  \n",
+        '[{"a": 1}, {"b": [1, 2, {"c": "]"}]}]',
+        '[1234567890, -1.5e10, true, false, null, "texto com , e ]"]',
+        '[\n  {"descricao": "Ação com acentuação", "concluida": false}\n]\n',
+        '["' + "x" * 100 + '", {"grande": "' + "y" * 50 + '"}]',
+    ])
+    def test_equivale_a_json_loads(self, texto):
+        """Para qualquer tamanho de bloco, o resultado é o mesmo de json.loads."""
+        for tamanho_bloco in (1, 3, 7, 64):
+            assert decodificar(texto, tamanho_bloco) == json.loads(texto)
+
+    def test_numero_na_fronteira_do_bloco_nao_e_cortado(self):
+        """Um número que termina no fim do bloco não é aceito pela metade."""
+        assert decodificar("[12345, 678]", tamanho_bloco=6) == [12345, 678]
+
+    def test_gera_elementos_sob_demanda(self):
+        """Os elementos são produzidos antes de o arquivo inteiro ser lido."""
+        arquivo = io.StringIO('[{"a": 1}, {"b": 2}' + ", 3" * 1000 + "]")
+        iterador = iterar_array_json(arquivo, tamanho_bloco=16)
+        assert next(iterador) == {"a": 1}
+        assert arquivo.tell() < 100
+
+    @pytest.mark.parametrize("texto", [
+        "",
+        "isto não é json válido {",
+        '[{"descricao": "tarefa 1", "concluida": false,},]',
+        "[1, 2",
+        "[1 2]",
+        "[1,]",
+        "[1] lixo",
+    ])
+    def test_conteudo_invalido_levanta_json_decode_error(self, texto):
+        """Conteúdo malformado levanta json.JSONDecodeError, como json.load."""
+        with pytest.raises(json.JSONDecodeError):
+            decodificar(texto)
+
+    def test_conteudo_que_nao_e_lista(self):
+        """JSON válido que não é uma lista levanta ErroConteudoNaoLista."""
+        with pytest.raises(ErroConteudoNaoLista):
+            decodificar('{"erro": "isto não é uma lista de tarefas"}')
+
+
+def test_pico_de_memoria_do_carregamento_proximo_do_tamanho_final(tmp_path, capsys):
+    """
+    O carregamento não mantém o texto inteiro nem a lista de dicionários em memória:
+    o pico medido pelo tracemalloc fica próximo da memória retida pelas tarefas.
+    """
+    arquivo = tmp_path / "muitas_tarefas.json"
+    dados = [
+        {"id": f"id-{i:06d}", "descricao": f"Tarefa número {i} com uma descrição razoável",
+         "data_vencimento": "2025-12-31", "concluida": i % 2 == 0}
+        for i in range(20000)
+    ]
+    arquivo.write_text(json.dumps(dados, indent=4, ensure_ascii=False), encoding="utf-8")
+    del dados
+
+    tracemalloc.start()
+    try:
+        gerenciador = GerenciadorDeTarefas(arquivo_json=str(arquivo))
+        retido, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert len(gerenciador.tarefas) == 20000
+    print(f"memória retida: {retido} bytes, pico: {pico} bytes")
+    assert pico < 1.3 * retido
@@ -3,6 +3,7 @@
 import pytest
 import os
 import json
+from gerenciador_tarefas import armazenamento
 from gerenciador_tarefas.logica import GerenciadorDeTarefas
 from gerenciador_tarefas.tarefa import Tarefa
 
@@ -256,13 +257,14 @@ class TestGerenciadorDeTarefas:
     def test_salvar_tarefas_com_erro_io(self, monkeypatch, gerenciador_com_tarefas, capsys):
         """Testa o comportamento de _salvar_tarefas ao encontrar um IOError."""
         gerenciador, _ = gerenciador_com_tarefas
-        
-        def mock_open_raise_io_error(*args, **kwargs):
-            if args[0] == ARQUIVO_TESTE_JSON and args[1] == "w": # Apenas para escrita no arquivo de teste
-                raise IOError("Erro de escrita simulado")
-            return open(*args, **kwargs) # Chamada original para outros casos
-        
-        monkeypatch.setattr("builtins.open", mock_open_raise_io_error)
+        with open(ARQUIVO_TESTE_JSON, "r", encoding="utf-8") as f:
+            conteudo_antes = f.read()
+
+        # A gravação é atômica: o erro é simulado na troca do arquivo temporário pelo destino.
+        def mock_replace_raise_io_error(origem, destino):
+            raise IOError("Erro de escrita simulado")
+
+        monkeypatch.setattr("os.replace", mock_replace_raise_io_error)
         
         gerenciador.adicionar_tarefa("Tarefa para teste de erro IO") 
         
@@ -271,6 +273,25 @@ class TestGerenciadorDeTarefas:
         # O importante é que o erro de IO seja capturado e impresso.
         assert f"Erro de E/S ao salvar tarefas em {ARQUIVO_TESTE_JSON}: Erro de escrita simulado" in captured.out
 
+        # O arquivo original fica intacto e o temporário é removido.
+        with open(ARQUIVO_TESTE_JSON, "r", encoding="utf-8") as f:
+            assert f.read() == conteudo_antes
+        assert not [nome for nome in os.listdir(".") if nome.endswith(".tmp")]
+
+    @pytest.mark.skipif(os.name == "nt", reason="permissões POSIX")
+    def test_gravacao_preserva_permissoes(self, tmp_path):
+        """A gravação atômica mantém o modo do arquivo substituído e respeita a umask em um novo."""
+        caminho = str(tmp_path / "tarefas.json")
+        umask = os.umask(0)
+        os.umask(umask)
+        gerenciador = GerenciadorDeTarefas(arquivo_json=caminho)
+        gerenciador.adicionar_tarefa("Nova")
+        assert os.stat(caminho).st_mode & 0o777 == 0o666 & ~umask
+
+        os.chmod(caminho, 0o640)
+        gerenciador.adicionar_tarefa("Outra")
+        assert os.stat(caminho).st_mode & 0o777 == 0o640
+
     def test_carregar_tarefas_com_erro_io(self, monkeypatch, capsys):
         """Testa o comportamento de _carregar_tarefas ao encontrar um IOError."""
         arquivo_teste_io_error = "io_error_test_file_logica.json"
@@ -348,6 +369,455 @@ class TestGerenciadorDeTarefas:
         saida = capsys.readouterr().out
         assert f"Erro nos dados ao carregar uma tarefa do arquivo {arquivo_teste}" in saida
 
+    def test_indice_consistente_apos_adicionar_concluir_e_remover(self, gerenciador_com_tarefas):
+        """Testa que a lista de tarefas e o índice por ID permanecem consistentes."""
+        gerenciador, tarefas_originais = gerenciador_com_tarefas
+        gerenciador.marcar_tarefa_como_concluida(tarefas_originais[0].id)
+        gerenciador.remover_tarefa(tarefas_originais[1].id)
+        t4 = gerenciador.adicionar_tarefa("Tarefa de Teste 4")
+
+        assert [t.chave for t in gerenciador.tarefas] == list(gerenciador._indice)
+        assert all(gerenciador._indice[t.chave] is t for t in gerenciador.tarefas)
+        assert gerenciador.tarefas == [tarefas_originais[0], tarefas_originais[2], t4]
+
+    def test_indice_consistente_apos_carregar_e_limpar(self, gerenciador_com_tarefas):
+        """Testa que o índice é reconstruído ao carregar e esvaziado ao limpar."""
+        gerenciador, tarefas_originais = gerenciador_com_tarefas
+        novo_gerenciador = GerenciadorDeTarefas(arquivo_json=ARQUIVO_TESTE_JSON)
+        assert list(novo_gerenciador._indice) == [t.chave for t in tarefas_originais]
+        assert [t.chave for t in novo_gerenciador.tarefas] == list(novo_gerenciador._indice)
+
+        novo_gerenciador.limpar_todas_as_tarefas()
+        assert novo_gerenciador._indice == {}
+        assert novo_gerenciador.tarefas == []
+        assert novo_gerenciador.encontrar_tarefa_por_id(tarefas_originais[0].id) is None
+
+    def test_atribuir_lista_de_tarefas_reconstroi_indice(self, gerenciador_vazio):
+        """Testa que atribuir uma nova lista a `tarefas` mantém o índice em sincronia."""
+        t1 = Tarefa("Atribuída 1", id_tarefa="a1")
+        t2 = Tarefa("Atribuída 2", id_tarefa="a2")
+        gerenciador_vazio.tarefas = [t1, t2]
+        assert list(gerenciador_vazio._indice) == ["a1", "a2"]
+        assert gerenciador_vazio.encontrar_tarefa_por_id("a2") is t2
+
+    def test_carregar_tarefas_com_id_duplicado(self, arquivo_teste, capsys):
+        """Quando o arquivo contém IDs repetidos, apenas a primeira ocorrência é carregada."""
+        dados = [
+            {"id": "dup", "descricao": "Primeira", "data_vencimento": None, "concluida": False},
+            {"id": "dup", "descricao": "Segunda", "data_vencimento": None, "concluida": False},
+        ]
+        arquivo_teste.write_text(json.dumps(dados), encoding="utf-8")
+
+        ger = GerenciadorDeTarefas(arquivo_json=str(arquivo_teste))
+
+        assert [t.descricao for t in ger.tarefas] == ["Primeira"]
+        saida = capsys.readouterr().out
+        assert "ID duplicado 'dup'. Tarefa ignorada." in saida
+
+    def test_diario_anexa_registros_sem_reescrever_o_arquivo(self, arquivo_teste):
+        """No modo diário, cada alteração anexa uma linha e não toca o instantâneo."""
+        ger = GerenciadorDeTarefas(arquivo_json=str(arquivo_teste), usar_diario=True)
+        t1 = ger.adicionar_tarefa("Tarefa no diário 1")
+        t2 = ger.adicionar_tarefa("Tarefa no diário 2")
+        ger.marcar_tarefa_como_concluida(t1.id)
+        ger.remover_tarefa(t2.id)
+
+        assert not arquivo_teste.exists()
+        with open(ger._armazenamento.arquivo_diario, "r", encoding="utf-8") as f:
+            registros = [json.loads(linha) for linha in f]
+        assert [r["op"] for r in registros] == ["adicionar", "adicionar", "concluir", "remover"]
+        assert registros[2] == {"op": "concluir", "id": t1.id}
+
+    def test_diario_reproduzido_ao_carregar(self, arquivo_teste):
+        """O instantâneo mais o diário reconstroem o estado ao reabrir o gerenciador."""
+        ger = GerenciadorDeTarefas(arquivo_json=str(arquivo_teste), usar_diario=True)
+        t1 = ger.adicionar_tarefa("Persistida 1", "2025-05-05")
+        ger._salvar_tarefas()
+        t2 = ger.adicionar_tarefa("Persistida 2")
+        t3 = ger.adicionar_tarefa("Removida")
+        ger.marcar_tarefa_como_concluida(t2.id)
+        ger.remover_tarefa(t3.id)
+
+        recarregado = GerenciadorDeTarefas(arquivo_json=str(arquivo_teste), usar_diario=True)
+        assert [t.to_dict() for t in recarregado.tarefas] == [t1.to_dict(), t2.to_dict()]
+
+    def test_diario_reproducao_idempotente_apos_compactacao_interrompida(self, arquivo_teste):
+        """Registros já refletidos no instantâneo não duplicam tarefas ao serem reproduzidos."""
+        ger = GerenciadorDeTarefas(arquivo_json=str(arquivo_teste), usar_diario=True)
+        t1 = ger.adicionar_tarefa("Única")
+        ger.marcar_tarefa_como_concluida(t1.id)
+        with open(arquivo_teste, "w", encoding="utf-8") as f:
+            json.dump([t1.to_dict()], f)
+
+        recarregado = GerenciadorDeTarefas(arquivo_json=str(arquivo_teste), usar_diario=True)
+        assert len(recarregado.tarefas) == 1
+        assert recarregado.tarefas[0].concluida
+
+    def test_diario_ignora_linha_truncada(self, arquivo_teste, capsys):
+        """Uma última linha truncada por uma queda não impede o carregamento das anteriores."""
+        ger = GerenciadorDeTarefas(arquivo_json=str(arquivo_teste), usar_diario=True)
+        ger.adicionar_tarefa("Antes da queda")
+        with open(ger._armazenamento.arquivo_diario, "a", encoding="utf-8") as f:
+            f.write('{"op":"adicionar","tarefa":{"descr')
+
+        recarregado = GerenciadorDeTarefas(arquivo_json=str(arquivo_teste), usar_diario=True)
+        assert [t.descricao for t in recarregado.tarefas] == ["Antes da queda"]
+        assert "Registros seguintes ignorados." in capsys.readouterr().out
+
+    def test_diario_compactado_automaticamente(self, arquivo_teste, monkeypatch):
+        """Quando o diário cresce além do limite, ele vira um novo instantâneo."""
+        monkeypatch.setattr("gerenciador_tarefas.armazenamento.LIMITE_MINIMO_DIARIO", 3)
+        ger = GerenciadorDeTarefas(arquivo_json=str(arquivo_teste), usar_diario=True)
+        for i in range(4):
+            ger.adicionar_tarefa(f"Tarefa {i}")
+
+        with open(arquivo_teste, "r", encoding="utf-8") as f:
+            assert len(json.load(f)) == 4
+        with open(ger._armazenamento.arquivo_diario, "r", encoding="utf-8") as f:
+            assert f.read() == ""
+
+        # O próximo instantâneo só é gravado quando o diário supera o anterior (4 tarefas).
+        for i in range(4, 8):
+            ger.adicionar_tarefa(f"Tarefa {i}")
+        with open(arquivo_teste, "r", encoding="utf-8") as f:
+            assert len(json.load(f)) == 4
+        ger.adicionar_tarefa("Tarefa 8")
+        with open(arquivo_teste, "r", encoding="utf-8") as f:
+            assert len(json.load(f)) == 9
+        with open(ger._armazenamento.arquivo_diario, "r", encoding="utf-8") as f:
+            assert f.read() == ""
+
+    def test_lote_salva_uma_unica_vez(self, gerenciador_vazio, monkeypatch):
+        """Dentro de um lote, várias alterações resultam em uma única gravação."""
+        chamadas = []
+        armazenamento = gerenciador_vazio._armazenamento
+        salvar_original = armazenamento.salvar
+        monkeypatch.setattr(armazenamento, "salvar", lambda tarefas: chamadas.append(1) or salvar_original(tarefas))
+
+        with gerenciador_vazio.lote():
+            tarefas = [gerenciador_vazio.adicionar_tarefa(f"Lote {i}") for i in range(50)]
+            gerenciador_vazio.marcar_tarefa_como_concluida(tarefas[0].id)
+            gerenciador_vazio.remover_tarefa(tarefas[1].id)
+            assert chamadas == []
+
+        assert chamadas == [1]
+        recarregado = GerenciadorDeTarefas(arquivo_json=ARQUIVO_TESTE_JSON)
+        assert len(recarregado.tarefas) == 49
+        assert recarregado.encontrar_tarefa_por_id(tarefas[0].id).concluida
+
+    def test_lote_desfaz_alteracoes_em_caso_de_excecao(self, gerenciador_com_tarefas):
+        """Uma exceção que escapa do lote restaura o estado em memória e nada é gravado."""
+        gerenciador, tarefas_originais = gerenciador_com_tarefas
+        dicts_antes = [t.to_dict() for t in gerenciador.tarefas]
+
+        with pytest.raises(RuntimeError):
+            with gerenciador.lote():
+                gerenciador.adicionar_tarefa("Não deve sobreviver")
+                gerenciador.marcar_tarefa_como_concluida(tarefas_originais[0].id)
+                gerenciador.remover_tarefa(tarefas_originais[1].id)
+                raise RuntimeError("falha no meio do lote")
+
+        assert [t.to_dict() for t in gerenciador.tarefas] == dicts_antes
+        assert [t.chave for t in gerenciador.tarefas] == list(gerenciador._indice)
+        with open(ARQUIVO_TESTE_JSON, "r", encoding="utf-8") as f:
+            assert json.load(f) == dicts_antes
+
+    def test_lote_aninhado_grava_apenas_no_lote_externo(self, gerenciador_vazio, monkeypatch):
+        """Um lote aninhado não grava ao terminar; apenas o externo grava."""
+        chamadas = []
+        monkeypatch.setattr(gerenciador_vazio._armazenamento, "salvar", lambda tarefas: chamadas.append(1))
+
+        with gerenciador_vazio.lote():
+            with gerenciador_vazio.lote():
+                gerenciador_vazio.adicionar_tarefa("Interna")
+            assert chamadas == []
+            gerenciador_vazio.adicionar_tarefa("Externa")
+        assert chamadas == [1]
+
+    def test_lote_sem_alteracoes_nao_grava(self, gerenciador_vazio, monkeypatch):
+        """Um lote que não altera nada não provoca gravação."""
+        chamadas = []
+        monkeypatch.setattr(gerenciador_vazio._armazenamento, "salvar", lambda tarefas: chamadas.append(1))
+        with gerenciador_vazio.lote():
+            gerenciador_vazio.remover_tarefa("id-inexistente")
+        assert chamadas == []
+
+    def test_lote_com_diario_anexa_registros_de_uma_vez(self, arquivo_teste, monkeypatch):
+        """No modo diário, o lote anexa todos os registros em uma única escrita."""
+        ger = GerenciadorDeTarefas(arquivo_json=str(arquivo_teste), usar_diario=True)
+        escritas = []
+        armazenamento = ger._armazenamento
+        anexar_original = armazenamento._anexar_ao_diario
+        monkeypatch.setattr(armazenamento, "_anexar_ao_diario",
+                            lambda registros, tarefas: escritas.append(len(registros)) or anexar_original(registros, tarefas))
+
+        with ger.lote():
+            t1 = ger.adicionar_tarefa("Diário em lote 1")
+            ger.adicionar_tarefa("Diário em lote 2")
+            ger.marcar_tarefa_como_concluida(t1.id)
+
+        assert escritas == [3]
+        recarregado = GerenciadorDeTarefas(arquivo_json=str(arquivo_teste), usar_diario=True)
+        assert [t.concluida for t in recarregado.tarefas] == [True, False]
+
+    def test_salvar_nao_trunca_arquivo_se_a_serializacao_falhar(self, gerenciador_com_tarefas, monkeypatch):
+        """Uma falha no meio da gravação preserva o conteúdo anterior do arquivo."""
+        gerenciador, tarefas_originais = gerenciador_com_tarefas
+
+        def to_dict_com_falha(self):
+            raise RuntimeError("queda simulada durante a gravação")
+
+        monkeypatch.setattr(Tarefa, "to_dict", to_dict_com_falha)
+        with pytest.raises(RuntimeError):
+            gerenciador._salvar_tarefas()
+        monkeypatch.undo()
+
+        recarregado = GerenciadorDeTarefas(arquivo_json=ARQUIVO_TESTE_JSON)
+        assert [t.id for t in recarregado.tarefas] == [t.id for t in tarefas_originais]
+
+    @pytest.mark.parametrize("politica", ["sempre", "ao_fechar", "nunca"])
+    def test_politicas_de_fsync(self, arquivo_teste, monkeypatch, politica):
+        """Cada política chama fsync no momento esperado."""
+        sincronizacoes = []
+        fsync_original = os.fsync
+        monkeypatch.setattr("os.fsync", lambda fd: sincronizacoes.append(fd) or fsync_original(fd))
+
+        with GerenciadorDeTarefas(arquivo_json=str(arquivo_teste), politica_fsync=politica) as ger:
+            ger.adicionar_tarefa("Tarefa sincronizada")
+            apos_gravar = len(sincronizacoes)
+        apos_fechar = len(sincronizacoes)
+
+        assert (apos_gravar > 0) == (politica == "sempre")
+        assert (apos_fechar > apos_gravar) == (politica == "ao_fechar")
+        assert [t.descricao for t in GerenciadorDeTarefas(arquivo_json=str(arquivo_teste)).tarefas] == ["Tarefa sincronizada"]
+
+    def test_politica_de_fsync_invalida(self, arquivo_teste):
+        """Uma política desconhecida é rejeitada na construção."""
+        with pytest.raises(ValueError, match="Política de fsync inválida"):
+            GerenciadorDeTarefas(arquivo_json=str(arquivo_teste), politica_fsync="as_vezes")
+
+    def test_carregamento_preguicoso_nao_cria_tarefas_ao_carregar(self, gerenciador_com_tarefas, monkeypatch):
+        """No modo preguiçoso, nenhuma Tarefa é criada até o primeiro acesso."""
+        _, tarefas_originais = gerenciador_com_tarefas
+        criadas = []
+        from_dict_original = Tarefa.from_dict.__func__
+        monkeypatch.setattr(Tarefa, "from_dict", classmethod(lambda cls, d: criadas.append(d) or from_dict_original(cls, d)))
+
+        ger = GerenciadorDeTarefas(arquivo_json=ARQUIVO_TESTE_JSON, carregamento_preguicoso=True)
+        assert criadas == []
+
+        encontrada = ger.encontrar_tarefa_por_id(tarefas_originais[1].id)
+        assert encontrada.to_dict() == tarefas_originais[1].to_dict()
+        assert len(criadas) == 1
+        assert ger.encontrar_tarefa_por_id(tarefas_originais[1].id) is encontrada
+        assert len(criadas) == 1
+
+        assert [t.to_dict() for t in ger.tarefas] == [t.to_dict() for t in tarefas_originais]
+        assert len(criadas) == 3
+
+    def test_carregamento_preguicoso_opera_sobre_registros(self, gerenciador_com_tarefas):
+        """Concluir, remover e salvar funcionam sobre tarefas ainda não materializadas."""
+        _, tarefas_originais = gerenciador_com_tarefas
+        ger = GerenciadorDeTarefas(arquivo_json=ARQUIVO_TESTE_JSON, carregamento_preguicoso=True)
+        assert ger.marcar_tarefa_como_concluida(tarefas_originais[0].id)
+        assert ger.remover_tarefa(tarefas_originais[1].id)
+        ger.adicionar_tarefa("Nova após carregamento preguiçoso")
+
+        recarregado = GerenciadorDeTarefas(arquivo_json=ARQUIVO_TESTE_JSON)
+        assert [t.descricao for t in recarregado.tarefas] == [
+            "Tarefa de Teste 1", "Tarefa Concluída Teste", "Nova após carregamento preguiçoso",
+        ]
+        assert recarregado.tarefas[0].concluida
+
+    def test_carregamento_preguicoso_registro_invalido(self, arquivo_teste, capsys):
+        """Um registro inválido é descartado já na carga, e `len` não muda ao materializar."""
+        dados = [
+            {"id": "ok", "descricao": "Válida", "data_vencimento": None, "concluida": False},
+            {"id": "ruim", "descricao": None, "data_vencimento": None, "concluida": False},
+            {"id": "vazia", "descricao": "   ", "data_vencimento": None, "concluida": False},
+            {"id": "outra", "descricao": "Também válida", "data_vencimento": None, "concluida": True},
+        ]
+        arquivo_teste.write_text(json.dumps(dados), encoding="utf-8")
+
+        ger = GerenciadorDeTarefas(arquivo_json=str(arquivo_teste), carregamento_preguicoso=True)
+        assert capsys.readouterr().out.count("Tarefa ignorada") == 2
+        assert len(ger) == 2
+        assert all(type(valor) is dict for valor in ger._indice.values())
+        assert [t.id for t in ger.tarefas] == ["ok", "outra"]
+        assert len(ger) == 2
+        assert "Tarefa ignorada" not in capsys.readouterr().out
+        assert ger.encontrar_tarefa_por_id("ruim") is None
+
+    @pytest.mark.parametrize("limite", [armazenamento.LIMITE_LEITURA_INTEIRA, 0])
+    def test_carregamento_preguicoso_inteiro_ou_incremental(self, arquivo_teste, monkeypatch, capsys, limite):
+        """Com o arquivo decodificado de uma vez ou elemento a elemento, o resultado é o mesmo."""
+        monkeypatch.setattr(armazenamento, "LIMITE_LEITURA_INTEIRA", limite)
+        dados = [
+            {"id": "a", "descricao": "Primeira", "data_vencimento": None, "concluida": False},
+            {"id": "a", "descricao": "Repetida", "data_vencimento": None, "concluida": False},
+            {"id": "b", "descricao": "Segunda", "data_vencimento": "2025-01-02", "concluida": True},
+        ]
+        arquivo_teste.write_text(json.dumps(dados), encoding="utf-8")
+        ger = GerenciadorDeTarefas(arquivo_json=str(arquivo_teste), carregamento_preguicoso=True)
+        assert [t.descricao for t in ger.tarefas] == ["Primeira", "Segunda"]
+        assert "ID duplicado 'a'" in capsys.readouterr().out
+
+        arquivo_teste.write_text('{"tarefas": []}', encoding="utf-8")
+        ger = GerenciadorDeTarefas(arquivo_json=str(arquivo_teste), carregamento_preguicoso=True)
+        assert len(ger) == 0
+        assert "não é uma lista JSON válida" in capsys.readouterr().out
+
+    def test_iterar_visualizacao_com_deslocamento_e_limite(self, gerenciador_vazio):
+        """O iterador pagina as tarefas filtradas na ordem de inserção."""
+        with gerenciador_vazio.lote():
+            tarefas = [gerenciador_vazio.adicionar_tarefa(f"Página {i}") for i in range(10)]
+            for tarefa in tarefas[::2]:
+                gerenciador_vazio.marcar_tarefa_como_concluida(tarefa.id)
+
+        assert list(gerenciador_vazio.iterar_visualizacao(deslocamento=3, limite=4)) == [str(t) for t in tarefas[3:7]]
+        assert list(gerenciador_vazio.iterar_visualizacao(mostrar_concluidas=False, deslocamento=1, limite=2)) == [
+            str(tarefas[3]), str(tarefas[5]),
+        ]
+        assert list(gerenciador_vazio.iterar_visualizacao(deslocamento=20)) == []
+        assert len(gerenciador_vazio) == 10
+
+    def test_iterar_visualizacao_nao_formata_alem_da_pagina(self, gerenciador_com_tarefas, monkeypatch):
+        """Consumir a primeira página não formata nem materializa as tarefas seguintes."""
+        _, tarefas_originais = gerenciador_com_tarefas
+        ger = GerenciadorDeTarefas(arquivo_json=ARQUIVO_TESTE_JSON, carregamento_preguicoso=True)
+        formatadas = []
+        str_original = Tarefa.__str__
+        monkeypatch.setattr(Tarefa, "__str__", lambda self: formatadas.append(self.id) or str_original(self))
+
+        iterador = ger.iterar_visualizacao(limite=1)
+        assert next(iterador) == str_original(tarefas_originais[0])
+        assert formatadas == [tarefas_originais[0].id]
+        assert sum(type(valor) is dict for valor in ger._indice.values()) == 2
+
+    def test_iterar_visualizacao_nao_formata_o_deslocamento(self, gerenciador_vazio, monkeypatch):
+        """As tarefas puladas pelo deslocamento não são formatadas."""
+        with gerenciador_vazio.lote():
+            tarefas = [gerenciador_vazio.adicionar_tarefa(f"Página {i}") for i in range(10)]
+        formatadas = []
+        str_original = Tarefa.__str__
+        monkeypatch.setattr(Tarefa, "__str__", lambda self: formatadas.append(self.id) or str_original(self))
+
+        assert list(gerenciador_vazio.iterar_visualizacao(deslocamento=7, limite=2)) == [
+            str_original(tarefas[7]), str_original(tarefas[8]),
+        ]
+        assert formatadas == [tarefas[7].id, tarefas[8].id]
+
+    def test_visualizacao_por_status_na_ordem_de_insercao(self, gerenciador_vazio):
+        """Filtrar por um status mantém a ordem de inserção, e não a ordem de conclusão."""
+        a, b, c = (gerenciador_vazio.adicionar_tarefa(descricao) for descricao in ("A", "B", "C"))
+        gerenciador_vazio.marcar_tarefa_como_concluida(c.id)
+        gerenciador_vazio.marcar_tarefa_como_concluida(a.id)
+
+        assert gerenciador_vazio.visualizar_tarefas(mostrar_pendentes=False) == [str(a), str(c)]
+        assert gerenciador_vazio.tarefas_por_status(True) == [a, c]
+        assert gerenciador_vazio.visualizar_tarefas(mostrar_concluidas=False) == [str(b)]
+
+    def test_consultas_por_status_e_vencimento(self, gerenciador_com_tarefas):
+        """As consultas pelos índices secundários retornam as mesmas tarefas que uma varredura."""
+        gerenciador, (t1, t2, t3) = gerenciador_com_tarefas
+        t4 = gerenciador.adicionar_tarefa("Tarefa de Teste 4", "2024-01-15")
+
+        assert gerenciador.tarefas_por_status(False) == [t1, t2, t4]
+        assert gerenciador.tarefas_por_status(True) == [t3]
+        assert gerenciador.tarefas_com_vencimento_entre() == [t1, t4, t3]
+        assert gerenciador.tarefas_com_vencimento_entre("2024-01-15", "2024-02-01") == [t4, t3]
+        assert gerenciador.tarefas_com_vencimento_entre(fim="2024-02-01", concluida=True) == [t3]
+        assert gerenciador.tarefas_atrasadas(hoje="2024-01-15") == [t1]
+        with pytest.raises(ValueError):
+            gerenciador.tarefas_com_vencimento_entre("15/01/2024")
+
+    def test_indices_secundarios_acompanham_alteracoes(self, gerenciador_com_tarefas):
+        """Concluir, remover, alterar a tarefa diretamente e limpar mantêm os índices em dia."""
+        gerenciador, (t1, t2, t3) = gerenciador_com_tarefas
+        gerenciador.marcar_tarefa_como_concluida(t1.id)
+        gerenciador.remover_tarefa(t3.id)
+        t2.data_vencimento = "2023-12-31"
+        t3.marcar_como_pendente()  # já removida: não volta aos índices
+
+        assert gerenciador.tarefas_por_status(True) == [t1]
+        assert gerenciador.tarefas_por_status(False) == [t2]
+        assert gerenciador.tarefas_com_vencimento_entre() == [t2, t1]
+
+        gerenciador.limpar_todas_as_tarefas()
+        assert gerenciador.tarefas_por_status(False) == []
+        assert gerenciador.tarefas_com_vencimento_entre() == []
+
+    def test_indices_secundarios_restaurados_ao_desfazer_lote(self, gerenciador_com_tarefas):
+        """Quando um lote é desfeito, os índices voltam ao estado anterior."""
+        gerenciador, (t1, t2, t3) = gerenciador_com_tarefas
+        with pytest.raises(RuntimeError):
+            with gerenciador.lote():
+                gerenciador.marcar_tarefa_como_concluida(t1.id)
+                gerenciador.remover_tarefa(t3.id)
+                gerenciador.adicionar_tarefa("Descartada", "2024-01-10")
+                raise RuntimeError("falha no lote")
+
+        assert gerenciador.tarefas_por_status(False) == [t1, t2]
+        assert gerenciador.tarefas_por_status(True) == [t3]
+        assert gerenciador.tarefas_com_vencimento_entre() == [t1, t3]
+
+    def test_indices_secundarios_no_carregamento_preguicoso(self, gerenciador_com_tarefas):
+        """As consultas usam os registros sem materializar as tarefas fora do resultado."""
+        _, (t1, t2, t3) = gerenciador_com_tarefas
+        ger = GerenciadorDeTarefas(arquivo_json=ARQUIVO_TESTE_JSON, carregamento_preguicoso=True)
+        assert [t.id for t in ger.tarefas_por_status(True)] == [t3.id]
+        assert [t.id for t in ger.tarefas_com_vencimento_entre(fim="2024-01-31")] == [t1.id]
+        assert type(ger._indice[t2.chave]) is dict
+
+        ger.encontrar_tarefa_por_id(t1.id).marcar_como_concluida()
+        assert [t.id for t in ger.tarefas_por_status(True)] == [t1.id, t3.id]
+
+    def test_buscar_tarefas(self, gerenciador_com_tarefas):
+        """A busca ignora acentos e é atualizada ao adicionar, remover e alterar tarefas."""
+        gerenciador, (t1, t2, t3) = gerenciador_com_tarefas
+        assert gerenciador.buscar_tarefas("teste") == [t1, t2, t3]
+        assert gerenciador.buscar_tarefas("CONCLUIDA") == [t3]
+
+        t4 = gerenciador.adicionar_tarefa("Ação de teste com acentuação")
+        gerenciador.remover_tarefa(t1.id)
+        t2.descricao = "Tarefa renomeada"
+        assert gerenciador.buscar_tarefas("teste") == [t3, t4]
+        assert gerenciador.buscar_tarefas("acao OU renomea*") == [t2, t4]
+        assert gerenciador.buscar_tarefas("") == []
+
+        gerenciador.limpar_todas_as_tarefas()
+        assert gerenciador.buscar_tarefas("teste") == []
+
+    def test_buscar_tarefas_no_carregamento_preguicoso(self, gerenciador_com_tarefas):
+        """A busca indexa os registros e só materializa as tarefas encontradas."""
+        _, (t1, t2, t3) = gerenciador_com_tarefas
+        ger = GerenciadorDeTarefas(arquivo_json=ARQUIVO_TESTE_JSON, carregamento_preguicoso=True)
+        assert [t.id for t in ger.buscar_tarefas("Concluída")] == [t3.id]
+        assert type(ger._indice[t1.chave]) is dict
+
+    def test_marcar_e_remover_com_id_abreviado(self, gerenciador_vazio, capsys):
+        """Marcar e remover aceitam o início do ID, e prefixos ambíguos são informados."""
+        t1 = gerenciador_vazio.adicionar_tarefa("Abreviada 1")
+        t2 = gerenciador_vazio.adicionar_tarefa("Abreviada 2")
+        prefixo_comum = os.path.commonprefix([t1.id, t2.id])
+        curto_t1 = t1.id[:len(prefixo_comum) + 1]
+
+        assert gerenciador_vazio.resolver_id(curto_t1) is t1
+        assert gerenciador_vazio.marcar_tarefa_como_concluida(curto_t1)
+        assert t1.concluida
+
+        # Tarefas adicionadas depois da primeira resolução também são encontradas.
+        t3 = gerenciador_vazio.adicionar_tarefa("Abreviada 3")
+        comum = max(len(os.path.commonprefix([t3.id, outro.id])) for outro in (t1, t2))
+        assert gerenciador_vazio.remover_tarefa(t3.id[:comum + 1])
+        assert gerenciador_vazio.encontrar_tarefa_por_id(t3.id) is None
+        capsys.readouterr()
+
+        gerenciador_vazio.tarefas = [Tarefa("Manual 1", id_tarefa="manual-1"), Tarefa("Manual 2", id_tarefa="manual-2")]
+        assert gerenciador_vazio.remover_tarefa("manual") is False
+        assert "Erro: O ID 'manual' é ambíguo: corresponde a 2 tarefas (manual-1, manual-2)" in capsys.readouterr().out
+        assert len(gerenciador_vazio) == 2
+
     @classmethod
     def teardown_class(cls):
         """Limpa o arquivo de teste JSON após todos os testes da classe."""
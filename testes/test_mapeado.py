@@ -0,0 +1,168 @@
+# testes/test_mapeado.py
+
+import os
+import pytest
+from gerenciador_tarefas import armazenamento as modulo_armazenamento
+from gerenciador_tarefas.armazenamento import ArmazenamentoJSON, ArmazenamentoMapeado, criar_armazenamento, migrar
+from gerenciador_tarefas.logica import GerenciadorDeTarefas
+from gerenciador_tarefas.mapeado import RegistroMapeado, caminho_do_heap, posicao_do_registro
+from gerenciador_tarefas.tarefa import Tarefa
+
+
+@pytest.fixture
+def arquivo_mapeado(tmp_path):
+    return str(tmp_path / "tarefas.mmap")
+
+
+@pytest.fixture
+def fabrica_de_armazenamento():
+    return ArmazenamentoMapeado
+
+
+def ler(caminho):
+    with open(caminho, "rb") as f:
+        return f.read()
+
+
+class TestArmazenamentoMapeado:
+    """
+    Conjunto de testes para o armazenamento de registros fixos mapeado em memória.
+    """
+
+    def test_ida_e_volta(self, arquivo_mapeado):
+        """Salvar e carregar preserva todos os campos e a ordem das tarefas."""
+        tarefas = [
+            Tarefa("Com UUID e data", "2025-12-31"),
+            Tarefa("ID personalizado", id_tarefa="manual-1", concluida=True),
+            Tarefa("Data fora do padrão", "31/12/2025"),
+            Tarefa("Acentuação: ação 😀"),
+        ]
+        armazenamento = ArmazenamentoMapeado(arquivo_mapeado)
+        armazenamento.salvar({t.chave: t for t in tarefas})
+        armazenamento.fechar()
+
+        armazenamento = ArmazenamentoMapeado(arquivo_mapeado)
+        carregadas = armazenamento.carregar()
+        armazenamento.fechar()
+        assert [t.to_dict() for t in carregadas.values()] == [t.to_dict() for t in tarefas]
+
+    def test_reabrir_e_salvar_duas_vezes(self, arquivo_mapeado):
+        """Uma instância nova continua a numeração das gerações gravada no arquivo."""
+        tarefas = [Tarefa(f"Tarefa {i}") for i in range(3)]
+        ArmazenamentoMapeado(arquivo_mapeado).salvar({t.chave: t for t in tarefas})
+        for geracao in (2, 3):
+            armazenamento = ArmazenamentoMapeado(arquivo_mapeado)
+            armazenamento.salvar({t.chave: t for t in tarefas[:geracao]})
+            armazenamento.fechar()
+            assert os.path.exists(caminho_do_heap(arquivo_mapeado, geracao))
+            assert not os.path.exists(caminho_do_heap(arquivo_mapeado, geracao - 1))
+
+        armazenamento = ArmazenamentoMapeado(arquivo_mapeado)
+        assert [t.descricao for t in armazenamento.carregar().values()] == ["Tarefa 0", "Tarefa 1", "Tarefa 2"]
+        armazenamento.fechar()
+
+    def test_concluir_altera_um_unico_byte(self, arquivo_mapeado, abrir_gerenciador):
+        """Marcar como concluída muda só o byte de estado; o heap não é tocado."""
+        with abrir_gerenciador(arquivo_mapeado) as ger:
+            ids = [ger.adicionar_tarefa(f"Tarefa {i}").id for i in range(10)]
+        heap = caminho_do_heap(arquivo_mapeado, 1)
+        registros_antes, heap_antes = ler(arquivo_mapeado), ler(heap)
+
+        with abrir_gerenciador(arquivo_mapeado) as ger:
+            assert ger.marcar_tarefa_como_concluida(ids[3])
+        registros_depois = ler(arquivo_mapeado)
+        diferencas = [i for i, (a, b) in enumerate(zip(registros_antes, registros_depois)) if a != b]
+        assert diferencas == [posicao_do_registro(3)]
+        assert len(registros_depois) == len(registros_antes)
+        assert ler(heap) == heap_antes
+
+        with abrir_gerenciador(arquivo_mapeado) as ger:
+            assert [t.concluida for t in ger.tarefas] == [i == 3 for i in range(10)]
+
+    def test_adicionar_acrescenta_e_cresce(self, arquivo_mapeado, abrir_gerenciador):
+        """Adições uma a uma acrescentam registros, crescendo o arquivo mapeado quando necessário."""
+        with abrir_gerenciador(arquivo_mapeado) as ger:
+            descricoes = [ger.adicionar_tarefa(f"Tarefa {i}", "2025-03-01").descricao for i in range(150)]
+        assert not os.path.exists(caminho_do_heap(arquivo_mapeado, 2))
+        with abrir_gerenciador(arquivo_mapeado) as ger:
+            assert [t.descricao for t in ger.tarefas] == descricoes
+            assert len(ger.tarefas_com_vencimento_entre("2025-03-01", "2025-03-01")) == 150
+
+    def test_remover_deixa_lapide_e_compacta(self, arquivo_mapeado, monkeypatch, abrir_gerenciador):
+        """Remover marca uma lápide; acima do limite, a compactação grava um heap de nova geração."""
+        monkeypatch.setattr(modulo_armazenamento, "LIMITE_MINIMO_LAPIDES", 3)
+        with abrir_gerenciador(arquivo_mapeado) as ger:
+            ids = [ger.adicionar_tarefa(f"Tarefa {i}").id for i in range(6)]
+        tamanho_antes = len(ler(arquivo_mapeado))
+
+        with abrir_gerenciador(arquivo_mapeado) as ger:
+            for id_tarefa in ids[:3]:
+                ger.remover_tarefa(id_tarefa)
+            assert len(ler(arquivo_mapeado)) == tamanho_antes
+            assert os.path.exists(caminho_do_heap(arquivo_mapeado, 1))
+            ger.remover_tarefa(ids[3])
+        assert not os.path.exists(caminho_do_heap(arquivo_mapeado, 1))
+        assert os.path.exists(caminho_do_heap(arquivo_mapeado, 2))
+        assert len(ler(arquivo_mapeado)) < tamanho_antes
+
+        with abrir_gerenciador(arquivo_mapeado) as ger:
+            assert [t.id for t in ger.tarefas] == ids[4:]
+
+    def test_carregamento_preguicoso(self, arquivo_mapeado, monkeypatch, abrir_gerenciador):
+        """Os registros só viram Tarefa no primeiro acesso, mesmo depois de uma compactação."""
+        monkeypatch.setattr(modulo_armazenamento, "LIMITE_MINIMO_LAPIDES", 2)
+        with abrir_gerenciador(arquivo_mapeado) as ger:
+            tarefas = [ger.adicionar_tarefa(f"Tarefa {i}", "2025-03-01" if i % 2 else "31/03/2025") for i in range(6)]
+
+        ger = GerenciadorDeTarefas(armazenamento=ArmazenamentoMapeado(arquivo_mapeado), carregamento_preguicoso=True)
+        assert all(type(valor) is RegistroMapeado for valor in ger._indice.values())
+        assert ger.marcar_tarefa_como_concluida(tarefas[0].id)
+
+        # A compactação troca o heap; os registros ainda não materializados continuam válidos.
+        for tarefa in tarefas[1:5]:
+            ger.remover_tarefa(tarefa.id)
+        assert not os.path.exists(caminho_do_heap(arquivo_mapeado, 1))
+        assert type(ger._indice[tarefas[5].chave]) is RegistroMapeado
+        assert [t.id for t in ger.buscar_tarefas("tarefa")] == [tarefas[0].id, tarefas[5].id]
+        assert [t.id for t in ger.tarefas_com_vencimento_entre("2025-03-01", "2025-03-01")] == [tarefas[5].id]
+        assert [(t.descricao, t.data_vencimento) for t in ger.tarefas] == [
+            ("Tarefa 0", "31/03/2025"), ("Tarefa 5", "2025-03-01"),
+        ]
+        ger.fechar()
+
+        with abrir_gerenciador(arquivo_mapeado) as ger:
+            assert [(t.descricao, t.concluida) for t in ger.tarefas] == [("Tarefa 0", True), ("Tarefa 5", False)]
+
+    def test_limpar_e_adicionar_no_mesmo_lote(self, arquivo_mapeado, abrir_gerenciador):
+        """Limpar marca todas as tarefas como removidas; as adicionadas depois continuam."""
+        with abrir_gerenciador(arquivo_mapeado) as ger:
+            ger.adicionar_tarefa("Antiga")
+            with ger.lote():
+                ger.limpar_todas_as_tarefas()
+                ger.adicionar_tarefa("Nova")
+        with abrir_gerenciador(arquivo_mapeado) as ger:
+            assert [t.descricao for t in ger.tarefas] == ["Nova"]
+
+    def test_arquivo_invalido_inicia_vazio(self, arquivo_mapeado, capsys, abrir_gerenciador):
+        """Um arquivo em outro formato ou sem o heap é informado e a lista inicia vazia."""
+        with open(arquivo_mapeado, "wb") as f:
+            f.write(b"nao e um arquivo mapeado")
+        with abrir_gerenciador(arquivo_mapeado) as ger:
+            assert ger.tarefas == []
+            assert "Erro ao decodificar o arquivo mapeado" in capsys.readouterr().out
+            ger.adicionar_tarefa("Regrava o arquivo")
+
+        os.remove(caminho_do_heap(arquivo_mapeado, 1))
+        with abrir_gerenciador(arquivo_mapeado) as ger:
+            assert ger.tarefas == []
+        assert "Arquivo de descrições" in capsys.readouterr().out
+
+    def test_criar_e_migrar(self, tmp_path, arquivo_mapeado, abrir_gerenciador):
+        """A extensão .mmap seleciona o armazenamento mapeado, e a migração a partir do JSON funciona."""
+        assert isinstance(criar_armazenamento(arquivo_mapeado), ArmazenamentoMapeado)
+        origem = str(tmp_path / "tarefas.json")
+        with GerenciadorDeTarefas(arquivo_json=origem) as ger:
+            ger.adicionar_tarefa("Migrada", "2025-05-05")
+        assert migrar(ArmazenamentoJSON(origem), criar_armazenamento(arquivo_mapeado)) == 1
+        with abrir_gerenciador(arquivo_mapeado) as ger:
+            assert [t.descricao for t in ger.tarefas] == ["Migrada"]
@@ -0,0 +1,70 @@
+# testes/test_metricas.py
+
+import json
+import pytest
+from gerenciador_tarefas.armazenamento import ArmazenamentoBinario
+from gerenciador_tarefas.logica import GerenciadorDeTarefas
+from gerenciador_tarefas.metricas import Histograma, Metricas, formatar_instantaneo
+
+
+class TestMetricas:
+    """
+    Conjunto de testes para os contadores, histogramas e a instrumentação do gerenciador.
+    """
+
+    def test_histograma(self):
+        """Os percentis são o limite superior do balde, sem passar do máximo observado."""
+        histograma = Histograma()
+        for valor in [0.0] + [3.0] * 90 + [100.0] * 9:
+            histograma.observar(valor)
+        resumo = histograma.resumo()
+        assert resumo["contagem"] == 100 and resumo["minimo"] == 0.0 and resumo["maximo"] == 100.0
+        assert resumo["p50"] == 4.0 and resumo["p90"] == 4.0 and resumo["p99"] == 100.0
+        assert resumo["media"] == pytest.approx((270 + 900) / 100)
+        assert Histograma().resumo()["p99"] == 0.0
+
+    def test_sem_metricas_nada_e_embrulhado(self, tmp_path):
+        """Sem coletor, os métodos são os da classe e o armazenamento não mede nada."""
+        ger = GerenciadorDeTarefas(str(tmp_path / "tarefas.json"))
+        assert ger.metricas is None and ger._armazenamento.metricas is None
+        assert "adicionar_tarefa" not in vars(ger)
+
+    def test_operacoes_carga_e_gravacao(self, tmp_path):
+        """Operações, carga e gravação alimentam os contadores e histogramas."""
+        arquivo = tmp_path / "tarefas.json"
+        arquivo.write_text(json.dumps([
+            {"id": "a", "descricao": "Válida"}, {"id": "b", "descricao": ""},
+        ]), encoding="utf-8")
+        metricas = Metricas()
+        ger = GerenciadorDeTarefas(str(arquivo), metricas=metricas)
+        tarefa = ger.adicionar_tarefa("Nova")
+        ger.marcar_tarefa_como_concluida(tarefa.id)
+        ger.encontrar_tarefa_por_id("inexistente")
+        with ger.lote():
+            ger.adicionar_tarefa("Em lote 1")
+            ger.adicionar_tarefa("Em lote 2")
+
+        instantaneo = metricas.instantaneo()
+        contadores, histogramas = instantaneo["contadores"], instantaneo["histogramas"]
+        assert contadores["operacoes.adicionar"] == 3 and contadores["operacoes.concluir"] == 1
+        assert contadores["operacoes.encontrar"] == 1
+        assert contadores["carga.registros"] == 1 and contadores["carga.registros_ignorados"] == 1
+        assert contadores["gravacao.alteracoes"] == 4
+        # Três gravações do arquivo inteiro, a última com o tamanho atual.
+        assert arquivo.stat().st_size < contadores["gravacao.bytes"] < 3 * arquivo.stat().st_size
+        assert histogramas["gravacao.duracao_s"]["contagem"] == 3
+        assert histogramas["gravacao.serializacao_s"]["contagem"] == 3
+        assert histogramas["latencia.adicionar"]["contagem"] == 3
+        assert histogramas["carga.duracao_s"]["contagem"] == 1
+        assert any(linha.startswith("latencia.adicionar") and "ms" in linha for linha in formatar_instantaneo(instantaneo))
+
+        metricas.zerar()
+        assert metricas.instantaneo() == {"contadores": {}, "histogramas": {}}
+
+    def test_outro_armazenamento(self, tmp_path):
+        """Os armazenamentos binários também informam os bytes gravados."""
+        metricas = Metricas()
+        caminho = tmp_path / "tarefas.bin"
+        with GerenciadorDeTarefas(armazenamento=ArmazenamentoBinario(str(caminho)), metricas=metricas) as ger:
+            ger.adicionar_tarefa("Binária")
+        assert metricas.instantaneo()["contadores"]["gravacao.bytes"] == caminho.stat().st_size
@@ -0,0 +1,171 @@
+# testes/test_segmentado.py
+
+import functools
+import json
+import os
+import pytest
+from gerenciador_tarefas import eventos
+from gerenciador_tarefas.armazenamento import ArmazenamentoSegmentado, criar_armazenamento, tipo_do_caminho
+from gerenciador_tarefas.metricas import Metricas
+from gerenciador_tarefas.segmentos import diretorio_dos_segmentos
+from gerenciador_tarefas.tarefa import Tarefa
+
+
+@pytest.fixture
+def caminho(tmp_path):
+    return str(tmp_path / "tarefas.json")
+
+
+@pytest.fixture
+def fabrica_de_armazenamento():
+    return functools.partial(ArmazenamentoSegmentado, tarefas_por_segmento=10)
+
+
+def ler_manifesto(caminho):
+    with open(caminho, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def ids_dos_segmentos(caminho):
+    """Os IDs de cada segmento listado no manifesto, na ordem."""
+    resultado = []
+    for nome in ler_manifesto(caminho)["segmentos"]:
+        with open(os.path.join(diretorio_dos_segmentos(caminho), nome), encoding="utf-8") as f:
+            resultado.append([dados["id"] for dados in json.load(f)])
+    return resultado
+
+
+class TestArmazenamentoSegmentado:
+    """
+    Conjunto de testes para o armazenamento em segmentos descritos por um manifesto.
+    """
+
+    def test_ida_e_volta_preserva_ordem(self, caminho):
+        """Salvar distribui as tarefas em segmentos cheios; carregar devolve a mesma ordem."""
+        tarefas = [Tarefa(f"Tarefa {i}", "2025-12-31" if i % 3 else None) for i in range(25)]
+        tarefas += [Tarefa("ID personalizado", id_tarefa="manual-1", concluida=True), Tarefa("Data", "31/12/2025")]
+        armazenamento = ArmazenamentoSegmentado(caminho, tarefas_por_segmento=10)
+        armazenamento.salvar({t.chave: t for t in tarefas})
+
+        assert [len(ids) for ids in ids_dos_segmentos(caminho)] == [10, 10, 7]
+        assert sorted(os.listdir(diretorio_dos_segmentos(caminho))) == ler_manifesto(caminho)["segmentos"]
+        carregadas = ArmazenamentoSegmentado(caminho).carregar()
+        assert [t.to_dict() for t in carregadas.values()] == [t.to_dict() for t in tarefas]
+        assert isinstance(criar_armazenamento(caminho, "segmentado"), ArmazenamentoSegmentado)
+        # Com o manifesto gravado, o tipo é deduzido do conteúdo do arquivo.
+        assert tipo_do_caminho(caminho) == "segmentado"
+        assert tipo_do_caminho(str(os.path.join(os.path.dirname(caminho), "outro.json"))) == "json"
+
+    def test_carrega_e_converte_arquivo_antigo(self, caminho, abrir_gerenciador):
+        """Um tarefas.json com a lista de tarefas é lido e vira segmentos na primeira gravação."""
+        antigas = [Tarefa(f"Antiga {i}") for i in range(15)]
+        with open(caminho, "w", encoding="utf-8") as f:
+            json.dump([t.to_dict() for t in antigas], f, indent=4)
+
+        with abrir_gerenciador(caminho) as ger:
+            assert [t.id for t in ger.tarefas] == [t.id for t in antigas]
+            nova = ger.adicionar_tarefa("Nova")
+        assert ids_dos_segmentos(caminho) == [[t.id for t in antigas[:10]], [t.id for t in antigas[10:]] + [nova.id]]
+        with abrir_gerenciador(caminho) as ger:
+            assert [t.id for t in ger.tarefas] == [t.id for t in antigas] + [nova.id]
+
+    def test_salvar_regrava_so_segmentos_alterados(self, caminho, abrir_gerenciador):
+        """Com o acompanhamento de alterações, `_salvar_tarefas` regrava só os segmentos sujos."""
+        with abrir_gerenciador(caminho) as ger:
+            with ger.lote():
+                ids = [ger.adicionar_tarefa(f"Tarefa {i}").id for i in range(50)]
+
+        metricas = Metricas()
+        with abrir_gerenciador(caminho, opcoes_do_gerenciador={"metricas": metricas}) as ger:
+            antes = ler_manifesto(caminho)["segmentos"]
+            # Alterações por atribuição direta não passam pelo armazenamento...
+            ger.encontrar_tarefa_por_id(ids[23]).descricao = "Alterada diretamente"
+            ger.encontrar_tarefa_por_id(ids[27]).concluida = True
+            assert ler_manifesto(caminho)["segmentos"] == antes
+            # ...mas são acompanhadas e gravadas em `_salvar_tarefas`.
+            ger._salvar_tarefas()
+            depois = ler_manifesto(caminho)["segmentos"]
+            assert [a == d for a, d in zip(antes, depois)] == [True, True, False, True, True]
+            assert metricas.instantaneo()["contadores"]["gravacao.segmentos"] == 1
+            ger._salvar_tarefas()
+            assert ler_manifesto(caminho)["segmentos"] == depois
+            assert metricas.instantaneo()["contadores"]["gravacao.segmentos"] == 1
+        assert not set(antes) - set(depois) & set(os.listdir(diretorio_dos_segmentos(caminho)))
+
+        with abrir_gerenciador(caminho) as ger:
+            assert ger.encontrar_tarefa_por_id(ids[23]).descricao == "Alterada diretamente"
+            assert ger.encontrar_tarefa_por_id(ids[27]).concluida
+
+    def test_atribuicao_direta_sobrevive_a_recarga(self, caminho, abrir_gerenciador):
+        """Atribuições diretas vão junto com a próxima alteração, ou são gravadas em `fechar`."""
+        with abrir_gerenciador(caminho) as ger:
+            with ger.lote():
+                ids = [ger.adicionar_tarefa(f"Tarefa {i}").id for i in range(25)]
+            antes = ler_manifesto(caminho)["segmentos"]
+            ger.encontrar_tarefa_por_id(ids[3]).descricao = "Antes de adicionar"
+            nova = ger.adicionar_tarefa("Nova")
+            depois = ler_manifesto(caminho)["segmentos"]
+            assert [a == d for a, d in zip(antes, depois)] == [False, True, False]
+            ger.encontrar_tarefa_por_id(ids[14]).descricao = "Antes de fechar"
+
+        with abrir_gerenciador(caminho) as ger:
+            assert ger.encontrar_tarefa_por_id(ids[3]).descricao == "Antes de adicionar"
+            assert ger.encontrar_tarefa_por_id(ids[14]).descricao == "Antes de fechar"
+            assert [t.id for t in ger.tarefas] == ids + [nova.id]
+
+    def test_alteracoes_regravam_so_o_segmento_tocado(self, caminho, abrir_gerenciador):
+        """Concluir regrava o segmento da tarefa; adicionar, o último; esvaziar um segmento o retira."""
+        with abrir_gerenciador(caminho) as ger:
+            with ger.lote():
+                ids = [ger.adicionar_tarefa(f"Tarefa {i}").id for i in range(25)]
+            antes = ler_manifesto(caminho)["segmentos"]
+
+            ger.marcar_tarefa_como_concluida(ids[12])
+            depois = ler_manifesto(caminho)["segmentos"]
+            assert [a == d for a, d in zip(antes, depois)] == [True, False, True]
+
+            novas = [ger.adicionar_tarefa(f"Nova {i}").id for i in range(6)]
+            assert [len(ids_segmento) for ids_segmento in ids_dos_segmentos(caminho)] == [10, 10, 10, 1]
+            assert ler_manifesto(caminho)["segmentos"][:2] == depois[:2]
+
+            with ger.lote():
+                for id_tarefa in ids[:10]:
+                    ger.remover_tarefa(id_tarefa)
+            assert ids_dos_segmentos(caminho) == [ids[10:20], ids[20:] + novas[:5], novas[5:]]
+            assert sorted(os.listdir(diretorio_dos_segmentos(caminho))) == sorted(ler_manifesto(caminho)["segmentos"])
+
+            ger.limpar_todas_as_tarefas()
+            assert ids_dos_segmentos(caminho) == []
+
+    def test_outro_processo_gravou(self, caminho, abrir_gerenciador):
+        """Se o arquivo mudou desde a carga, a gravação regrava tudo em vez de usar segmentos velhos."""
+        with abrir_gerenciador(caminho) as ger:
+            with ger.lote():
+                ids = [ger.adicionar_tarefa(f"Tarefa {i}").id for i in range(15)]
+        primeiro = ArmazenamentoSegmentado(caminho, tarefas_por_segmento=10)
+        segundo = ArmazenamentoSegmentado(caminho, tarefas_por_segmento=10)
+        tarefas_primeiro, tarefas_segundo = primeiro.carregar(), segundo.carregar()
+
+        chave = next(iter(tarefas_primeiro))
+        del tarefas_primeiro[chave]
+        primeiro.salvar_alteradas(tarefas_primeiro, {chave})
+        tarefa = next(iter(tarefas_segundo.values()))
+        tarefa.descricao = "Do segundo"
+        segundo.salvar_alteradas(tarefas_segundo, {tarefa.chave})
+
+        carregadas = ArmazenamentoSegmentado(caminho).carregar()
+        assert [t.id for t in carregadas.values()] == ids
+        assert next(iter(carregadas.values())).descricao == "Do segundo"
+
+    def test_manifesto_invalido(self, caminho):
+        """Um manifesto inválido ou com nomes fora do diretório é recusado."""
+        buffer = eventos.NotificadorEmBuffer()
+        for conteudo in ('{"versao": 99, "proximo": 0, "segmentos": []}',
+                         '{"versao": 1, "proximo": 0, "segmentos": ["../fora.json"]}'):
+            with open(caminho, "w", encoding="utf-8") as f:
+                f.write(conteudo)
+            with eventos.usando(buffer):
+                assert ArmazenamentoSegmentado(caminho).carregar() == {}
+        assert [evento.tipo for evento in buffer.eventos] == ["carga.erro", "carga.erro"]
+        with pytest.raises(ValueError):
+            ArmazenamentoSegmentado(caminho, tarefas_por_segmento=0)
@@ -1,7 +1,37 @@
 # testes/test_tarefa.py
 
+import json
+import tracemalloc
+import uuid
 import pytest
-from gerenciador_tarefas.tarefa import Tarefa
+from gerenciador_tarefas.logica import GerenciadorDeTarefas
+from gerenciador_tarefas.tarefa import Tarefa, chave_do_id, id_da_chave
+
+
+class _TarefaComDict:
+    """Reproduz o armazenamento anterior da Tarefa: __dict__ por instância e ID/data em texto."""
+    def __init__(self, descricao, data_vencimento=None):
+        self.id = str(uuid.uuid4())
+        self.descricao = descricao
+        self.data_vencimento = data_vencimento
+        self.concluida = False
+
+
+def _bytes_por_tarefa(fabrica, quantidade=20000):
+    """
+    Mede com tracemalloc a memória retida por tarefa criada pela fábrica.
+    As datas são criadas durante a medição, como acontece ao ler um arquivo.
+    """
+    descricoes = [f"Tarefa {i}" for i in range(quantidade)]
+    tracemalloc.start()
+    try:
+        antes = tracemalloc.get_traced_memory()[0]
+        tarefas = [fabrica(descricao, "2025-12-%02d" % (i % 28 + 1)) for i, descricao in enumerate(descricoes)]
+        depois = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    assert len(tarefas) == quantidade
+    return (depois - antes) / quantidade
 
 class TestTarefa:
     """
@@ -120,4 +150,79 @@ class TestTarefa:
     def test_from_dict_com_descricao_none_levanta_erro(self):
         """Testa que from_dict com descrição None no dicionário de dados levanta ValueError."""
         with pytest.raises(ValueError, match="A descrição da tarefa deve ser uma string."): # MODIFIED
-            Tarefa.from_dict({"descricao": None, "id": "some-id"})
\ No newline at end of file
+            Tarefa.from_dict({"descricao": None, "id": "some-id"})
+
+    def test_tarefa_nao_tem_dict_por_instancia(self):
+        """A Tarefa usa __slots__ e não aceita atributos arbitrários."""
+        tarefa = Tarefa("Compacta")
+        assert not hasattr(tarefa, "__dict__")
+        with pytest.raises(AttributeError):
+            tarefa.atributo_inexistente = 1
+
+    def test_uuid_armazenado_como_inteiro(self):
+        """IDs UUID canônicos ficam guardados como inteiro e são exibidos como texto."""
+        tarefa = Tarefa("UUID compacto")
+        assert isinstance(tarefa.chave, int)
+        assert str(uuid.UUID(tarefa.id)) == tarefa.id
+        assert tarefa.id in str(tarefa)
+        assert tarefa.to_dict()["id"] == tarefa.id
+
+    @pytest.mark.parametrize("id_tarefa", [
+        "tarefa-123",
+        "1",
+        "3FA85F64-5717-4562-B3FC-2C963F66AFA6",
+        "{3fa85f64-5717-4562-b3fc-2c963f66afa6}",
+    ])
+    def test_ids_nao_canonicos_preservados(self, id_tarefa):
+        """IDs que não são UUIDs canônicos são preservados exatamente."""
+        tarefa = Tarefa("ID preservado", id_tarefa=id_tarefa)
+        assert tarefa.id == id_tarefa
+        assert Tarefa.from_dict(tarefa.to_dict()).id == id_tarefa
+        assert chave_do_id(id_tarefa) == id_tarefa
+
+    @pytest.mark.parametrize("id_tarefa", [1, 0x3FA85F6457174562B3FC2C963F66AFA6, 2.5])
+    def test_ids_que_nao_sao_texto_preservados(self, id_tarefa):
+        """IDs de outros tipos voltam iguais e não se confundem com a chave de um UUID."""
+        tarefa = Tarefa.from_dict({"id": id_tarefa, "descricao": "ID numérico"})
+        assert tarefa.id == id_tarefa and type(tarefa.id) is type(id_tarefa)
+        assert tarefa.to_dict()["id"] == id_tarefa
+        assert id_da_chave(chave_do_id(id_tarefa)) == id_tarefa
+        assert chave_do_id(id_tarefa) != Tarefa("UUID", id_tarefa=str(uuid.UUID(int=1))).chave
+
+    def test_id_inteiro_gravado_e_recarregado(self, tmp_path):
+        """Um ID inteiro de um JSON escrito à mão é gravado de volta como inteiro."""
+        caminho = tmp_path / "tarefas.json"
+        uuid_um = str(uuid.UUID(int=1))
+        caminho.write_text(json.dumps([
+            {"id": 1, "descricao": "Inteiro", "data_vencimento": None, "concluida": False},
+            {"id": uuid_um, "descricao": "UUID", "data_vencimento": None, "concluida": False},
+        ]), encoding="utf-8")
+        ger = GerenciadorDeTarefas(arquivo_json=str(caminho))
+        assert len(ger) == 2
+        ger.adicionar_tarefa("Nova")
+        ger.fechar()
+        ids = [dados["id"] for dados in json.loads(caminho.read_text(encoding="utf-8"))]
+        assert ids[:2] == [1, uuid_um]
+
+    @pytest.mark.parametrize("data_vencimento", [
+        "2025-12-31", "2024-02-29", "isso-nao-e-uma-data", "2025-13-01", "31/12/2025", 20251231, None,
+    ])
+    def test_data_vencimento_preservada(self, data_vencimento):
+        """A data de vencimento lida e serializada é igual à fornecida, seja qual for o formato."""
+        tarefa = Tarefa("Data preservada", data_vencimento)
+        assert tarefa.data_vencimento == data_vencimento
+        assert tarefa.to_dict()["data_vencimento"] == data_vencimento
+
+    def test_data_iso_armazenada_como_ordinal(self):
+        """Datas YYYY-MM-DD ficam guardadas como ordinal do dia."""
+        tarefa = Tarefa("Ordinal", "2025-01-15")
+        assert isinstance(tarefa._vencimento, int)
+        tarefa.data_vencimento = "2025-01-16"
+        assert tarefa.data_vencimento == "2025-01-16"
+
+    def test_memoria_por_tarefa_menor_que_representacao_anterior(self):
+        """Reporta os bytes por tarefa antes (com __dict__) e depois (__slots__ compacto)."""
+        antes = _bytes_por_tarefa(_TarefaComDict)
+        depois = _bytes_por_tarefa(Tarefa)
+        print(f"bytes por tarefa: antes={antes:.0f}, depois={depois:.0f}")
+        assert depois < 0.6 * antes